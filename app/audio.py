@@ -0,0 +1,147 @@
+import io
+import os
+import sys
+import math
+import wave
+import array
+import shutil
+import tempfile
+import threading
+import subprocess
+
+# Frequenzen der Benachrichtigungstöne (Hz)
+TONES = {
+    'sound1': 1000,
+    'sound2': 800,
+    'sound3': 600
+}
+
+SAMPLE_RATE = 22050
+TONE_MS = 200
+FADE_MS = 10  # Ein- und Ausblenden gegen Knackgeräusche
+VOLUME = 0.5
+
+# Externe Abspielprogramme: (Programm, Argumente, liest WAV von stdin)
+PLAYERS = (
+    ('paplay', [], True),
+    ('aplay', ['-q', '-'], True),
+    ('afplay', [], False),
+)
+
+# Längste erlaubte Abspieldauer eines externen Programms (Sekunden)
+PLAYER_TIMEOUT = 5
+
+def render_tone(frequency, duration_ms=TONE_MS, sample_rate=SAMPLE_RATE):
+    """Erzeugt einen Sinuston als WAV-Daten (16 Bit, mono)"""
+    count = sample_rate * duration_ms // 1000
+    fade = max(1, sample_rate * FADE_MS // 1000)
+    step = 2 * math.pi * frequency / sample_rate
+    amplitude = 32767 * VOLUME
+    samples = array.array('h', (
+        int(amplitude * min(1.0, i / fade, (count - i) / fade) * math.sin(step * i))
+        for i in range(count)))
+    if sys.byteorder == 'big':
+        samples.byteswap()  # WAV ist little-endian
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+class NotificationPlayer:
+    """Spielt Benachrichtigungstöne in einem Hintergrund-Thread ab
+
+    Die Töne werden beim ersten Abspielen einmalig als WAV im Speicher
+    erzeugt. Abgespielt wird unter Windows über ``winsound``, sonst über
+    ein vorhandenes Abspielprogramm (``paplay``, ``aplay``, ``afplay``);
+    gibt es keins, passiert nichts. Während ein Ton läuft, wird nur der
+    zuletzt angeforderte vorgemerkt - viele Benachrichtigungen kurz
+    hintereinander ergeben also höchstens einen weiteren Ton, und der
+    Tk-Thread wartet nie auf die Wiedergabe.
+    """
+
+    def __init__(self):
+        self._tones = None
+        self._files = {}    # Ton -> temporäre Datei (für afplay)
+        self._player = None
+        self._pending = None
+        self._cond = threading.Condition()
+        self._thread = None
+        self.stats = {'requested': 0, 'played': 0, 'coalesced': 0}
+
+    def play(self, sound_id):
+        """Merkt einen Ton zum Abspielen vor (kehrt sofort zurück)"""
+        if sound_id not in TONES:
+            sound_id = 'sound1'
+        with self._cond:
+            self.stats['requested'] += 1
+            if self._pending is not None:
+                self.stats['coalesced'] += 1
+            self._pending = sound_id
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='NotificationPlayer',
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        """Hintergrund-Thread: spielt jeweils den zuletzt angeforderten Ton"""
+        try:
+            self._tones = {sound_id: render_tone(frequency)
+                           for sound_id, frequency in TONES.items()}
+            self._player = self._find_player()
+        except Exception as e:
+            print(f"Fehler beim Vorbereiten der Benachrichtigungstöne: {e}")
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                sound_id, self._pending = self._pending, None
+            try:
+                if self._tones and self._player and self._player(sound_id):
+                    self.stats['played'] += 1
+            except Exception as e:
+                print(f"Fehler beim Abspielen des Benachrichtigungstons: {e}")
+
+    def _find_player(self):
+        """Ermittelt die Abspielfunktion für dieses System (oder None)"""
+        if sys.platform == "win32":
+            import winsound
+
+            def play_windows(sound_id):
+                # SND_MEMORY lässt sich nicht mit SND_ASYNC kombinieren - läuft
+                # aber ohnehin im Hintergrund-Thread
+                winsound.PlaySound(self._tones[sound_id], winsound.SND_MEMORY)
+                return True
+            return play_windows
+        for program, args, uses_stdin in PLAYERS:
+            path = shutil.which(program)
+            if path:
+                return lambda sound_id: self._run_player(path, args, uses_stdin, sound_id)
+        return None
+
+    def _run_player(self, path, args, uses_stdin, sound_id):
+        """Spielt einen Ton über ein externes Programm ab"""
+        data = self._tones[sound_id]
+        if uses_stdin:
+            result = subprocess.run([path] + args, input=data, timeout=PLAYER_TIMEOUT,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            result = subprocess.run([path] + args + [self._tone_file(sound_id)],
+                                    timeout=PLAYER_TIMEOUT,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+
+    def _tone_file(self, sound_id):
+        """Schreibt einen Ton einmalig in eine temporäre Datei"""
+        path = self._files.get(sound_id)
+        if path is None:
+            path = os.path.join(tempfile.gettempdir(), f"mytodo_{sound_id}.wav")
+            with open(path, 'wb') as f:
+                f.write(self._tones[sound_id])
+            self._files[sound_id] = path
+        return path
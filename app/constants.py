@@ -129,7 +129,11 @@ TRANSLATIONS = {
             'test': 'Test-Benachrichtigung',
             'volume': 'Lautstärke:',
             'enabled': 'Benachrichtigungen aktiviert',
-            'disabled': 'Benachrichtigungen deaktiviert'
+            'disabled': 'Benachrichtigungen deaktiviert',
+            'reminder': 'Erinnerung',
+            'due': 'Fällig:',
+            'snooze': 'Später erinnern',
+            'dismiss': 'OK'
         },
         'settings': {
             'title': 'Einstellungen',
@@ -203,7 +207,11 @@ TRANSLATIONS = {
             'test': 'Test notification',
             'volume': 'Volume:',
             'enabled': 'Notifications enabled',
-            'disabled': 'Notifications disabled'
+            'disabled': 'Notifications disabled',
+            'reminder': 'Reminder',
+            'due': 'Due:',
+            'snooze': 'Snooze',
+            'dismiss': 'OK'
         },
         'settings': {
             'title': 'Settings',
@@ -0,0 +1,175 @@
+"""Binäre Delta-Patches für Updates der gepackten Anwendung
+
+Ein Patch beschreibt die neue Datei als Folge von Kopier-Anweisungen
+(Bereich aus der alten Datei) und eingefügten Bytes. Er enthält die
+SHA-256-Prüfsummen von alter und neuer Datei, damit er nur auf die
+passende Version angewendet wird und das Ergebnis geprüft werden kann.
+
+Aufruf zum Erzeugen eines Patches (z.B. im Release-Workflow)::
+
+    python -m app.delta diff ALT NEU PATCH
+"""
+import sys
+import zlib
+import struct
+import hashlib
+
+MAGIC = b'MTDP1'
+
+# Blockgröße für die Suche nach übereinstimmenden Bereichen (Bytes)
+BLOCK_SIZE = 2048
+
+OP_COPY = b'C'
+OP_INSERT = b'I'
+
+_HEADER = struct.Struct('>32s32sQ')   # Alte Prüfsumme, neue Prüfsumme, neue Länge
+_COPY = struct.Struct('>QI')          # Offset in der alten Datei, Länge
+_INSERT = struct.Struct('>I')         # Länge der folgenden Bytes
+
+_MOD = 1 << 16
+
+class DeltaError(ValueError):
+    """Patch passt nicht zur Datei oder ist beschädigt"""
+
+def _weak_hash(data):
+    """Rollende Prüfsumme (nach Adler) eines Blocks"""
+    a = sum(data) % _MOD
+    b = sum((len(data) - i) * byte for i, byte in enumerate(data)) % _MOD
+    return a, b
+
+def make_patch(old, new, block_size=BLOCK_SIZE):
+    """Erzeugt einen komprimierten Patch, der ``old`` in ``new`` überführt
+
+    Die alte Datei wird in Blöcke zerlegt und über eine schwache, rollende
+    Prüfsumme indiziert (wie bei rsync). In der neuen Datei wird Byte für
+    Byte gesucht; nach einem Treffer wird direkt geprüft, ob der nächste
+    Block ebenfalls folgt, sodass unveränderte Bereiche ohne rollende
+    Suche übersprungen werden.
+    """
+    blocks = {}
+    for offset in range(0, len(old) - block_size + 1, block_size):
+        a, b = _weak_hash(old[offset:offset + block_size])
+        blocks.setdefault((b << 16) | a, offset)
+
+    ops = []
+    literal_start = 0
+
+    def emit_copy(offset, length):
+        if literal_start < pos:
+            ops.append((OP_INSERT, new[literal_start:pos]))
+        if ops and ops[-1][0] == OP_COPY and sum(ops[-1][1]) == offset:
+            ops[-1] = (OP_COPY, (ops[-1][1][0], ops[-1][1][1] + length))
+        else:
+            ops.append((OP_COPY, (offset, length)))
+
+    pos = 0
+    end = len(new)
+    a = b = None
+    while pos + block_size <= end:
+        if a is None:
+            a, b = _weak_hash(new[pos:pos + block_size])
+        offset = blocks.get((b << 16) | a)
+        if offset is not None and old[offset:offset + block_size] == new[pos:pos + block_size]:
+            # Treffer: so lange wie möglich weiter kopieren
+            length = block_size
+            while (pos + length + block_size <= end and
+                   old[offset + length:offset + length + block_size] ==
+                   new[pos + length:pos + length + block_size]):
+                length += block_size
+            emit_copy(offset, length)
+            pos += length
+            literal_start = pos
+            a = None
+            continue
+
+        # Kein Treffer: Fenster um ein Byte weiterschieben
+        out_byte = new[pos]
+        if pos + block_size < end:
+            in_byte = new[pos + block_size]
+            a = (a - out_byte + in_byte) % _MOD
+            b = (b - block_size * out_byte + a) % _MOD
+        pos += 1
+
+    pos = end
+    if literal_start < end:
+        ops.append((OP_INSERT, new[literal_start:end]))
+
+    parts = [MAGIC, _HEADER.pack(hashlib.sha256(old).digest(),
+                                 hashlib.sha256(new).digest(), len(new))]
+    for op, value in ops:
+        if op == OP_COPY:
+            parts.append(OP_COPY + _COPY.pack(*value))
+        else:
+            parts.append(OP_INSERT + _INSERT.pack(len(value)))
+            parts.append(value)
+    return zlib.compress(b''.join(parts), 9)
+
+def patch_info(patch):
+    """Gibt (alte Prüfsumme, neue Prüfsumme, neue Länge) eines Patches zurück"""
+    data = _decompress(patch)
+    return _HEADER.unpack_from(data, len(MAGIC))
+
+def apply_patch(old, patch):
+    """Wendet einen Patch an und gibt die geprüfte neue Datei zurück
+
+    Löst ``DeltaError`` aus, wenn der Patch nicht zu ``old`` passt oder
+    das Ergebnis nicht die erwartete Prüfsumme hat.
+    """
+    data = _decompress(patch)
+    old_sha256, new_sha256, new_length = _HEADER.unpack_from(data, len(MAGIC))
+    if hashlib.sha256(old).digest() != old_sha256:
+        raise DeltaError("Patch passt nicht zur installierten Version")
+
+    result = bytearray()
+    pos = len(MAGIC) + _HEADER.size
+    try:
+        while pos < len(data):
+            op = data[pos:pos + 1]
+            pos += 1
+            if op == OP_COPY:
+                offset, length = _COPY.unpack_from(data, pos)
+                pos += _COPY.size
+                if offset + length > len(old):
+                    raise DeltaError("Patch verweist auf Bereich außerhalb der Datei")
+                result += old[offset:offset + length]
+            elif op == OP_INSERT:
+                (length,) = _INSERT.unpack_from(data, pos)
+                pos += _INSERT.size
+                result += data[pos:pos + length]
+                pos += length
+            else:
+                raise DeltaError("Unbekannte Anweisung im Patch")
+    except struct.error:
+        raise DeltaError("Patch ist abgeschnitten")
+
+    if len(result) != new_length or hashlib.sha256(result).digest() != new_sha256:
+        raise DeltaError("Ergebnis des Patches stimmt nicht mit der Prüfsumme überein")
+    return bytes(result)
+
+def _decompress(patch):
+    try:
+        data = zlib.decompress(patch)
+    except zlib.error:
+        raise DeltaError("Patch ist beschädigt")
+    if not data.startswith(MAGIC) or len(data) < len(MAGIC) + _HEADER.size:
+        raise DeltaError("Keine Patch-Datei")
+    return data
+
+def main(argv):
+    """Kommandozeile: ``diff ALT NEU PATCH`` bzw. ``apply ALT PATCH NEU``"""
+    if len(argv) != 4 or argv[0] not in ('diff', 'apply'):
+        print("Aufruf: python -m app.delta diff ALT NEU PATCH | apply ALT PATCH NEU")
+        return 2
+    command, first, second, output = argv
+    with open(first, 'rb') as f:
+        old = f.read()
+    with open(second, 'rb') as f:
+        other = f.read()
+    result = make_patch(old, other) if command == 'diff' else apply_patch(old, other)
+    with open(output, 'wb') as f:
+        f.write(result)
+    print(f"{output}: {len(result)} Bytes")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,298 @@
+from bisect import bisect_right
+
+from app.gui.todo_list import (HEADER_HEIGHT, layout_entries, entry_range,
+                               section_at, toggle_collapsed)
+
+# Schriften wie in den ttk-Styles der Widget-Liste
+TEXT_FONT = ('Segoe UI', 11)
+TEXT_FONT_COMPLETED = ('Segoe UI', 11, 'overstrike')
+META_FONT = ('Segoe UI', 9)
+HEADER_FONT = ('Segoe UI', 9, 'bold')
+GLYPH_FONT = ('Segoe UI', 12)
+HANDLE_FONT = ('Segoe UI', 16, 'bold')
+
+# Ungefähre Zeichenbreite für das Kürzen langer Texte (Pixel)
+CHAR_WIDTH = 7
+
+class CanvasTodoList:
+    """Todo-Liste, deren Zeilen direkt als Canvas-Elemente gezeichnet werden
+    
+    Eine Zeile besteht nur aus wenigen Canvas-Elementen (Hintergrund,
+    Griff, Checkbox-Zeichen, Prioritätspunkt, Text, Deadline, Löschen)
+    statt aus einem Baum von ttk-Widgets mit eigenen Variablen und
+    Bindings. Gezeichnet wird wie bei der virtuellen Liste nur der
+    sichtbare Ausschnitt. Alle Elemente einer Zeile tragen den Tag
+    ``e<Index>`` und einen Rollen-Tag (z.B. ``check``), Klicks werden
+    über ``find_overlapping`` einer Zeile und Rolle zugeordnet.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.canvas = app.canvas
+        self.active = False
+        self.entries = []
+        self.offsets = [0]
+        self._header_indexes = []
+        self._drawn = set()    # Indizes der gezeichneten Einträge
+        self._width = 1
+        self._hover = None
+        self._drag = None
+        
+        for sequence, handler in (('<Button-1>', self._on_click),
+                                  ('<Double-Button-1>', self._on_double_click),
+                                  ('<B1-Motion>', self._on_drag),
+                                  ('<ButtonRelease-1>', self._on_release),
+                                  ('<Motion>', self._on_motion)):
+            self.canvas.bind(sequence, handler, add='+')
+
+    def show(self, entries):
+        """Aktiviert die gezeichnete Liste und zeigt die übergebenen Einträge an"""
+        if not self.active:
+            self.active = True
+            self.canvas.itemconfigure('todo_frame', state='hidden')
+        self.canvas.delete('crow')
+        self._drawn = set()
+        self._hover = None
+        
+        self.entries = entries
+        self.offsets, self._header_indexes = layout_entries(entries)
+        self.canvas.configure(scrollregion=(0, 0, self._width, self.offsets[-1]))
+        self.refresh()
+
+    def hide(self):
+        """Entfernt alle gezeichneten Zeilen"""
+        if not self.active:
+            return
+        self.active = False
+        self.canvas.delete('crow')
+        self._drawn = set()
+        self.entries = []
+        self.offsets = [0]
+        self._header_indexes = []
+        self.canvas.itemconfigure('todo_frame', state='normal')
+        self.canvas.configure(scrollregion=self.canvas.bbox('todo_frame'))
+
+    def resize(self, width):
+        """Zeichnet die Zeilen bei geänderter Breite neu"""
+        if width == self._width:
+            return
+        self._width = width
+        if self.active:
+            self.canvas.configure(scrollregion=(0, 0, width, self.offsets[-1]))
+            self.canvas.delete('crow')
+            self._drawn = set()
+            self.refresh()
+
+    def refresh(self):
+        """Zeichnet die Zeilen für den aktuell sichtbaren Ausschnitt"""
+        if not self.active:
+            return
+        top = self.canvas.canvasy(0)
+        first, last = entry_range(self.offsets, top, top + self.canvas.winfo_height())
+        
+        for index in [i for i in self._drawn if i < first or i >= last]:
+            self.canvas.delete(f'e{index}')
+            self._drawn.discard(index)
+        for index in range(first, last):
+            if index not in self._drawn:
+                self._draw(index)
+                self._drawn.add(index)
+        
+        self._draw_sticky(top)
+
+    def redraw(self, index):
+        """Zeichnet einen einzelnen Eintrag neu (z.B. nach dem Abhaken)"""
+        if index in self._drawn:
+            self.canvas.delete(f'e{index}')
+            self._draw(index)
+    
+    # Zeichnen
+
+    def _draw(self, index):
+        entry = self.entries[index]
+        if entry[0] == 'header':
+            self._draw_header(entry, self.offsets[index], (f'e{index}', 'crow'))
+        else:
+            self._draw_todo(entry[1], index)
+
+    def _draw_header(self, entry, y, tags):
+        """Zeichnet eine Kategorie-Kopfzeile (3 Elemente)"""
+        _, category, count, collapsed = entry
+        colors = self.app.colors
+        middle = y + HEADER_HEIGHT / 2
+        self.canvas.create_rectangle(8, y + 3, self._width - 8, y + HEADER_HEIGHT - 2,
+                                     fill=colors['bg_secondary'], outline='',
+                                     tags=tags + ('header',))
+        self.canvas.create_text(18, middle, text="▶" if collapsed else "▼",
+                                fill=colors['fg_secondary'], font=('Segoe UI', 8),
+                                tags=tags + ('expand',))
+        self.canvas.create_text(32, middle, text=f"{category} ({count})", anchor='w',
+                                fill=colors['fg'], font=HEADER_FONT,
+                                tags=tags + ('title',))
+
+    def _draw_todo(self, todo, index):
+        """Zeichnet eine Todo-Zeile (6-7 Elemente)"""
+        colors = self.app.colors
+        tags = (f'e{index}', 'crow')
+        y = self.offsets[index]
+        bottom = self.offsets[index + 1]
+        width = self._width
+        text_y = y + 20
+        
+        background = colors['bg_hover'] if index == self._hover else colors['bg']
+        self.canvas.create_rectangle(8, y + 3, width - 8, bottom - 3,
+                                     fill=background, outline='',
+                                     tags=tags + ('rowbg',))
+        self.canvas.create_text(18, text_y, text="⋮", fill=colors['fg_tertiary'],
+                                font=HANDLE_FONT, tags=tags + ('handle',))
+        self.canvas.create_text(36, text_y, text="☑" if todo.completed else "☐",
+                                fill=colors['fg'], font=GLYPH_FONT,
+                                tags=tags + ('check',))
+        
+        priority_color = {
+            '▲': colors['high_priority'],
+            '►': colors['medium_priority'],
+            '▼': colors['low_priority']
+        }.get(todo.priority, colors['medium_priority'])
+        self.canvas.create_oval(50, text_y - 4, 58, text_y + 4,
+                                fill=priority_color, outline='',
+                                tags=tags + ('priority',))
+        
+        # Einzeiliger Text, zu lange Texte werden gekürzt
+        max_chars = max(4, (width - 66 - 30) // CHAR_WIDTH)
+        text = todo.text if len(todo.text) <= max_chars else todo.text[:max_chars - 1] + "…"
+        self.canvas.create_text(66, text_y, text=text, anchor='w',
+                                fill=colors['fg_secondary'] if todo.completed else colors['fg'],
+                                font=TEXT_FONT_COMPLETED if todo.completed else TEXT_FONT,
+                                tags=tags + ('text',))
+        
+        self.canvas.create_text(width - 20, text_y, text="×",
+                                fill=colors['fg_secondary'], font=('Segoe UI', 16, 'bold'),
+                                tags=tags + ('delete',))
+        
+        if todo.deadline:
+            is_overdue = self.app._is_overdue(todo)
+            icon = "⚠️" if is_overdue else "⏰"
+            self.canvas.create_text(66, y + 42, text=f"{icon} {todo.deadline_badge}", anchor='w',
+                                    fill=colors['error'] if is_overdue else priority_color,
+                                    font=META_FONT, tags=tags + ('deadline',))
+
+    def _draw_sticky(self, top):
+        """Hält die Kopfzeile der obersten Kategorie am oberen Rand"""
+        self.canvas.delete('csticky')
+        header = section_at(self.offsets, self._header_indexes, top)
+        if header < 0 or self.offsets[header] >= top:
+            return
+        
+        # Die nächste Kopfzeile schiebt die stehende nach oben weg
+        y = top
+        position = bisect_right(self._header_indexes, header)
+        if position < len(self._header_indexes):
+            y = min(top, self.offsets[self._header_indexes[position]] - HEADER_HEIGHT)
+        self._draw_header(self.entries[header], y, ('csticky', 'crow', f's{header}'))
+        self.canvas.tag_raise('csticky')
+    
+    # Trefferermittlung und Ereignisse
+
+    def _hit(self, event):
+        """Gibt (Eintragsindex, Rolle) für die Position eines Ereignisses zurück"""
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        for item in reversed(self.canvas.find_overlapping(x, y, x, y)):
+            tags = self.canvas.gettags(item)
+            if 'crow' not in tags:
+                continue
+            index = None
+            role = None
+            for tag in tags:
+                if tag[0] in 'es' and tag[1:].isdigit():
+                    index = int(tag[1:])
+                elif tag not in ('crow', 'csticky', 'current'):
+                    role = tag
+            if index is not None:
+                return index, role
+        return None, None
+
+    def _todo_at(self, index):
+        entry = self.entries[index] if index is not None else None
+        return entry[1] if entry and entry[0] == 'todo' else None
+
+    def _on_click(self, event):
+        if not self.active:
+            return
+        index, role = self._hit(event)
+        if index is None:
+            return
+        todo = self._todo_at(index)
+        
+        if role == 'expand':
+            toggle_collapsed(self.app, self.entries[index][1])
+        elif role == 'check' and todo:
+            self.app.toggle_todo_completed(todo.id)
+            self.redraw(index)
+        elif role == 'delete' and todo:
+            if self.app.confirm_delete():
+                self.app.todo_manager.delete_by_id(todo.id)
+                self.app.reminders.update(todo.id)
+                self.app.show_all_todos()
+        elif role == 'handle' and todo:
+            self._drag = {'index': index, 'y': event.y, 'target': None}
+
+    def _on_double_click(self, event):
+        if not self.active:
+            return
+        todo = self._todo_at(self._hit(event)[0])
+        if todo:
+            self.app.edit_todo(todo.id)
+
+    def _on_motion(self, event):
+        """Hover-Effekt: Hintergrund der Zeile unter dem Mauszeiger hervorheben"""
+        if not self.active:
+            return
+        index, _ = self._hit(event)
+        if self._todo_at(index) is None:
+            index = None
+        if index == self._hover:
+            return
+        colors = self.app.colors
+        if self._hover is not None:
+            self.canvas.itemconfigure(f'e{self._hover}&&rowbg', fill=colors['bg'])
+        if index is not None:
+            self.canvas.itemconfigure(f'e{index}&&rowbg', fill=colors['bg_hover'])
+        self._hover = index
+
+    def _on_drag(self, event):
+        """Verschiebt die gezogene Zeile und markiert die Zielkategorie"""
+        if not self.active or not self._drag:
+            return
+        drag = self._drag
+        self.canvas.move(f"e{drag['index']}", 0, event.y - drag['y'])
+        drag['y'] = event.y
+        self.canvas.tag_raise(f"e{drag['index']}")
+        
+        target = section_at(self.offsets, self._header_indexes,
+                            self.canvas.canvasy(event.y))
+        if target != drag['target']:
+            colors = self.app.colors
+            if drag['target'] is not None and drag['target'] >= 0:
+                self.canvas.itemconfigure(f"e{drag['target']}&&header",
+                                          fill=colors['bg_secondary'])
+            if target >= 0:
+                self.canvas.itemconfigure(f'e{target}&&header', fill=colors['accent'])
+            drag['target'] = target
+
+    def _on_release(self, event):
+        """Legt die gezogene Zeile in der Kategorie unter dem Mauszeiger ab"""
+        if not self.active or not self._drag:
+            return
+        drag, self._drag = self._drag, None
+        todo = self._todo_at(drag['index'])
+        target = drag['target']
+        if (todo and target is not None and target >= 0 and
+                self.entries[target][1] != todo.category):
+            self.app.drop_todo(todo.id, self.entries[target][1])
+        else:
+            # Keine gültige Zielkategorie: Zeile zurücksetzen
+            if target is not None and target >= 0:
+                self.redraw(target)
+            self.redraw(drag['index'])
@@ -1126,9 +1126,8 @@ def create_settings_menu(app, parent_frame):
                      style='TVMenuItem.TLabel').pack(side=tk.RIGHT, padx=20)
         
         def change_position(pid=pos_id):
-            app.settings['window_position'] = pid
-            app.save_settings()
             app.apply_window_position(pid)
+            app.save_settings()
             app.settings_frame.destroy()
             create_settings_menu(app, parent_frame)
         
@@ -0,0 +1,38 @@
+import tkinter as tk
+from tkinter import ttk
+
+from app.constants import TRANSLATIONS
+
+def show_reminder(app, todo):
+    """Zeigt ein kleines Erinnerungsfenster für ein fälliges Todo"""
+    lang = app.settings.get('language', 'de')
+    texts = TRANSLATIONS[lang]['notifications']
+    
+    dialog, main_frame = app.create_dialog(texts['reminder'], width=320, height=170)
+    dialog.attributes('-topmost', True)
+    
+    ttk.Label(main_frame,
+             text=todo.text,
+             style='TodoText.TLabel',
+             wraplength=270).pack(anchor="w")
+    if todo.deadline:
+        ttk.Label(main_frame,
+                 text=f"{texts['due']} {todo.deadline_badge}",
+                 style='MetaText.TLabel').pack(anchor="w", pady=(6, 0))
+    
+    def snooze():
+        app.reminders.snooze(todo.id, int(app.settings.get('reminder_snooze_minutes', 10)))
+        dialog.destroy()
+    
+    # Buttons
+    button_frame = ttk.Frame(main_frame, style='Dark.TFrame')
+    button_frame.pack(fill=tk.X, side=tk.BOTTOM)
+    
+    ttk.Button(button_frame,
+              text=texts['dismiss'],
+              style='TodoButton.TButton',
+              command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+    ttk.Button(button_frame,
+              text=texts['snooze'],
+              style='TodoButton.TButton',
+              command=snooze).pack(side=tk.RIGHT, padx=5)
@@ -0,0 +1,175 @@
+import queue
+import threading
+import time
+
+from app.gui import todo_list
+
+# Wartezeit nach dem letzten Tastendruck, bevor gesucht wird (ms)
+SEARCH_DELAY_MS = 150
+
+# Ab dieser Anzahl Todos läuft die Suche in einem Hintergrund-Thread
+BACKGROUND_THRESHOLD = 2000
+
+# Abfrageintervall für Ergebnisse aus dem Hintergrund-Thread (ms)
+POLL_MS = 16
+
+# Dauer eines Frames; längere Tastendruck-Verarbeitung gilt als Ruckler (ms)
+FRAME_MS = 16
+
+# Tasten, die den Suchtext nicht verändern
+NON_EDITING_KEYS = {
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+    'Meta_L', 'Meta_R', 'Super_L', 'Super_R', 'Caps_Lock', 'Num_Lock',
+    'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next',
+    'Tab', 'Escape', 'Return', 'KP_Enter', 'Insert', 'Menu',
+}
+
+class SearchController:
+    """Suche während der Eingabe: entprellt, abbrechbar und ohne Blockieren
+    
+    Tastendrücke, die den Suchtext nicht ändern, werden ignoriert. Die
+    Suche startet erst ``delay_ms`` nach dem letzten Tastendruck; jeder
+    neue Tastendruck verwirft die geplante Suche. Bei großen Datenmengen
+    läuft die Suche in einem Hintergrund-Thread, der immer nur die
+    neueste Anfrage bearbeitet. Angezeigt wird nur das Ergebnis der
+    zuletzt gestellten Anfrage (Generationsnummer).
+    
+    Für jede Taste wird gemessen, wie lange der Tk-Thread beschäftigt war
+    (``stats``), ebenso die Zeit vom letzten Tastendruck bis zur Anzeige.
+    """
+
+    def __init__(self, app, delay_ms=None):
+        self.app = app
+        if delay_ms is None:
+            delay_ms = int(app.settings.get('search_delay_ms', SEARCH_DELAY_MS))
+        self.delay_ms = delay_ms
+        self.generation = 0
+        self._shown_generation = 0  # Generation des zuletzt angezeigten Ergebnisses
+        self._last_text = ''
+        self._job = None
+        self._poll_job = None
+        self._last_key_time = None
+        
+        # Hintergrund-Thread: nimmt jeweils nur die neueste Anfrage an
+        self._request = None
+        self._cond = threading.Condition()
+        self._results = queue.Queue()
+        self._thread = None
+        
+        self.stats = {
+            'keys': 0,            # Verarbeitete Tastendrücke
+            'max_key_ms': 0.0,    # Längste Blockade des Tk-Threads durch einen Tastendruck
+            'slow_keys': 0,       # Tastendrücke über einem Frame
+            'searches': 0,        # Tatsächlich angezeigte Suchergebnisse
+            'cancelled': 0,       # Verworfene (überholte) Anfragen
+            'last_latency_ms': None,  # Letzter Tastendruck bis Anzeige
+        }
+
+    def on_key(self, event=None):
+        """Wird bei jedem Tastendruck im Suchfeld aufgerufen"""
+        started = time.perf_counter()
+        try:
+            if event is not None and getattr(event, 'keysym', None) in NON_EDITING_KEYS:
+                return
+            text = self.app.search_entry.get().strip()
+            if text == self._last_text:
+                return  # Text unverändert (z.B. Cursor bewegt)
+            self._last_text = text
+            self._last_key_time = started
+            
+            # Geplante Suche verwerfen und neu planen
+            if self._job is not None:
+                self.app.root.after_cancel(self._job)
+                self.stats['cancelled'] += 1
+            self._job = self.app.root.after(self.delay_ms, self._start)
+        finally:
+            self._record_key((time.perf_counter() - started) * 1000)
+
+    def _record_key(self, elapsed_ms):
+        stats = self.stats
+        stats['keys'] += 1
+        stats['max_key_ms'] = max(stats['max_key_ms'], elapsed_ms)
+        if elapsed_ms > FRAME_MS:
+            stats['slow_keys'] += 1
+
+    def _start(self):
+        """Startet die Suche für den aktuellen Text"""
+        self._job = None
+        self.generation += 1
+        query = self._last_text
+        
+        if not query:
+            self.app.show_all_todos()
+            self._finish()
+            return
+        
+        if len(self.app.todo_manager.get_all()) < BACKGROUND_THRESHOLD:
+            self._show(self.generation, self.app.todo_manager.search(query))
+            return
+        
+        with self._cond:
+            if self._request is not None:
+                self.stats['cancelled'] += 1
+            self._request = (self.generation, query)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='SearchController',
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        if self._poll_job is None:
+            self._poll_job = self.app.root.after(POLL_MS, self._poll)
+
+    def _run(self):
+        """Hintergrund-Thread: bearbeitet jeweils die neueste Anfrage"""
+        while True:
+            with self._cond:
+                while self._request is None:
+                    self._cond.wait()
+                generation, query = self._request
+                self._request = None
+            try:
+                results = self.app.todo_manager.search(query)
+            except Exception as e:
+                print(f"Fehler bei der Suche: {e}")
+                results = []
+            self._results.put((generation, results))
+
+    def _poll(self):
+        """Übernimmt Ergebnisse des Hintergrund-Threads in den Tk-Thread"""
+        self._poll_job = None
+        latest = None
+        while True:
+            try:
+                latest = self._results.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            self._show(*latest)
+        if self._waiting():
+            self._poll_job = self.app.root.after(POLL_MS, self._poll)
+
+    def _waiting(self):
+        """Prüft, ob noch ein Ergebnis für die aktuelle Anfrage aussteht"""
+        with self._cond:
+            pending = self._request is not None
+        return pending or self._shown_generation < self.generation
+
+    def _show(self, generation, results):
+        """Zeigt ein Ergebnis an, sofern es zur neuesten Anfrage gehört"""
+        if generation != self.generation:
+            self.stats['cancelled'] += 1
+            return
+        todo_list.render_todos(self.app, results)
+        self.stats['searches'] += 1
+        self._finish()
+
+    def _finish(self):
+        """Misst die Zeit vom letzten Tastendruck bis zur Anzeige"""
+        self._shown_generation = self.generation
+        if self._last_key_time is not None:
+            latency = (time.perf_counter() - self._last_key_time) * 1000
+            self.stats['last_latency_ms'] = latency
+            if self.app.settings.get('debug_timing') == 'true':
+                print(f"Suche angezeigt nach {latency:.0f} ms "
+                      f"(längster Tastendruck {self.stats['max_key_ms']:.1f} ms)")
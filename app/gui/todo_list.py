@@ -1,6 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+import time
+
+# Ab dieser Anzahl Todos wird im Modus 'auto' die virtuelle Liste verwendet
+VIRTUAL_THRESHOLD = 500
+
+# Feste Zeilenhöhen der virtuellen Liste (Pixel)
+HEADER_HEIGHT = 30
+ROW_HEIGHT = 40
+ROW_HEIGHT_DEADLINE = 60
+
+# Zusätzlich aufgebauter Bereich ober- und unterhalb des sichtbaren Ausschnitts
+OVERSCAN = 200
+
+# Zeitbudget je Zeitscheibe beim schrittweisen Aufbau der Widget-Liste (ms)
+RENDER_SLICE_MS = 8
 
 def create_todo_list(app):
     """Erstellt den scrollbaren Todo-Listen-Bereich"""
@@ -9,42 +24,62 @@ def create_todo_list(app):
     app.main_frame.pack(fill=tk.BOTH, expand=True)
     
     # Scrollbarer Bereich mit dunklem Hintergrund
-    app.canvas = tk.Canvas(app.main_frame, 
+    app.canvas = tk.Canvas(app.main_frame,
                          bg=app.colors['bg'],  # Hintergrundfarbe direkt setzen
                          highlightthickness=0)
     app.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     
     # Scrollbar
-    app.scrollbar = ttk.Scrollbar(app.main_frame, 
+    app.scrollbar = ttk.Scrollbar(app.main_frame,
                                 orient=tk.VERTICAL,
                                 command=app.canvas.yview)
     
     # Frame für Todos
     app.todo_frame = ttk.Frame(app.canvas)
-    app.canvas.create_window((0, 0), 
+    app.canvas.create_window((0, 0),
                            window=app.todo_frame,
                            anchor="nw",
                            tags="todo_frame")
     
+    # Widget-Liste mit Abgleich, virtuelle und gezeichnete Liste für große
+    # Datenmengen (alle teilen sich den Canvas)
+    from app.gui.canvas_rows import CanvasTodoList
+    app.collapsed_categories = load_collapsed_categories(app)
+    app.render_scheduler = RenderScheduler(app)
+    app.widget_list = WidgetTodoList(app)
+    app.virtual_list = VirtualTodoList(app)
+    app.canvas_list = CanvasTodoList(app)
+    
     # Scrollbar Konfiguration
     def update_scrollbar(*args):
-        if app.todo_frame.winfo_height() > app.canvas.winfo_height():
+        entry_list = active_entry_list(app)
+        if entry_list:
+            visible = float(args[0]) > 0.0 or float(args[1]) < 1.0
+        else:
+            visible = app.todo_frame.winfo_height() > app.canvas.winfo_height()
+        if visible:
             app.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         else:
             app.scrollbar.pack_forget()
         app.scrollbar.set(*args)
+        # Sichtbare Zeilen der virtuellen bzw. gezeichneten Liste nachführen
+        if entry_list:
+            entry_list.refresh()
     
     app.canvas.configure(yscrollcommand=update_scrollbar)
     
     # Event Bindings
     def on_frame_configure(event=None):
         """Aktualisiert die Scroll-Region wenn sich die Größe des Inhalts ändert"""
-        app.canvas.configure(scrollregion=app.canvas.bbox("all"))
-    
+        if not active_entry_list(app):
+            app.canvas.configure(scrollregion=app.canvas.bbox("all"))
+
     def on_canvas_configure(event):
         """Passt die Breite des inneren Frames an die Canvas-Breite an"""
         if event.width > 1:  # Vermeide 1px Breite beim Start
             app.canvas.itemconfig("todo_frame", width=event.width)
+            app.virtual_list.resize(event.width)
+            app.canvas_list.resize(event.width)
     
     app.todo_frame.bind('<Configure>', on_frame_configure)
     app.canvas.bind('<Configure>', on_canvas_configure)
@@ -55,177 +90,853 @@ def create_todo_list(app):
     
     app.canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
+def select_entry_list(app, count):
+    """Wählt anhand der Einstellung 'list_mode' die zeilenbasierte Liste
+    
+    Werte: 'auto' (Standard, virtuell ab ``VIRTUAL_THRESHOLD`` Todos),
+    'widgets', 'virtual' und 'canvas'. Gibt die virtuelle bzw. gezeichnete
+    Liste zurück oder None, wenn die normale Widget-Liste verwendet werden
+    soll. Die jeweils anderen Listen werden ausgeblendet.
+    """
+    mode = app.settings.get('list_mode', 'auto')
+    if mode == 'canvas':
+        selected = app.canvas_list
+    elif mode == 'virtual' or (mode == 'auto' and count >= VIRTUAL_THRESHOLD):
+        selected = app.virtual_list
+    else:
+        selected = None
+    
+    for entry_list in (app.virtual_list, app.canvas_list):
+        if entry_list is not selected:
+            entry_list.hide()
+    if selected is not None:
+        app.widget_list.clear()
+    return selected
+
+def active_entry_list(app):
+    """Gibt die gerade angezeigte zeilenbasierte Liste zurück (oder None)"""
+    for entry_list in (app.virtual_list, app.canvas_list):
+        if entry_list.active:
+            return entry_list
+    return None
+
+def layout_entries(entries):
+    """Berechnet Startpositionen und Kopfzeilen-Indizes für Listeneinträge
+    
+    Gibt ``(offsets, header_indexes)`` zurück; ``offsets`` enthält je
+    Eintrag die Startposition und zuletzt die Gesamthöhe.
+    """
+    offsets = [0]
+    header_indexes = []
+    y = 0
+    for index, entry in enumerate(entries):
+        if entry[0] == 'header':
+            header_indexes.append(index)
+            y += HEADER_HEIGHT
+        elif entry[1].deadline:
+            y += ROW_HEIGHT_DEADLINE
+        else:
+            y += ROW_HEIGHT
+        offsets.append(y)
+    return offsets, header_indexes
+
+def entry_range(offsets, top, bottom):
+    """Gibt die Indizes der Einträge zwischen top und bottom (plus Überhang) zurück"""
+    first = max(0, bisect_right(offsets, top - OVERSCAN) - 1)
+    last = min(len(offsets) - 1, bisect_left(offsets, bottom + OVERSCAN))
+    return first, last
+
+def section_at(offsets, header_indexes, y):
+    """Gibt den Index der Kopfzeile des Abschnitts an Position y zurück (oder -1)"""
+    position = bisect_right(header_indexes, bisect_right(offsets, y) - 1) - 1
+    return header_indexes[position] if position >= 0 else -1
+
+def render_todos(app, todos):
+    """Zeigt eine einfache (gefilterte) Liste von Todos ohne Kategorien an"""
+    app.render_scheduler.cancel()
+    todos = app._sort_by(todos)
+    view = capture_view(app)
+    entry_list = select_entry_list(app, len(todos))
+    if entry_list:
+        entry_list.show([('todo', todo) for todo in todos])
+        finish_render(app, view)
+    else:
+        app.render_scheduler.run(app.widget_list.show_flat(todos),
+                                 on_done=lambda: finish_render(app, view))
+
+def group_by_category(app, todos):
+    """Gruppiert Todos nach Kategorie (unbekannte Kategorien unter 'Allgemein')"""
+    todos_by_category = {}
+    for todo in todos:
+        category = todo.category
+        if category not in app.categories:
+            category = 'Allgemein'
+        todos_by_category.setdefault(category, []).append(todo)
+    return todos_by_category
+
+def render_categories(app, todos):
+    """Zeigt die Todos gruppiert nach Kategorien an (auch leere Kategorien)
+    
+    Einziger Weg, auf dem die Kategorieansicht aufgebaut wird: Start,
+    Neuladen und alle Aktualisierungen nutzen diese Funktion. Bereits
+    angezeigte Zeilen werden dabei abgeglichen statt neu erzeugt.
+    """
+    app.render_scheduler.cancel()
+    todos_by_category = group_by_category(app, todos)
+    view = capture_view(app)
+    
+    entry_list = select_entry_list(app, len(todos))
+    if entry_list:
+        # Flache Zeilenliste aus Kopfzeilen und Todos
+        entries = []
+        for category in sorted(app.categories):
+            category_todos = todos_by_category.get(category, [])
+            collapsed = category in app.collapsed_categories
+            entries.append(('header', category, len(category_todos), collapsed))
+            if not collapsed:
+                entries.extend(('todo', todo) for todo in app._sort_by(category_todos))
+        entry_list.show(entries)
+        finish_render(app, view)
+    else:
+        # Erster Bildschirm sofort, der Rest in Zeitscheiben. Eingeklappte
+        # Kategorien erhalten nur ihre Anzahl, keine Zeilen.
+        sections = []
+        for category in sorted(app.categories):
+            category_todos = todos_by_category.get(category, [])
+            if category in app.collapsed_categories:
+                sections.append((category, (len(category_todos), None)))
+            else:
+                sections.append((category, (len(category_todos), app._sort_by(category_todos))))
+        steps = app.widget_list.show_categories(sections)
+        app.render_scheduler.run(steps, on_done=lambda: finish_render(app, view))
+
+def finish_render(app, view):
+    """Abschluss einer Aktualisierung: Ansicht wiederherstellen, Höhe anpassen"""
+    restore_view(app, view)
+    app.adjust_height()
+
+def capture_view(app):
+    """Merkt sich Scrollposition und Tastaturfokus vor einer Aktualisierung"""
+    try:
+        focus = app.root.focus_get()
+    except (KeyError, tk.TclError):
+        focus = None  # Fokus liegt in einem bereits zerstörten Widget
+    return app.canvas.canvasy(0), focus
+
+def restore_view(app, view):
+    """Stellt Scrollposition und Tastaturfokus nach einer Aktualisierung wieder her"""
+    top, focus = view
+    
+    # Neue Inhaltshöhe berechnen lassen und alte Position wiederherstellen
+    app.canvas.update_idletasks()
+    if not active_entry_list(app):
+        app.canvas.configure(scrollregion=app.canvas.bbox('todo_frame'))
+    region = app.canvas.cget('scrollregion').split()
+    height = float(region[3]) if len(region) == 4 else 0
+    if height > 0:
+        app.canvas.yview_moveto(top / height)
+    
+    if focus is not None and focus.winfo_exists() and app.root.focus_get() is not focus:
+        focus.focus_set()
+
+class RenderScheduler:
+    """Führt den Aufbau der Widget-Liste schrittweise in Zeitscheiben aus
+    
+    Die Schritte (ein Generator, ein Schritt je Zeile) für den ersten
+    Bildschirm laufen sofort, der Rest in ``after(0)``-Scheiben mit einem
+    Zeitbudget von ``RENDER_SLICE_MS``. Dazwischen verarbeitet Tk
+    Eingaben und zeichnet. Eine neue Aktualisierung bricht den laufenden
+    Aufbau über die Generationsnummer ab.
+    """
+
+    def __init__(self, app, slice_ms=RENDER_SLICE_MS):
+        self.app = app
+        self.slice_ms = slice_ms
+        self.generation = 0
+        self._job = None
+        self._steps = None
+        self._on_done = None
+        self.first_paint_ms = None  # Dauer des ersten Bildschirms der letzten Aktualisierung
+
+    def first_screen_steps(self):
+        """Anzahl der Schritte, die ungefähr einen Bildschirm füllen"""
+        height = self.app.canvas.winfo_height()
+        if height <= 1:
+            height = self.app.window_height  # Vor dem ersten Zeichnen
+        return height // ROW_HEIGHT + 2
+
+    def run(self, steps, on_done=None):
+        """Startet einen neuen Aufbau (ein laufender wird abgebrochen)"""
+        self.cancel()
+        self._steps = steps
+        self._on_done = on_done
+        started = time.perf_counter()
+        self._advance(self.first_screen_steps(), None)
+        self.first_paint_ms = (time.perf_counter() - started) * 1000
+        if self._steps is not None:
+            self._job = self.app.root.after(0, self._slice, self.generation)
+
+    def cancel(self):
+        """Bricht einen laufenden Aufbau ab"""
+        self.generation += 1
+        if self._job is not None:
+            self.app.root.after_cancel(self._job)
+            self._job = None
+        if self._steps is not None:
+            self._steps.close()
+            self._steps = None
+        self._on_done = None
+
+    @property
+    def busy(self):
+        return self._steps is not None
+
+    def _slice(self, generation):
+        self._job = None
+        if generation != self.generation or self._steps is None:
+            return  # Veralteter Aufbau
+        self._advance(None, time.perf_counter() + self.slice_ms / 1000)
+        if self._steps is not None:
+            self._job = self.app.root.after(0, self._slice, generation)
+
+    def _advance(self, count, deadline):
+        """Führt bis zu count Schritte bzw. bis zum Zeitpunkt deadline aus"""
+        try:
+            while count is None or count > 0:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                next(self._steps)
+                if count is not None:
+                    count -= 1
+        except StopIteration:
+            on_done = self._on_done
+            self._steps = None
+            self._on_done = None
+            if on_done:
+                on_done()
+        except Exception as e:
+            print(f"Fehler beim Aufbau der Todo-Liste: {e}")
+            self._steps = None
+            self._on_done = None
+
+def stable_keys(old_keys, new_keys):
+    """Gibt die Schlüssel zurück, die beim Abgleich nicht verschoben werden müssen
+    
+    Das ist die längste Teilfolge der neuen Reihenfolge, deren Elemente
+    auch in der alten Reihenfolge aufsteigend stehen (längste steigende
+    Teilfolge, O(n log n)). Alle übrigen Elemente werden verschoben.
+    """
+    old_positions = {key: index for index, key in enumerate(old_keys)}
+    keys = [key for key in new_keys if key in old_positions]
+    positions = [old_positions[key] for key in keys]
+    
+    tails = []        # Kleinstes Endelement je Teilfolgenlänge (Index in keys)
+    previous = [-1] * len(keys)
+    for index, position in enumerate(positions):
+        length = _bisect_tails(tails, positions, position)
+        if length > 0:
+            previous[index] = tails[length - 1]
+        if length == len(tails):
+            tails.append(index)
+        else:
+            tails[length] = index
+    
+    result = set()
+    index = tails[-1] if tails else -1
+    while index >= 0:
+        result.add(keys[index])
+        index = previous[index]
+    return result
+
+def _bisect_tails(tails, positions, position):
+    """Sucht die Länge der Teilfolge, die ``position`` verlängern kann"""
+    low, high = 0, len(tails)
+    while low < high:
+        middle = (low + high) // 2
+        if positions[tails[middle]] < position:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+class KeyedChildren:
+    """Nach Schlüsseln geordnete Kind-Elemente eines Containers
+    
+    ``reconcile()`` vergleicht die angezeigte mit der gewünschten
+    Reihenfolge und führt nur die nötigen Änderungen aus: Entfernen,
+    Einfügen, Verschieben (nur Elemente außerhalb von ``stable_keys``)
+    und Aktualisieren vorhandener Elemente an Ort und Stelle.
+    """
+
+    def __init__(self, create, pack_options):
+        self.create = create              # Schlüssel -> Objekt mit .frame
+        self.pack_options = pack_options
+        self.children = {}
+        self.order = []
+
+    def reconcile(self, items, update):
+        """Gleicht die Kinder mit den (Schlüssel, Wert)-Paaren ab"""
+        for _ in self.reconcile_steps(items, update):
+            pass
+
+    def reconcile_steps(self, items, update):
+        """Wie ``reconcile()``, gibt aber nach jedem Element die Kontrolle ab
+        
+        Liefert ``update`` selbst einen Generator (verschachtelte Listen),
+        werden dessen Schritte eingebettet. Wird der Generator vorzeitig
+        geschlossen, wird die Reihenfolge aus dem Pack-Manager übernommen.
+        """
+        items = list(items)
+        new_keys = [key for key, _ in items]
+        wanted = set(new_keys)
+        
+        # Entfernen
+        for key in self.order:
+            if key not in wanted:
+                self.children.pop(key).frame.destroy()
+        
+        stable = stable_keys(self.order, new_keys)
+        previous = None
+        completed = False
+        try:
+            for key, value in items:
+                child = self.children.get(key)
+                if child is None:
+                    # Einfügen
+                    child = self.children[key] = self.create(key)
+                    child.frame.reconcile_key = key
+                    moved = True
+                else:
+                    moved = key not in stable
+                
+                if moved:
+                    # Verschieben bzw. an der richtigen Stelle einpacken
+                    if previous is not None:
+                        child.frame.pack(after=previous.frame, **self.pack_options)
+                    else:
+                        slaves = child.frame.master.pack_slaves()
+                        if slaves and slaves[0] is not child.frame:
+                            child.frame.pack(before=slaves[0], **self.pack_options)
+                        else:
+                            child.frame.pack(**self.pack_options)
+                previous = child
+                
+                steps = update(child, value)
+                if steps is not None:
+                    yield from steps
+                yield
+            completed = True
+        finally:
+            if completed:
+                self.order = new_keys
+            else:
+                self._resync()
+
+    def _resync(self):
+        """Übernimmt die tatsächliche Reihenfolge nach einem abgebrochenen Abgleich"""
+        if not self.children:
+            self.order = []
+            return
+        master = next(iter(self.children.values())).frame.master
+        self.order = [frame.reconcile_key for frame in master.pack_slaves()
+                      if getattr(frame, 'reconcile_key', None) in self.children]
+
+    def clear(self):
+        for child in self.children.values():
+            child.frame.destroy()
+        self.children = {}
+        self.order = []
+
+class CategorySection:
+    """Kopfzeile und Todo-Bereich einer Kategorie in der Widget-Liste"""
+
+    def __init__(self, app, parent, category):
+        self.app = app
+        self.category = category
+        
+        # Container für diese Kategorie
+        self.frame = ttk.Frame(parent, style='DropZone.TFrame')
+        self.frame.category = category
+        
+        # Header-Frame für Kategorie
+        header_frame = ttk.Frame(self.frame, style='CategoryHeader.TFrame')
+        header_frame.pack(fill=tk.X, padx=8, pady=1)
+        
+        # Expand/Collapse Button
+        self.expand_btn = ttk.Label(header_frame,
+                                   text="▶",
+                                   style='CategoryExpand.TLabel',
+                                   cursor="hand2")
+        self.expand_btn.pack(side=tk.LEFT, padx=(2, 5))
+        self.expand_btn.bind('<Button-1>', self.toggle)
+        
+        # Kategorie-Label mit Anzahl
+        self.label = ttk.Label(header_frame, style='CategoryTitle.TLabel')
+        self.label.pack(side=tk.LEFT, fill=tk.X)
+        
+        # Container für Todos dieser Kategorie (wird erst beim Aufklappen eingeblendet)
+        self.todos_frame = ttk.Frame(self.frame, style='Dark.TFrame')
+        self.expanded = False
+        self.rows = KeyedChildren(lambda key: TodoRow(app, self.todos_frame),
+                                  {'fill': tk.X, 'pady': 3, 'padx': 8})
+        
+        # Dropzone-Effekte
+        self.frame.bind('<Enter>', lambda e: app.highlight_dropzone(self.frame, True))
+        self.frame.bind('<Leave>', lambda e: app.highlight_dropzone(self.frame, False))
+
+    def show(self, value):
+        """Zeigt die Anzahl an und gibt die Schritte für den Abgleich der Todos zurück
+        
+        ``value`` ist ``(Anzahl, Todos)``; bei eingeklappten Kategorien ist
+        ``Todos`` None. Deren Zeilen werden erst beim ersten Aufklappen
+        aufgebaut, bereits vorhandene bleiben bis dahin unverändert.
+        """
+        count, todos = value
+        self.label.configure(text=f"{self.category} ({count})")
+        
+        if todos is None:
+            if self.expanded:
+                self.todos_frame.pack_forget()
+                self.expand_btn.configure(text="▶")
+                self.expanded = False
+            return None
+        
+        if not self.expanded:
+            self.todos_frame.pack(fill=tk.X, expand=True)
+            self.expand_btn.configure(text="▼")
+            self.expanded = True
+        return self.rows.reconcile_steps([(todo.id, todo) for todo in todos], TodoRow.show)
+
+    def toggle(self, event=None):
+        """Expand/Collapse Funktionalität"""
+        toggle_collapsed(self.app, self.category)
+
+class WidgetTodoList:
+    """Widget-basierte Todo-Liste mit Abgleich statt Neuaufbau
+    
+    Hält für die Kategorieansicht je Kategorie eine ``CategorySection``
+    und für gefilterte Ansichten eine flache Zeilenliste. Zwischen zwei
+    Aktualisierungen bleiben alle Widgets bestehen, deren Todo weiterhin
+    angezeigt wird.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.layout = None  # 'categories', 'flat' oder None
+        self.sections = KeyedChildren(lambda key: CategorySection(app, app.todo_frame, key),
+                                      {'fill': tk.X, 'pady': (5, 2)})
+        self.rows = KeyedChildren(lambda key: TodoRow(app, app.todo_frame),
+                                  {'fill': tk.X, 'pady': 3, 'padx': 8})
+
+    def _switch(self, layout):
+        """Wechselt die Ansicht (verwirft dabei die Widgets der alten)"""
+        if self.layout != layout:
+            self.clear()
+            for widget in self.app.todo_frame.winfo_children():
+                widget.destroy()
+            self.layout = layout
+
+    def show_categories(self, sections):
+        """Gibt die Schritte zurück, um (Kategorie, Todos)-Paare anzuzeigen"""
+        self._switch('categories')
+        return self.sections.reconcile_steps(sections, CategorySection.show)
+
+    def show_flat(self, todos):
+        """Gibt die Schritte zurück, um Todos als flache Liste anzuzeigen"""
+        self._switch('flat')
+        return self.rows.reconcile_steps([(todo.id, todo) for todo in todos], TodoRow.show)
+
+    def clear(self):
+        self.sections.clear()
+        self.rows.clear()
+        self.layout = None
+
+def load_collapsed_categories(app):
+    """Liest die eingeklappten Kategorien aus den Einstellungen"""
+    value = app.settings.get('collapsed_categories', '')
+    return {category for category in value.split('|') if category}
+
+def toggle_collapsed(app, category):
+    """Klappt eine Kategorie ein bzw. aus und speichert den Zustand"""
+    if category in app.collapsed_categories:
+        app.collapsed_categories.discard(category)
+    else:
+        app.collapsed_categories.add(category)
+    app.save_settings({'collapsed_categories': '|'.join(sorted(app.collapsed_categories))})
+    app.show_all_todos()
+
 def create_todo_item(app, parent_frame, todo):
     """Erstellt ein einzelnes Todo-Item mit modernem Design"""
-    # Hauptcontainer mit Schatten-Effekt
-    todo_frame = ttk.Frame(parent_frame, style='TodoModern.TFrame')
-    todo_frame.pack(fill=tk.X, pady=3, padx=8)
-    
-    # Speichere den Index und die Kategorie für Drag & Drop
-    todo_frame.todo_index = app.todo_manager.get_all().index(todo)
-    todo_frame.category = todo.get('category', 'Allgemein')
-    
-    # Innerer Container für Padding
-    inner_frame = ttk.Frame(todo_frame, style='TodoInner.TFrame')
-    inner_frame.pack(fill=tk.X, padx=2, pady=2)
-    
-    # Linke Seite: Handle, Checkbox und Priorität
-    left_frame = ttk.Frame(inner_frame, style='TodoInner.TFrame')
-    left_frame.pack(side=tk.LEFT, fill=tk.Y)
-    
-    # Drag Handle mit subtilerem Design
-    drag_handle = ttk.Label(left_frame,
-                          text="⋮",
-                          style='DragHandleModern.TLabel',
-                          cursor="fleur")
-    drag_handle.pack(side=tk.LEFT, padx=(5, 3))
-    
-    # Hauptinhalt mit fester Breite für Text
-    content_frame = ttk.Frame(inner_frame, style='TodoInner.TFrame')
-    content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 30))
-    
-    # Text mit besserer Formatierung
-    text_frame = ttk.Frame(content_frame, style='TodoInner.TFrame')
-    text_frame.pack(fill=tk.X)
-    
-    text_label = ttk.Label(text_frame,
-                          text=todo['text'],
-                          style='TodoTextModern.TLabel',
-                          wraplength=200)
-    text_label.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=(2, 0))
-    
-    # Doppelklick zum Bearbeiten
-    text_label.bind('<Double-Button-1>', lambda e: app.edit_todo(todo_frame.todo_index))
-    
-    # Checkbox mit angepasstem Design
-    completed_var = tk.BooleanVar(value=todo.get('completed', False))
-    checkbox = ttk.Checkbutton(left_frame,
-                              variable=completed_var,
-                              style='TodoCheckbox.TCheckbutton',
-                              command=lambda: on_toggle_completed())
-    checkbox.pack(side=tk.LEFT, padx=(0, 5))
-    
-    def on_toggle_completed():
+    row = TodoRow(app, parent_frame)
+    row.show(todo)
+    row.frame.pack(fill=tk.X, pady=3, padx=8)
+    return row.frame
+
+class TodoRow:
+    """Widgets einer Todo-Zeile, die für beliebige Todos wiederverwendet werden können
+    
+    Die Widgets werden einmalig aufgebaut; ``show()`` überträgt nur die
+    Werte eines Todos. Dadurch kann die virtuelle Liste Zeilen beim
+    Scrollen recyceln, statt sie neu zu erzeugen.
+    """
+
+    def __init__(self, app, parent_frame, wraplength=200):
+        self.app = app
+        self.todo = None
+        self._shown = None  # Zuletzt angezeigte Werte
+        
+        # Hauptcontainer mit Schatten-Effekt
+        self.frame = todo_frame = ttk.Frame(parent_frame, style='TodoModern.TFrame')
+        todo_frame.row = self
+        todo_frame.todo_id = None
+        todo_frame.category = 'Allgemein'
+        
+        # Innerer Container für Padding
+        inner_frame = ttk.Frame(todo_frame, style='TodoInner.TFrame')
+        inner_frame.pack(fill=tk.X, padx=2, pady=2)
+        
+        # Linke Seite: Handle, Checkbox und Priorität
+        left_frame = ttk.Frame(inner_frame, style='TodoInner.TFrame')
+        left_frame.pack(side=tk.LEFT, fill=tk.Y)
+        
+        # Drag Handle mit subtilerem Design
+        self.drag_handle = drag_handle = ttk.Label(left_frame,
+                                                  text="⋮",
+                                                  style='DragHandleModern.TLabel',
+                                                  cursor="fleur")
+        drag_handle.pack(side=tk.LEFT, padx=(5, 3))
+        
+        # Hauptinhalt mit fester Breite für Text
+        self.content_frame = ttk.Frame(inner_frame, style='TodoInner.TFrame')
+        self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 30))
+        
+        # Text mit besserer Formatierung
+        text_frame = ttk.Frame(self.content_frame, style='TodoInner.TFrame')
+        text_frame.pack(fill=tk.X)
+        
+        self.text_label = ttk.Label(text_frame,
+                                   style='TodoTextModern.TLabel',
+                                   wraplength=wraplength)
+        self.text_label.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=(2, 0))
+        
+        # Doppelklick zum Bearbeiten
+        self.text_label.bind('<Double-Button-1>',
+                             lambda e: app.edit_todo(todo_frame.todo_id))
+        
+        # Checkbox mit angepasstem Design
+        self.completed_var = tk.BooleanVar(value=False)
+        checkbox = ttk.Checkbutton(left_frame,
+                                  variable=self.completed_var,
+                                  style='TodoCheckbox.TCheckbutton',
+                                  command=self._on_toggle_completed)
+        checkbox.pack(side=tk.LEFT, padx=(0, 5))
+        
+        # Prioritätsindikator als farbiger Punkt
+        self.priority_dot = ttk.Label(left_frame,
+                                     text="●",
+                                     style='PriorityDot.TLabel')
+        self.priority_dot.pack(side=tk.LEFT, padx=(0, 8))
+        
+        # Rechte Seite für Löschen-Button (absolut positioniert)
+        right_frame = ttk.Frame(inner_frame, style='TodoInner.TFrame')
+        right_frame.place(relx=1.0, rely=0.0, anchor='ne')  # Absolute Positionierung
+        
+        # Löschen-Button
+        delete_btn = ttk.Label(right_frame,
+                              text="×",
+                              style='TodoDelete.TLabel',
+                              cursor="hand2")
+        delete_btn.pack(padx=5)
+        
+        # Löschen-Button Events
+        def on_delete_enter(e):
+            delete_btn.configure(style='TodoDeleteHover.TLabel')
+
+        def on_delete_leave(e):
+            delete_btn.configure(style='TodoDelete.TLabel')
+
+        def delete_todo(e):
+            if app.confirm_delete():
+                app.todo_manager.delete_by_id(todo_frame.todo_id)
+                app.reminders.update(todo_frame.todo_id)
+                app.show_all_todos()
+        
+        delete_btn.bind('<Enter>', on_delete_enter)
+        delete_btn.bind('<Leave>', on_delete_leave)
+        delete_btn.bind('<Button-1>', delete_todo)
+        
+        # Metadaten-Bereich (nur für Deadline, wird bei Bedarf eingeblendet)
+        self.meta_frame = ttk.Frame(self.content_frame, style='TodoInner.TFrame')
+        deadline_frame = ttk.Frame(self.meta_frame, style='MetaBadge.TFrame')
+        deadline_frame.pack(side=tk.LEFT, padx=(0, 6))
+        self.deadline_icon = ttk.Label(deadline_frame)
+        self.deadline_icon.pack(side=tk.LEFT, padx=(4, 2))
+        self.deadline_label = ttk.Label(deadline_frame)
+        self.deadline_label.pack(side=tk.LEFT, padx=(0, 4))
+        
+        # Event Bindings
+        drag_handle.bind('<Button-1>', lambda e: app.start_drag(e, todo_frame))
+        drag_handle.bind('<B1-Motion>', lambda e: app.on_drag(e))
+        drag_handle.bind('<ButtonRelease-1>', lambda e: app.end_drag(e))
+        
+        # Hover Effekte
+        def on_enter(e):
+            todo_frame.configure(style='TodoModernHover.TFrame')
+            drag_handle.configure(style='DragHandleHover.TLabel')
+
+        def on_leave(e):
+            todo_frame.configure(style='TodoModern.TFrame')
+            drag_handle.configure(style='DragHandleModern.TLabel')
+        
+        todo_frame.bind('<Enter>', on_enter)
+        todo_frame.bind('<Leave>', on_leave)
+
+    def _on_toggle_completed(self):
         try:
-            app.toggle_todo_completed(todo_frame.todo_index)
+            self.app.toggle_todo_completed(self.frame.todo_id)
             # Visuelles Feedback direkt aktualisieren
-            if completed_var.get():
-                text_label.configure(style='TodoTextCompleted.TLabel')
+            if self.completed_var.get():
+                self.text_label.configure(style='TodoTextCompleted.TLabel')
             else:
-                text_label.configure(style='TodoTextModern.TLabel')
+                self.text_label.configure(style='TodoTextModern.TLabel')
         except Exception as e:
             print(f"Fehler beim Umschalten des Status: {e}")
-    
-    # Initialer Status
-    if todo.get('completed', False):
-        text_label.configure(style='TodoTextCompleted.TLabel')
-    
-    # Prioritätsindikator als farbiger Punkt
-    priority_colors = {
-        '▲': app.colors['high_priority'],
-        '►': app.colors['medium_priority'],
-        '▼': app.colors['low_priority']
-    }
-    priority = todo.get('priority', '►')
-    priority_dot = ttk.Label(left_frame,
-                           text="●",
-                           style='PriorityDot.TLabel')
-    priority_dot.configure(foreground=priority_colors[priority])
-    priority_dot.pack(side=tk.LEFT, padx=(0, 8))
-    
-    # Rechte Seite für Löschen-Button (absolut positioniert)
-    right_frame = ttk.Frame(inner_frame, style='TodoInner.TFrame')
-    right_frame.place(relx=1.0, rely=0.0, anchor='ne')  # Absolute Positionierung
-    
-    # Löschen-Button
-    delete_btn = ttk.Label(right_frame,
-                          text="×",
-                          style='TodoDelete.TLabel',
-                          cursor="hand2")
-    delete_btn.pack(padx=5)
-    
-    # Löschen-Button Events
-    def on_delete_enter(e):
-        delete_btn.configure(style='TodoDeleteHover.TLabel')
-        
-    def on_delete_leave(e):
-        delete_btn.configure(style='TodoDelete.TLabel')
-        
-    def delete_todo(e):
-        if app.confirm_delete():
-            app.todo_manager.delete(todo_frame.todo_index)
-            app.show_all_todos()
-    
-    delete_btn.bind('<Enter>', on_delete_enter)
-    delete_btn.bind('<Leave>', on_delete_leave)
-    delete_btn.bind('<Button-1>', delete_todo)
-    
-    # Metadaten-Bereich (nur noch für Deadline)
-    if todo.get('deadline'):
-        meta_frame = ttk.Frame(content_frame, style='TodoInner.TFrame')
-        meta_frame.pack(fill=tk.X, pady=(4, 2))
-        
-        deadline_frame = ttk.Frame(meta_frame, style='MetaBadge.TFrame')
-        deadline_frame.pack(side=tk.LEFT, padx=(0, 6))
+
+    def show(self, todo):
+        """Zeigt die Werte eines Todos in dieser Zeile an
+        
+        Unveränderte Zeilen (gleiche Werte, gleiches Theme) werden nicht
+        neu konfiguriert.
+        """
+        priority_colors = {
+            '▲': self.app.colors['high_priority'],
+            '►': self.app.colors['medium_priority'],
+            '▼': self.app.colors['low_priority']
+        }
+        priority_color = priority_colors.get(todo.priority, priority_colors['►'])
+        is_overdue = self.app._is_overdue(todo)
+        
+        state = (todo.id, todo.text, todo.category, todo.priority,
+                 todo.deadline, todo.completed, priority_color, is_overdue)
+        self.todo = todo
+        if state == self._shown:
+            return  # Nichts geändert (z.B. beim Scrollen)
+        self._shown = state
+        
+        # Speichere die ID und die Kategorie für Drag & Drop
+        self.frame.todo_id = todo.id
+        self.frame.category = todo.category
         
-        is_overdue = app._is_overdue(todo['deadline'])
-        deadline_icon = "⚠️" if is_overdue else "⏰"
-        icon_style = 'MetaIconAlert.TLabel' if is_overdue else 'MetaIcon.TLabel'
+        self.text_label.configure(text=todo.text,
+                                  style='TodoTextCompleted.TLabel' if todo.completed
+                                  else 'TodoTextModern.TLabel')
+        self.completed_var.set(todo.completed)
+        self.priority_dot.configure(foreground=priority_color)
         
-        # Icon
-        ttk.Label(deadline_frame,
-                 text=deadline_icon,
-                 style=icon_style).pack(side=tk.LEFT, padx=(4, 2))
+        if not todo.deadline:
+            self.meta_frame.pack_forget()
+            return
+        self.meta_frame.pack(fill=tk.X, pady=(4, 2))
+        
+        self.deadline_icon.configure(text="⚠️" if is_overdue else "⏰",
+                                     style='MetaIconAlert.TLabel' if is_overdue
+                                     else 'MetaIcon.TLabel')
         
         # Prioritäts-abhängiger Style für das Datum
-        priority = todo.get('priority', '►')
         deadline_style = {
             '▲': 'DeadlineHigh.TLabel',    # Hohe Priorität
             '►': 'DeadlineMedium.TLabel',  # Mittlere Priorität
             '▼': 'DeadlineLow.TLabel'      # Niedrige Priorität
-        }.get(priority, 'MetaText.TLabel')
+        }.get(todo.priority, 'MetaText.TLabel')
+        
+        # Datum (und ggf. Uhrzeit) mit Prioritätsfarbe
+        self.deadline_label.configure(text=todo.deadline_badge, style=deadline_style)
+
+class CategoryHeaderRow:
+    """Wiederverwendbare Kopfzeile einer Kategorie für die virtuelle Liste"""
+
+    def __init__(self, app, parent, on_toggle):
+        self.category = None
         
-        # Formatiere das Datum
+        # Dropzone-Container (wie in der Kategorieansicht)
+        self.frame = ttk.Frame(parent, style='DropZone.TFrame')
+        self.frame.category = None
+        
+        header_frame = ttk.Frame(self.frame, style='CategoryHeader.TFrame')
+        header_frame.pack(fill=tk.X, padx=8, pady=1)
+        
+        self.expand_btn = ttk.Label(header_frame,
+                                   text="▼",
+                                   style='CategoryExpand.TLabel',
+                                   cursor="hand2")
+        self.expand_btn.pack(side=tk.LEFT, padx=(2, 5))
+        self.expand_btn.bind('<Button-1>', lambda e: on_toggle(self.category))
+        
+        self.label = ttk.Label(header_frame, style='CategoryTitle.TLabel')
+        self.label.pack(side=tk.LEFT, fill=tk.X)
+        
+        # Dropzone-Effekte
+        self.frame.bind('<Enter>', lambda e: app.highlight_dropzone(self.frame, True))
+        self.frame.bind('<Leave>', lambda e: app.highlight_dropzone(self.frame, False))
+
+    def show(self, category, count, collapsed):
+        """Zeigt Name, Anzahl und Zustand einer Kategorie an"""
+        self.category = self.frame.category = category
+        self.label.configure(text=f"{category} ({count})")
+        self.expand_btn.configure(text="▶" if collapsed else "▼")
+
+class VirtualTodoList:
+    """Virtualisierte Todo-Liste auf dem Canvas der Todo-Liste
+    
+    Statt für jedes Todo eigene Widgets anzulegen, werden nur die Zeilen
+    im sichtbaren Ausschnitt (plus ``OVERSCAN``) aus einem Pool von
+    ``TodoRow``- und ``CategoryHeaderRow``-Objekten erzeugt. Die Zeilen
+    haben feste Höhen, daher genügen vorberechnete Positionen und
+    ``bisect`` für die Suche des sichtbaren Bereichs. Scrollt ein Eintrag
+    aus dem Bild, wird seine Zeile für den nächsten wiederverwendet. Die
+    Kopfzeile der obersten Kategorie bleibt am oberen Rand stehen.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.canvas = app.canvas
+        self.active = False
+        self.entries = []          # ('header', Kategorie, Anzahl, eingeklappt) / ('todo', Todo)
+        self.offsets = [0]         # Startposition je Eintrag (+ Gesamthöhe)
+        self._header_indexes = []  # Indizes der Kopfzeilen
+        self._visible = {}         # Eintragsindex -> (Zeile, Canvas-Element)
+        self._pools = {'todo': [], 'header': []}
+        self._sticky = None
+        self._width = 1
+        self._refreshing = False
+
+    def show(self, entries):
+        """Aktiviert die virtuelle Liste und zeigt die übergebenen Einträge an"""
+        if not self.active:
+            self.active = True
+            self.canvas.itemconfigure('todo_frame', state='hidden')
+        self._release_all()
+        
+        self.entries = entries
+        self.offsets, self._header_indexes = layout_entries(entries)
+        
+        self.canvas.configure(scrollregion=(0, 0, self._width, self.offsets[-1]))
+        self.refresh()
+
+    def hide(self):
+        """Schaltet zurück auf die normale Widget-Liste"""
+        if not self.active:
+            return
+        self.active = False
+        self._release_all()
+        self.entries = []
+        self.offsets = [0]
+        self._header_indexes = []
+        if self._sticky:
+            self.canvas.itemconfigure(self._sticky[1], state='hidden')
+        self.canvas.itemconfigure('todo_frame', state='normal')
+        self.canvas.configure(scrollregion=self.canvas.bbox('todo_frame'))
+
+    def resize(self, width):
+        """Passt die Zeilenbreite an die Canvas-Breite an"""
+        self._width = width
+        self.canvas.itemconfigure('vrow', width=width)
+        if self.active:
+            self.canvas.configure(scrollregion=(0, 0, width, self.offsets[-1]))
+
+    def toggle_category(self, category):
+        """Klappt eine Kategorie ein bzw. aus"""
+        toggle_collapsed(self.app, category)
+
+    def refresh(self):
+        """Baut die Zeilen für den aktuell sichtbaren Ausschnitt auf"""
+        if not self.active or self._refreshing:
+            return
+        self._refreshing = True
         try:
-            date_obj = datetime.strptime(todo['deadline'], "%d.%m.%Y")
-            formatted_date = date_obj.strftime("%d.%m.%Y")
-            formatted_time = date_obj.strftime("%H:%M")
+            top = self.canvas.canvasy(0)
+            first, last = entry_range(self.offsets, top,
+                                      top + self.canvas.winfo_height())
             
-            # Datum mit Prioritätsfarbe
-            ttk.Label(deadline_frame,
-                     text=formatted_date,
-                     style=deadline_style).pack(side=tk.LEFT)
+            # Nicht mehr sichtbare Zeilen in den Pool zurückgeben
+            for index in [i for i in self._visible if i < first or i >= last]:
+                self._release(index)
             
-            # Uhrzeit falls vorhanden
-            if formatted_time != "00:00":
-                ttk.Label(deadline_frame,
-                         text=f" {formatted_time}",
-                         style=deadline_style).pack(side=tk.LEFT, padx=(0, 4))
-            else:
-                ttk.Label(deadline_frame,
-                         text="",
-                         style=deadline_style).pack(side=tk.LEFT, padx=(0, 4))
-        except:
-            # Fallback wenn Datum nicht geparst werden kann
-            ttk.Label(deadline_frame,
-                     text=todo['deadline'],
-                     style=deadline_style).pack(side=tk.LEFT, padx=(0, 4))
-    
-    # Event Bindings
-    drag_handle.bind('<Button-1>', lambda e: app.start_drag(e, todo_frame))
-    drag_handle.bind('<B1-Motion>', lambda e: app.on_drag(e))
-    drag_handle.bind('<ButtonRelease-1>', lambda e: app.end_drag(e))
-    
-    # Hover Effekte
-    def on_enter(e):
-        todo_frame.configure(style='TodoModernHover.TFrame')
-        drag_handle.configure(style='DragHandleHover.TLabel')
-    
-    def on_leave(e):
-        todo_frame.configure(style='TodoModern.TFrame')
-        drag_handle.configure(style='DragHandleModern.TLabel')
-    
-    todo_frame.bind('<Enter>', on_enter)
-    todo_frame.bind('<Leave>', on_leave)
-    
-    return todo_frame 
\ No newline at end of file
+            # Neu sichtbare Zeilen aus dem Pool belegen
+            for index in range(first, last):
+                if index not in self._visible:
+                    self._acquire(index)
+            
+            self._update_sticky(top)
+        finally:
+            self._refreshing = False
+
+    def _acquire(self, index):
+        """Belegt eine Zeile aus dem Pool für den Eintrag mit diesem Index"""
+        entry = self.entries[index]
+        kind = entry[0]
+        pool = self._pools[kind]
+        if pool:
+            row, item = pool.pop()
+        else:
+            row = self._create_row(kind)
+            item = self.canvas.create_window(0, 0, window=row.frame, anchor='nw',
+                                             width=self._width, tags='vrow')
+        
+        if kind == 'header':
+            row.show(entry[1], entry[2], entry[3])
+        else:
+            row.show(entry[1])
+        
+        self.canvas.coords(item, 0, self.offsets[index])
+        self.canvas.itemconfigure(item, state='normal',
+                                  height=self.offsets[index + 1] - self.offsets[index])
+        self._visible[index] = (row, item)
+
+    def _create_row(self, kind):
+        """Erzeugt eine neue Zeile für den Pool"""
+        if kind == 'header':
+            return CategoryHeaderRow(self.app, self.canvas, self.toggle_category)
+        row = TodoRow(self.app, self.canvas, wraplength=0)
+        row.frame.virtual = True
+        return row
+
+    def _release(self, index):
+        """Gibt die Zeile eines Eintrags zurück in den Pool"""
+        row, item = self._visible.pop(index)
+        self.canvas.itemconfigure(item, state='hidden')
+        kind = 'header' if isinstance(row, CategoryHeaderRow) else 'todo'
+        self._pools[kind].append((row, item))
+
+    def _release_all(self):
+        for index in list(self._visible):
+            self._release(index)
+
+    def _update_sticky(self, top):
+        """Hält die Kopfzeile der obersten Kategorie am oberen Rand"""
+        header = section_at(self.offsets, self._header_indexes, top)
+        if header < 0 or self.offsets[header] >= top:
+            if self._sticky:
+                self.canvas.itemconfigure(self._sticky[1], state='hidden')
+            return
+        
+        if self._sticky is None:
+            row = CategoryHeaderRow(self.app, self.canvas, self.toggle_category)
+            item = self.canvas.create_window(0, 0, window=row.frame, anchor='nw',
+                                             width=self._width, height=HEADER_HEIGHT,
+                                             tags=('vrow', 'vsticky'))
+            self._sticky = (row, item)
+        row, item = self._sticky
+        
+        entry = self.entries[header]
+        row.show(entry[1], entry[2], entry[3])
+        
+        # Die nächste Kopfzeile schiebt die stehende nach oben weg
+        y = top
+        position = bisect_left(self._header_indexes, header)
+        if position + 1 < len(self._header_indexes):
+            next_top = self.offsets[self._header_indexes[position + 1]]
+            y = min(top, next_top - HEADER_HEIGHT)
+        self.canvas.coords(item, 0, y)
+        self.canvas.itemconfigure(item, state='normal')
+        row.frame.lift()  # Fenster-Elemente stapeln sich nach Widget-Reihenfolge
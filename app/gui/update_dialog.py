@@ -0,0 +1,59 @@
+import queue
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+# Abfrageintervall für den Download-Fortschritt (ms)
+POLL_MS = 100
+
+def show_update_download(app):
+    """Lädt das Update im Hintergrund und zeigt den Fortschritt an"""
+    if not app.updater.start_download():
+        return
+    
+    dialog, main_frame = app.create_dialog("Update", width=320, height=140)
+    
+    status_label = ttk.Label(main_frame,
+                            text="Update wird heruntergeladen...",
+                            style='TodoText.TLabel')
+    status_label.pack(anchor="w", pady=(0, 10))
+    
+    progress_bar = ttk.Progressbar(main_frame, mode='determinate', maximum=100)
+    progress_bar.pack(fill=tk.X)
+    
+    def poll():
+        # Alle Meldungen abholen, nur die letzte Fortschrittsmeldung anzeigen
+        latest = None
+        while True:
+            try:
+                event = app.updater.download_events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] != 'progress':
+                finish(event)
+                return
+            latest = event
+        
+        if latest is not None and dialog.winfo_exists():
+            _, done, total = latest
+            if total:
+                progress_bar['value'] = done * 100 / total
+                status_label.configure(
+                    text=f"Update wird heruntergeladen... {done // 1024} / {total // 1024} KB")
+            else:
+                status_label.configure(
+                    text=f"Update wird heruntergeladen... {done // 1024} KB")
+        app.root.after(POLL_MS, poll)
+    
+    def finish(event):
+        if dialog.winfo_exists():
+            dialog.destroy()
+        if event[0] == 'done':
+            if messagebox.askyesno(
+                "Update bereit",
+                "Das Update wurde heruntergeladen. Jetzt installieren?"
+            ):
+                app.updater.install_update(event[1])
+        else:
+            messagebox.showerror("Update", f"Das Update konnte nicht geladen werden:\n{event[1]}")
+    
+    app.root.after(POLL_MS, poll)
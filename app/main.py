@@ -1,22 +1,43 @@
 import os
 import sys
+import time
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
 import winreg
 
 # Füge das Hauptverzeichnis zum Python-Path hinzu
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app import view
+from app.audio import NotificationPlayer
 from app.constants import COLORS, TRANSLATIONS
+from app.deadline import is_overdue
+from app.persistence import WriteBehindWriter, atomic_write
+from app.reminders import ReminderScheduler, parse_lead_minutes
 from app.todo_manager import TodoManager
+from app.sqlite_manager import SQLiteTodoManager, migrate_to_sqlite
 from app.gui import styles, title_bar, todo_list
+from app.gui.search import SearchController
+from app.gui.reminder import show_reminder
+from app.gui.update_dialog import show_update_download
 from app.gui.menu import create_menu, show_category_menu
 from app.gui.settings import SettingsDialog
 from app.updater import Updater
 
+# Fensterverschiebung höchstens einmal pro Frame anwenden (ms)
+MOVE_FRAME_MS = 16
+
 class TodoApp:
     def __init__(self):
+        # Startzeit für die Messung bis zur ersten Anzeige
+        self.startup_started = time.perf_counter()
+        self.first_paint_ms = None
+        self.audio = None  # Wird beim ersten Ton erstellt
+        self.update_poll_job = None  # Abfrage des Update-Check-Ergebnisses
+        self._move_job = None  # Geplante Fensterverschiebung
+        self._move_target = None  # Zuletzt angesteuerte Fensterposition
+        
         # Hauptfenster erstellen
         self.root = tk.Tk()
         
@@ -29,11 +50,15 @@ class TodoApp:
             # 1. Standardwerte laden
             self.load_initial_settings()
             
+            # Schreibvorgänge laufen gebündelt im Hintergrund
+            self.writer = WriteBehindWriter(
+                delay=int(self.settings.get('save_delay_ms', 300)) / 1000)
+            
             # 2. Kategorien laden
             self.load_categories()
             
             # 3. Datenmanager initialisieren
-            self.todo_manager = TodoManager()
+            self.todo_manager = self.create_todo_manager()
             
             # 4. Fenster einrichten
             self.setup_window()
@@ -44,20 +69,45 @@ class TodoApp:
             # 6. GUI erstellen
             self.create_gui()
             
-            # 7. Todos laden und anzeigen
-            self.load_todos()
-            
-            # Updater initialisieren
-            self.updater = Updater()
+            # 7. Todos anzeigen (der Datenmanager hat sie bereits geladen)
+            self.show_all_todos()
+            self.root.after_idle(self._record_first_paint)
             
-            # Auf Updates prüfen
-            self.check_for_updates()
+            # 8. Erinnerungen an anstehende Deadlines einplanen
+            self.reminders = ReminderScheduler(
+                self.root, self.todo_manager, self.on_reminder,
+                parse_lead_minutes(self.settings.get('reminder_lead_minutes', '15,0')))
+            self.reminders.rebuild()
             
+            # Updater initialisieren (geprüft wird erst nach der ersten Anzeige)
+            self.updater = Updater(
+                cache_path=os.path.abspath('update_cache.json'),
+                min_interval=int(self.settings.get('update_check_interval_hours', 6)) * 3600)
             
         except Exception as e:
             print(f"Fehler beim Initialisieren der App: {e}")
             raise
 
+    def _record_first_paint(self):
+        """Merkt sich die Zeit vom Start bis zur ersten fertigen Anzeige"""
+        self.root.update_idletasks()
+        self.first_paint_ms = (time.perf_counter() - self.startup_started) * 1000
+        if self.settings.get('debug_timing') == 'true':
+            print(f"Erste Anzeige nach {self.first_paint_ms:.0f} ms")
+        
+        # Update-Prüfung erst einige Sekunden nach dem Start
+        delay = int(self.settings.get('update_check_delay_ms', 5000))
+        self.root.after(delay, self.check_for_updates)
+
+    def create_todo_manager(self):
+        """Erstellt den Datenmanager für das eingestellte Speicherformat"""
+        if self.settings.get('storage') == 'sqlite':
+            # Beim ersten Start mit SQLite die bestehende todos.txt übernehmen
+            manager = SQLiteTodoManager(os.path.abspath('todos.db'))
+            migrate_to_sqlite(self.storage_path, manager=manager)
+            return manager
+        return TodoManager(self.storage_path, writer=self.writer)
+
     def load_initial_settings(self):
         """Lädt die initialen Einstellungen"""
         try:
@@ -153,70 +203,6 @@ class TodoApp:
             # 4. Event-Bindings
             self._setup_bindings()
             
-            # 5. Todos sofort anzeigen
-            if hasattr(self, 'todo_frame'):
-                # Todos nach Kategorien gruppieren
-                todos_by_category = {}
-                for todo in self.todo_manager.get_all():
-                    category = todo.get('category', 'Allgemein')
-                    if category not in todos_by_category:
-                        todos_by_category[category] = []
-                    todos_by_category[category].append(todo)
-                
-                # Alle Kategorien anzeigen
-                for category in sorted(self.categories):
-                    # Container für diese Kategorie
-                    category_container = ttk.Frame(self.todo_frame, style='DropZone.TFrame')
-                    category_container.pack(fill=tk.X, pady=(5, 2))
-                    category_container.category = category
-                    
-                    # Header-Frame für Kategorie
-                    header_frame = ttk.Frame(category_container, style='CategoryHeader.TFrame')
-                    header_frame.pack(fill=tk.X, padx=8, pady=1)
-                    
-                    # Expand/Collapse Button
-                    expand_btn = ttk.Label(header_frame,
-                                        text="▼",
-                                        style='CategoryExpand.TLabel',
-                                        cursor="hand2")
-                    expand_btn.pack(side=tk.LEFT, padx=(2, 5))
-                    
-                    # Kategorie-Label mit Anzahl
-                    count = len(todos_by_category.get(category, []))
-                    category_label = ttk.Label(header_frame,
-                                            text=f"{category} ({count})",
-                                            style='CategoryTitle.TLabel')
-                    category_label.pack(side=tk.LEFT, fill=tk.X)
-                    
-                    # Container für Todos dieser Kategorie
-                    todos_frame = ttk.Frame(category_container, style='Dark.TFrame')
-                    todos_frame.pack(fill=tk.X, expand=True)
-                    
-                    # Todos anzeigen
-                    if category in todos_by_category:
-                        for todo in self._sort_by(todos_by_category[category]):
-                            todo_list.create_todo_item(self, todos_frame, todo)
-                    
-                    # Expand/Collapse Funktionalität
-                    def toggle_category(frame=todos_frame, btn=expand_btn):
-                        if frame.winfo_viewable():
-                            frame.pack_forget()
-                            btn.configure(text="▶")
-                        else:
-                            frame.pack(fill=tk.X, expand=True)
-                            btn.configure(text="▼")
-                    
-                    expand_btn.bind('<Button-1>', lambda e, t=toggle_category: t())
-                    
-                    # Dropzone-Effekte
-                    category_container.bind('<Enter>', 
-                        lambda e, f=category_container: self.highlight_dropzone(f, True))
-                    category_container.bind('<Leave>', 
-                        lambda e, f=category_container: self.highlight_dropzone(f, False))
-                
-                # Fensterhöhe anpassen
-                self.adjust_height()
-            
         except Exception as e:
             print(f"Fehler beim Erstellen der GUI: {e}")
 
@@ -270,6 +256,7 @@ class TodoApp:
             # Fenster verschieben
             self.title_bar.bind('<Button-1>', self.start_move)
             self.title_bar.bind('<B1-Motion>', self.on_move)
+            self.title_bar.bind('<ButtonRelease-1>', self.end_move)
             
             # Suche
             if hasattr(self, 'search_entry'):
@@ -299,94 +286,26 @@ class TodoApp:
     def save_categories(self):
         """Speichert die Kategorien in der Datei"""
         try:
-            with open(self.categories_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.categories))
+            content = '\n'.join(self.categories)
+            self.writer.schedule(self.categories_path,
+                                 lambda: atomic_write(self.categories_path, content))
         except Exception as e:
             print(f"Fehler beim Speichern der Kategorien: {e}")
 
     def load_todos(self):
-        """Lädt und zeigt die Todos an"""
+        """Lädt die Todos neu (falls die Dateien geändert wurden) und zeigt sie an"""
         try:
             # Todos laden
             self.todo_manager.load()
+            if hasattr(self, 'reminders'):
+                self.reminders.rebuild()
             
             # Warten bis GUI bereit ist
             if not hasattr(self, 'todo_frame'):
                 self.root.after(100, self.load_todos)
                 return
             
-            # GUI aktualisieren
-            for widget in self.todo_frame.winfo_children():
-                widget.destroy()
-            
-            # Todos nach Kategorien gruppieren
-            todos_by_category = {}
-            for todo in self.todo_manager.get_all():
-                # Stelle sicher, dass jedes Todo eine Kategorie hat
-                category = todo.get('category', 'Allgemein')
-                if not category or category not in self.categories:
-                    category = 'Allgemein'
-                    todo['category'] = category
-                
-                if category not in todos_by_category:
-                    todos_by_category[category] = []
-                todos_by_category[category].append(todo)
-            
-            # Alle Kategorien anzeigen
-            for category in sorted(self.categories):
-                # Container für diese Kategorie
-                category_container = ttk.Frame(self.todo_frame, style='DropZone.TFrame')
-                category_container.pack(fill=tk.X, pady=(5, 2))
-                category_container.category = category
-                
-                # Header-Frame für Kategorie
-                header_frame = ttk.Frame(category_container, style='CategoryHeader.TFrame')
-                header_frame.pack(fill=tk.X, padx=8, pady=1)
-                
-                # Expand/Collapse Button
-                expand_btn = ttk.Label(header_frame,
-                                    text="▼",
-                                    style='CategoryExpand.TLabel',
-                                    cursor="hand2")
-                expand_btn.pack(side=tk.LEFT, padx=(2, 5))
-                
-                # Kategorie-Label mit Anzahl
-                count = len(todos_by_category.get(category, []))
-                category_label = ttk.Label(header_frame,
-                                        text=f"{category} ({count})",
-                                        style='CategoryTitle.TLabel')
-                category_label.pack(side=tk.LEFT, fill=tk.X)
-                
-                # Container für Todos dieser Kategorie
-                todos_frame = ttk.Frame(category_container, style='Dark.TFrame')
-                todos_frame.pack(fill=tk.X, expand=True)
-                
-                # Todos anzeigen
-                if category in todos_by_category:
-                    # Sortiere Todos nach Priorität und Deadline
-                    sorted_todos = self._sort_by(todos_by_category[category])
-                    for todo in sorted_todos:
-                        todo_list.create_todo_item(self, todos_frame, todo)
-                
-                # Expand/Collapse Funktionalität
-                def toggle_category(frame=todos_frame, btn=expand_btn):
-                    if frame.winfo_viewable():
-                        frame.pack_forget()
-                        btn.configure(text="▶")
-                    else:
-                        frame.pack(fill=tk.X, expand=True)
-                        btn.configure(text="▼")
-                
-                expand_btn.bind('<Button-1>', lambda e, t=toggle_category: t())
-                
-                # Dropzone-Effekte
-                category_container.bind('<Enter>', 
-                    lambda e, f=category_container: self.highlight_dropzone(f, True))
-                category_container.bind('<Leave>', 
-                    lambda e, f=category_container: self.highlight_dropzone(f, False))
-            
-            # Fensterhöhe anpassen
-            self.adjust_height()
+            self.show_all_todos()
             
         except Exception as e:
             print(f"Fehler beim Laden der Todos: {e}")
@@ -403,11 +322,12 @@ class TodoApp:
                 # Auch die internen Einstellungen aktualisieren
                 self.settings.update(settings)
             
-            # Speichern
-            with open(self.settings_path, 'w', encoding='utf-8') as f:
-                for key, value in current_settings.items():
-                    f.write(f"{key}={value}\n")
-                
+            # Im Hintergrund speichern (mehrere Aufrufe kurz hintereinander
+            # werden zu einem Schreibvorgang zusammengefasst)
+            content = ''.join(f"{key}={value}\n" for key, value in current_settings.items())
+            self.writer.schedule(self.settings_path,
+                                 lambda: atomic_write(self.settings_path, content))
+            
         except Exception as e:
             print(f"Fehler beim Speichern der Einstellungen: {e}")
 
@@ -448,15 +368,12 @@ class TodoApp:
             # Fensterposition setzen
             self.root.geometry(f"{self.window_width}x{self.window_height}+{x}+{y}")
             
-            # Position in Einstellungen speichern
+            # Position übernehmen; gespeichert wird vom Aufrufer (nicht beim Start)
             self.settings['window_position'] = position
             if position == "custom":
                 self.settings['custom_x'] = x
                 self.settings['custom_y'] = y
             
-            # Einstellungen speichern
-            self.save_settings()
-            
         except Exception as e:
             print(f"Fehler beim Anwenden der Fensterposition: {e}")
 
@@ -468,30 +385,13 @@ class TodoApp:
             print(f"Fehler beim Anzeigen des Menüs: {e}")
 
     def sort_todos(self, sort_by):
-        """Sortiert die Todos nach verschiedenen Kriterien"""
+        """Wählt die Sortierung der Anzeige (die gespeicherten Daten bleiben unverändert)"""
         try:
-            todos = self.todo_manager.get_all()
-            
-            if sort_by == 'priority':
-                # Prioritätsreihenfolge: ▲ (hoch), ► (mittel), ▼ (niedrig)
-                priority_order = {'▲': 1, '►': 2, '▼': 3}
-                todos.sort(key=lambda x: priority_order.get(x.get('priority', '►'), 2))
-            
-            elif sort_by == 'deadline':
-                # Todos mit Deadline zuerst, dann nach Datum sortiert
-                def deadline_key(todo):
-                    if not todo.get('deadline'):
-                        return (1, '')  # Todos ohne Deadline ans Ende
-                    return (0, todo['deadline'])
-                todos.sort(key=deadline_key)
-            
-            elif sort_by == 'text':
-                # Alphabetisch nach Text sortieren
-                todos.sort(key=lambda x: x.get('text', '').lower())
-            
-            # Sortierte Liste speichern und anzeigen
-            self.todo_manager.todos = todos  # Aktualisiere die Liste direkt
-            self.todo_manager.save()  # Nutze die vorhandene save Methode
+            if sort_by not in view.SORT_ORDERS:
+                return
+            
+            # Nur die Einstellung merken und neu anzeigen
+            self.save_settings({'sort_order': sort_by})
             self.show_all_todos()
             
         except Exception as e:
@@ -500,36 +400,22 @@ class TodoApp:
     def filter_todos(self, filter_type):
         """Filtert die Todos nach Status"""
         try:
-            todos = self.todo_manager.get_all()
-            filtered_todos = []
-            
             if filter_type == 'open':
-                filtered_todos = [todo for todo in todos if not todo.get('completed', False)]
+                filtered_todos = self.todo_manager.get_by_completed(False)
             elif filter_type == 'completed':
-                filtered_todos = [todo for todo in todos if todo.get('completed', False)]
+                filtered_todos = self.todo_manager.get_by_completed(True)
             else:
-                filtered_todos = todos
-            
-            # GUI aktualisieren
-            for widget in self.todo_frame.winfo_children():
-                widget.destroy()
+                filtered_todos = self.todo_manager.get_all()
             
             # Gefilterte Todos anzeigen
-            for todo in self._sort_by(filtered_todos):
-                todo_list.create_todo_item(self, self.todo_frame, todo)
-            
-            self.adjust_height()
+            todo_list.render_todos(self, filtered_todos)
             
         except Exception as e:
             print(f"Fehler beim Filtern der Todos: {e}")
 
     def _sort_by(self, todos):
-        """Interne Sortiermethode für die Anzeige"""
-        # Standardsortierung: Nicht erledigte zuerst, dann nach Priorität
-        priority_order = {'▲': 1, '►': 2, '▼': 3}
-        return sorted(todos,
-                     key=lambda x: (x.get('completed', False),
-                                  priority_order.get(x.get('priority', '►'), 2)))
+        """Interne Sortiermethode für die Anzeige (gewählte Sortierung)"""
+        return view.sort_todos(todos, self.settings.get('sort_order'))
 
     def show_all_todos(self):
         """Zeigt alle Todos an"""
@@ -537,91 +423,14 @@ class TodoApp:
             if not hasattr(self, 'todo_frame'):
                 return
             
-            # GUI aktualisieren
-            for widget in self.todo_frame.winfo_children():
-                widget.destroy()
-            
-            # Todos nach Kategorien gruppieren
-            todos_by_category = {}
-            for todo in self.todo_manager.get_all():
-                category = todo.get('category', 'Allgemein')
-                if category not in todos_by_category:
-                    todos_by_category[category] = []
-                todos_by_category[category].append(todo)
-            
-            # Alle Kategorien anzeigen (auch leere)
-            for category in sorted(self.categories):
-                # Container für diese Kategorie
-                category_container = ttk.Frame(self.todo_frame, style='DropZone.TFrame')
-                category_container.pack(fill=tk.X, pady=(5, 2))
-                category_container.category = category
-                
-                # Header-Frame für Kategorie
-                header_frame = ttk.Frame(category_container, style='CategoryHeader.TFrame')
-                header_frame.pack(fill=tk.X, padx=8, pady=1)
-                
-                # Expand/Collapse Button
-                expand_btn = ttk.Label(header_frame,
-                                    text="▼",
-                                    style='CategoryExpand.TLabel',
-                                    cursor="hand2")
-                expand_btn.pack(side=tk.LEFT, padx=(2, 5))
-                
-                # Kategorie-Label mit Anzahl
-                count = len(todos_by_category.get(category, []))
-                category_label = ttk.Label(header_frame,
-                                        text=f"{category} ({count})",
-                                        style='CategoryTitle.TLabel')
-                category_label.pack(side=tk.LEFT, fill=tk.X)
-                
-                # Container für Todos dieser Kategorie
-                todos_frame = ttk.Frame(category_container, style='Dark.TFrame')
-                todos_frame.pack(fill=tk.X, expand=True)
-                
-                # Todos anzeigen
-                if category in todos_by_category:
-                    for todo in self._sort_by(todos_by_category[category]):
-                        todo_list.create_todo_item(self, todos_frame, todo)
-                
-                # Expand/Collapse Funktionalität
-                def toggle_category(frame=todos_frame, btn=expand_btn):
-                    if frame.winfo_viewable():
-                        frame.pack_forget()
-                        btn.configure(text="▶")
-                    else:
-                        frame.pack(fill=tk.X, expand=True)
-                        btn.configure(text="▼")
-                
-                expand_btn.bind('<Button-1>', lambda e, t=toggle_category: t())
-                
-                # Dropzone-Effekte
-                category_container.bind('<Enter>', 
-                    lambda e, f=category_container: self.highlight_dropzone(f, True))
-                category_container.bind('<Leave>', 
-                    lambda e, f=category_container: self.highlight_dropzone(f, False))
-            
-            # Fensterhöhe anpassen
-            self.adjust_height()
+            todo_list.render_categories(self, self.todo_manager.get_all())
             
         except Exception as e:
             print(f"Fehler beim Anzeigen der Todos: {e}")
 
-    def _is_overdue(self, deadline):
-        """Prüft, ob eine Deadline überschritten ist"""
-        if not deadline:
-            return False
-        try:
-            # Versuche zuerst mit Uhrzeit zu parsen
-            try:
-                deadline_date = datetime.strptime(deadline, "%d.%m.%Y %H:%M")
-            except ValueError:
-                # Wenn keine Uhrzeit, dann nur Datum mit 23:59 als Zeit
-                deadline_date = datetime.strptime(deadline, "%d.%m.%Y")
-                deadline_date = deadline_date.replace(hour=23, minute=59)
-            
-            return deadline_date < datetime.now()
-        except:
-            return False
+    def _is_overdue(self, todo):
+        """Prüft, ob die Deadline eines Todos überschritten ist"""
+        return is_overdue(todo.deadline_ts)
 
     def start_drag(self, event, frame):
         """Startet das Drag & Drop einer Aufgabe"""
@@ -630,7 +439,8 @@ class TodoApp:
                 'x': event.x_root,
                 'y': event.y_root,
                 'frame': frame,
-                'original_style': frame.cget('style')  # Speichere den originalen Style
+                'original_style': frame.cget('style'),  # Speichere den originalen Style
+                'slot': self._pack_slot(frame)  # Platz in der Liste für das Zurücksetzen
             }
             frame.configure(style='TodoModernHover.TFrame')
         except Exception as e:
@@ -644,11 +454,12 @@ class TodoApp:
                 dx = event.x_root - self.drag_data['x']
                 dy = event.y_root - self.drag_data['y']
                 
-                # Bewege das Frame
+                # Bewege das Frame (Zeilen der virtuellen Liste bleiben stehen)
                 frame = self.drag_data['frame']
-                x = frame.winfo_x() + dx
-                y = frame.winfo_y() + dy
-                frame.place(x=x, y=y)
+                if not getattr(frame, 'virtual', False):
+                    x = frame.winfo_x() + dx
+                    y = frame.winfo_y() + dy
+                    frame.place(x=x, y=y)
                 
                 # Aktualisiere die Position
                 self.drag_data['x'] = event.x_root
@@ -668,11 +479,17 @@ class TodoApp:
                 
                 # Setze den ursprünglichen Style zurück
                 frame.configure(style=original_style)
-                frame.pack(fill=tk.X, pady=3, padx=8)  # Zurück zum normalen Layout
+                if not getattr(frame, 'virtual', False) and frame.winfo_manager() == 'place':
+                    # Zurück an den ursprünglichen Platz im normalen Layout
+                    options, before = self.drag_data['slot']
+                    if before is not None and before.winfo_exists():
+                        frame.pack(before=before, **options)
+                    else:
+                        frame.pack(**options)
                 
                 # Führe Drop-Aktion aus wenn über einer Kategorie
                 if hasattr(self, 'current_dropzone'):
-                    self.drop_todo(frame.todo_index, self.current_dropzone.category)
+                    self.drop_todo(frame.todo_id, self.current_dropzone.category)
                     delattr(self, 'current_dropzone')
                 
                 # Cleanup
@@ -680,6 +497,21 @@ class TodoApp:
         except Exception as e:
             print(f"Fehler beim Beenden des Drag & Drop: {e}")
 
+    def _pack_slot(self, frame):
+        """Gibt Pack-Optionen und nachfolgendes Geschwister-Widget eines Frames zurück
+        
+        ``place()`` nimmt das Frame während des Ziehens aus dem Pack-Layout;
+        damit es danach wieder an derselben Stelle steht (und die Reihenfolge
+        zur Liste passt), wird es vor seinem bisherigen Nachfolger eingepackt.
+        """
+        if frame.winfo_manager() != 'pack':
+            return {'fill': tk.X, 'pady': 3, 'padx': 8}, None
+        options = {key: value for key, value in frame.pack_info().items() if key != 'in'}
+        slaves = frame.master.pack_slaves()
+        position = slaves.index(frame)
+        before = slaves[position + 1] if position + 1 < len(slaves) else None
+        return options, before
+
     def find_dropzone(self, event):
         """Findet mögliche Dropzones während des Drag & Drop"""
         try:
@@ -703,13 +535,11 @@ class TodoApp:
         except Exception as e:
             print(f"Fehler beim Suchen der Dropzone: {e}")
 
-    def drop_todo(self, todo_index, new_category):
+    def drop_todo(self, todo_id, new_category):
         """Verschiebt ein Todo in eine neue Kategorie"""
         try:
-            todos = self.todo_manager.get_all()
-            if 0 <= todo_index < len(todos):
-                todos[todo_index]['category'] = new_category
-                self.todo_manager.save()
+            if self.todo_manager.get(todo_id) is not None:
+                self.todo_manager.update_by_id(todo_id, {'category': new_category})
                 self.show_all_todos()
         except Exception as e:
             print(f"Fehler beim Verschieben des Todos: {e}")
@@ -825,7 +655,8 @@ class TodoApp:
                     'deadline': deadline,
                     'completed': False
                 }
-                self.todo_manager.add(todo)
+                todo_id = self.todo_manager.add(todo)
+                self.reminders.update(todo_id)
                 self.show_all_todos()
                 dialog.destroy()
             else:
@@ -855,22 +686,13 @@ class TodoApp:
             icon='warning'
         )
 
-    def toggle_todo_completed(self, index):
+    def toggle_todo_completed(self, todo_id):
         """Ändert den Completed-Status eines Todos"""
         try:
-            # Hole das Todo
-            todos = self.todo_manager.get_all()
-            if 0 <= index < len(todos):
-                todo = todos[index]
-                
-                # Ändere den Status
-                todo['completed'] = not todo.get('completed', False)
-                
-                # Aktualisiere das Todo
-                self.todo_manager.update(index, todo)
-                
-                # Speichere die Änderungen
-                self.todo_manager.save()
+            if self.todo_manager.get(todo_id) is not None:
+                # Ändere den Status (wird im Journal protokolliert)
+                self.todo_manager.toggle_completed_by_id(todo_id)
+                self.reminders.update(todo_id)
                 
                 # GUI nur bei Bedarf aktualisieren
                 # self.show_all_todos()  # Diese Zeile auskommentieren
@@ -945,11 +767,8 @@ class TodoApp:
                 if messagebox.askyesno("Bestätigen", 
                                     f"Möchten Sie die Kategorie '{category}' wirklich löschen?"):
                     # Todos in dieser Kategorie nach 'Allgemein' verschieben
-                    todos = self.todo_manager.get_all()
-                    for i, todo in enumerate(todos):
-                        if todo.get('category') == category:
-                            todo['category'] = 'Allgemein'
-                            self.todo_manager.update(i, todo)
+                    for todo in self.todo_manager.get_by_category(category):
+                        self.todo_manager.update_by_id(todo['id'], {'category': 'Allgemein'})
                     
                     self.categories.remove(category)
                     self.save_categories()
@@ -974,20 +793,11 @@ class TodoApp:
     def filter_by_category(self, category):
         """Filtert Todos nach Kategorie"""
         todos = self.todo_manager.get_by_category(category)
-        
-        # GUI aktualisieren
-        for widget in self.todo_frame.winfo_children():
-            widget.destroy()
-        
-        for todo in self._sort_by(todos):
-            todo_list.create_todo_item(self, self.todo_frame, todo)
-        
-        self.adjust_height()  # Am Ende der Methode hinzufügen
+        todo_list.render_todos(self, todos)
 
     def count_todos_in_category(self, category):
         """Zählt die Todos in einer Kategorie"""
-        return len([todo for todo in self.todo_manager.get_all() 
-                   if todo.get('category', 'Allgemein') == category])
+        return self.todo_manager.count_by_category(category)
 
     def highlight_dropzone(self, frame, highlight):
         """Hebt eine potenzielle Dropzone hervor"""
@@ -1013,17 +823,10 @@ class TodoApp:
         self.root.geometry(f"{self.window_width}x{self.window_height}+{x}+{y}")
 
     def on_search(self, event=None):
-        """Sucht in den Todos"""
-        query = self.search_entry.get().strip()
-        if query:
-            results = self.todo_manager.search(query)
-            # Ergebnisse anzeigen
-            for widget in self.todo_frame.winfo_children():
-                widget.destroy()
-            for todo in self._sort_by(results):
-                todo_list.create_todo_item(self, self.todo_frame, todo)
-        else:
-            self.show_all_todos()
+        """Sucht in den Todos (entprellt, siehe SearchController)"""
+        if not hasattr(self, 'search_controller'):
+            self.search_controller = SearchController(self)
+        self.search_controller.on_key(event)
 
     def start_move(self, event):
         """Startet das Verschieben des Fensters"""
@@ -1033,22 +836,37 @@ class TodoApp:
         }
 
     def on_move(self, event):
-        """Bewegt das Fenster"""
+        """Merkt sich die neue Fensterposition (angewendet höchstens einmal pro Frame)"""
         if hasattr(self, '_drag_data'):
-            x = event.x_root - self._drag_data['x']
-            y = event.y_root - self._drag_data['y']
+            self._move_target = (event.x_root - self._drag_data['x'],
+                                 event.y_root - self._drag_data['y'])
+            if self._move_job is None:
+                self._move_job = self.root.after(MOVE_FRAME_MS, self._apply_move)
+
+    def _apply_move(self):
+        """Verschiebt das Fenster an die zuletzt gemerkte Position"""
+        self._move_job = None
+        if self._move_target is not None:
+            x, y = self._move_target
             self.root.geometry(f"+{x}+{y}")
-            
-            # Position als 'custom' speichern
-            self.settings['window_position'] = 'custom'
-            self.settings['custom_x'] = x
-            self.settings['custom_y'] = y
-            self.save_settings()
 
-    def edit_todo(self, index):
+    def end_move(self, event):
+        """Beendet das Verschieben und speichert die Position einmalig"""
+        if self._move_job is not None:
+            self.root.after_cancel(self._move_job)
+            self._apply_move()
+        if self._move_target is None:
+            return  # Nur geklickt, nicht verschoben
+        x, y = self._move_target
+        self._move_target = None
+        
+        # Position als 'custom' speichern
+        self.save_settings({'window_position': 'custom', 'custom_x': x, 'custom_y': y})
+
+    def edit_todo(self, todo_id):
         """Bearbeitet ein bestehendes Todo"""
         try:
-            todo = self.todo_manager.get_all()[index]
+            todo = self.todo_manager.get(todo_id)
             dialog, main_frame = self.create_dialog("Aufgabe bearbeiten")
             
             # Text
@@ -1152,7 +970,8 @@ class TodoApp:
                         'completed': todo.get('completed', False)
                     }
                     
-                    self.todo_manager.update(index, updated_todo)
+                    self.todo_manager.update_by_id(todo_id, updated_todo)
+                    self.reminders.update(todo_id)
                     self.show_all_todos()
                     dialog.destroy()
                 else:
@@ -1181,6 +1000,12 @@ class TodoApp:
         """Beendet die Anwendung"""
         if messagebox.askyesno("Beenden", "Möchten Sie die Anwendung wirklich beenden?"):
             self.save_settings()
+            
+            self.reminders.stop()
+            
+            # Ausstehende Schreibvorgänge abschließen
+            self.todo_manager.close()
+            self.writer.close()
             self.root.destroy()
 
     def change_theme(self, theme='dark'):
@@ -1259,15 +1084,37 @@ class TodoApp:
             self.apply_window_position('br')
 
     def check_for_updates(self):
-        """Prüft auf verfügbare Updates"""
+        """Prüft im Hintergrund auf verfügbare Updates"""
+        try:
+            self.updater.start_check()
+            # Ergebnis abholen, spätestens nach dem Zeitlimit aufgeben
+            deadline = time.monotonic() + self.updater.timeout * 2
+            if self.update_poll_job is None:
+                self.update_poll_job = self.root.after(
+                    100, lambda: self._poll_update_check(deadline))
+        except Exception as e:
+            print(f"Fehler beim Update-Check: {e}")
+
+    def _poll_update_check(self, deadline):
+        """Übernimmt das Ergebnis der Update-Prüfung in den Tk-Thread"""
+        self.update_poll_job = None
+        try:
+            has_update, new_version = self.updater.results.get_nowait()
+        except queue.Empty:
+            if time.monotonic() < deadline:
+                self.update_poll_job = self.root.after(
+                    100, lambda: self._poll_update_check(deadline))
+            else:
+                print("Update-Check abgebrochen: Zeitlimit überschritten")
+            return
+        
         try:
-            has_update, new_version = self.updater.check_for_updates()
             if has_update:
                 if messagebox.askyesno(
                     "Update verfügbar",
                     f"Version {new_version} ist verfügbar. Jetzt installieren?"
                 ):
-                    self.updater.download_and_install_update()
+                    show_update_download(self)
         except Exception as e:
             print(f"Fehler beim Update-Check: {e}")
 
@@ -1356,6 +1203,17 @@ class TodoApp:
         except Exception as e:
             print(f"Fehler beim Aktualisieren der GUI-Texte: {e}")
 
+    def on_reminder(self, todo):
+        """Wird vom ReminderScheduler für ein fälliges Todo aufgerufen"""
+        try:
+            # Der Wert kommt nach einem Neustart als Text aus settings.txt
+            if str(self.settings.get('notifications_enabled', True)) == 'False':
+                return
+            self.play_notification_sound()
+            show_reminder(self, todo)
+        except Exception as e:
+            print(f"Fehler beim Anzeigen der Erinnerung: {e}")
+
     def play_notification_sound(self):
         """Spielt den ausgewählten Benachrichtigungston ab"""
         try:
@@ -1366,16 +1224,10 @@ class TodoApp:
             if sound_id == 'mute':
                 return
             
-            # Hier können Sie die tatsächlichen Sounddateien einbinden
-            # Beispiel mit winsound unter Windows:
-            if sys.platform == "win32":
-                import winsound
-                frequency = {
-                    'sound1': 1000,
-                    'sound2': 800,
-                    'sound3': 600
-                }.get(sound_id, 1000)
-                winsound.Beep(frequency, 200)
+            # Abspielen im Hintergrund, blockiert den Tk-Thread nicht
+            if self.audio is None:
+                self.audio = NotificationPlayer()
+            self.audio.play(sound_id)
             
         except Exception as e:
             print(f"Fehler beim Abspielen des Benachrichtigungstons: {e}")
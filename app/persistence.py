@@ -0,0 +1,173 @@
+import os
+import atexit
+import hashlib
+import threading
+import time
+
+def atomic_write(path, data, encoding='utf-8'):
+    """Schreibt eine Datei atomar (temporäre Datei, fsync, os.replace)
+
+    Ein Absturz während des Schreibens hinterlässt entweder die alte oder
+    die neue Datei, aber nie eine abgeschnittene.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding=encoding) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+class WriteBehindWriter:
+    """Führt Schreibaufträge gebündelt in einem Hintergrund-Thread aus
+
+    Aufträge werden unter einem Schlüssel (z.B. dem Dateipfad) eingeplant.
+    Wird derselbe Schlüssel mehrfach eingeplant, bevor der Auftrag lief,
+    ersetzt der neue Auftrag den alten. Alle Aufträge, die innerhalb von
+    ``delay`` Sekunden nach dem ersten eintreffen, werden gemeinsam
+    ausgeführt. Der Tk-Thread wartet so nie auf die Festplatte.
+    """
+
+    def __init__(self, delay=0.3):
+        self.delay = delay
+        self._pending = {}  # Schlüssel -> Auftrag
+        self._due = None    # Zeitpunkt, zu dem die Aufträge fällig sind
+        self._busy = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def schedule(self, key, task):
+        """Plant einen Auftrag ein (ersetzt einen wartenden mit gleichem Schlüssel)"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("WriteBehindWriter wurde bereits geschlossen")
+            if not self._pending:
+                self._due = time.monotonic() + self.delay
+            self._pending[key] = task
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='WriteBehindWriter',
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def is_pending(self, key=None):
+        """Prüft, ob (bestimmte) Aufträge noch ausstehen"""
+        with self._cond:
+            if key is None:
+                return bool(self._pending) or self._busy
+            return key in self._pending
+
+    def flush(self, timeout=None):
+        """Führt alle wartenden Aufträge sofort aus und wartet auf deren Ende"""
+        if self._thread is threading.current_thread():
+            return True  # Aufruf aus einem Auftrag heraus
+        with self._cond:
+            self._due = time.monotonic()
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._busy,
+                                       timeout)
+
+    def close(self, timeout=None):
+        """Schreibt alle ausstehenden Aufträge und beendet den Thread"""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _run(self):
+        """Hauptschleife des Hintergrund-Threads"""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pending:
+                        remaining = self._due - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if not self._pending:
+                    self._thread = None
+                    return
+                tasks = list(self._pending.values())
+                self._pending = {}
+                self._busy = True
+
+            for task in tasks:
+                try:
+                    task()
+                except Exception as e:
+                    print(f"Fehler beim Speichern im Hintergrund: {e}")
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+class FileFingerprint:
+    """Merkmale einer Datei, um Änderungen ohne erneutes Parsen zu erkennen
+
+    Verglichen werden Änderungszeit und Größe, optional zusätzlich ein
+    SHA-256 über den Inhalt. Die letzten Bytes werden mitgespeichert, damit
+    ein reines Anhängen (die alte Datei ist unverändert Präfix der neuen)
+    erkannt werden kann.
+    """
+
+    __slots__ = ('mtime_ns', 'size', 'digest', 'tail')
+
+    TAIL_BYTES = 64
+
+    def __init__(self, mtime_ns, size, digest, tail):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.tail = tail
+
+    @classmethod
+    def of(cls, path, with_hash=False):
+        """Ermittelt den Fingerabdruck einer Datei (None, wenn sie fehlt)"""
+        try:
+            stat = os.stat(path)
+            with open(path, 'rb') as f:
+                digest = None
+                if with_hash:
+                    digest = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+                    digest = digest.digest()
+                f.seek(max(0, stat.st_size - cls.TAIL_BYTES))
+                tail = f.read(cls.TAIL_BYTES)
+        except FileNotFoundError:
+            return None
+        return cls(stat.st_mtime_ns, stat.st_size, digest, tail)
+
+    def same_as(self, other):
+        """Prüft, ob sich die Datei seit dem anderen Fingerabdruck nicht geändert hat"""
+        return (other is not None and
+                self.mtime_ns == other.mtime_ns and
+                self.size == other.size and
+                (self.digest is None or other.digest is None or
+                 self.digest == other.digest))
+
+    def is_append_to(self, old, path):
+        """Prüft, ob die Datei nur um Daten am Ende von ``old`` gewachsen ist"""
+        if old is None or self.size <= old.size:
+            return False
+        try:
+            with open(path, 'rb') as f:
+                if old.digest is not None:
+                    digest = hashlib.sha256()
+                    remaining = old.size
+                    while remaining:
+                        chunk = f.read(min(remaining, 1024 * 1024))
+                        if not chunk:
+                            return False
+                        digest.update(chunk)
+                        remaining -= len(chunk)
+                    if digest.digest() != old.digest:
+                        return False
+                f.seek(max(0, old.size - self.TAIL_BYTES))
+                return f.read(len(old.tail)) == old.tail
+        except FileNotFoundError:
+            return False
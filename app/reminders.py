@@ -0,0 +1,210 @@
+import heapq
+import itertools
+import time
+
+# Standard-Vorlaufzeiten (Minuten vor der Deadline)
+DEFAULT_LEAD_MINUTES = (15, 0)
+
+# Standard-Dauer für "Später erinnern" (Minuten)
+DEFAULT_SNOOZE_MINUTES = 10
+
+# Deadlines werden in Fenstern dieser Länge aus dem Deadline-Index
+# geladen (Sekunden), weiter entfernte erst bei Bedarf
+WINDOW_SECONDS = 24 * 60 * 60
+
+# Längste Wartezeit für einen einzelnen after()-Aufruf (ms); weiter
+# entfernte Erinnerungen werden in Etappen angesteuert
+MAX_AFTER_MS = 6 * 60 * 60 * 1000
+
+def parse_lead_minutes(value):
+    """Wandelt z.B. ``"15,0"`` in ein Tupel von Vorlaufzeiten um"""
+    try:
+        minutes = {int(part) for part in str(value).split(',') if part.strip()}
+        return tuple(sorted((m for m in minutes if m >= 0), reverse=True)) or (0,)
+    except ValueError:
+        return DEFAULT_LEAD_MINUTES
+
+class ReminderScheduler:
+    """Erinnert an anstehende Deadlines
+
+    Alle anstehenden Erinnerungen liegen in einem Min-Heap aus
+    ``(Zeitpunkt, Nummer, ID, Version, Vorlaufzeiten)``. Es ist immer nur ein
+    einziger ``after``-Aufruf für die nächste Erinnerung aktiv. Ändert
+    sich ein Todo, wird seine Versionsnummer erhöht und es werden neue
+    Einträge eingefügt (O(log n)); veraltete Einträge bleiben liegen und
+    werden beim Erreichen der Heap-Spitze verworfen bzw. bei zu vielen
+    Altlasten in einem Durchgang entfernt.
+
+    Der Heap enthält nur Todos, deren Deadline vor ``horizon`` liegt; das
+    Fenster wird über den sortierten Deadline-Index des Datenmanagers
+    weitergeschoben, bevor die erste Erinnerung dahinter fällig werden kann.
+
+    ``root`` muss ``after`` und ``after_cancel`` bieten, ``clock`` liefert
+    die aktuelle Zeit in Sekunden (beides austauschbar, z.B. für Tests).
+    """
+
+    def __init__(self, root, todo_manager, on_due, lead_minutes=DEFAULT_LEAD_MINUTES,
+                 clock=time.time):
+        self.root = root
+        self.todo_manager = todo_manager
+        self.on_due = on_due
+        self.leads = tuple(minutes * 60 for minutes in lead_minutes)
+        self.max_lead = max(self.leads, default=0)
+        self.clock = clock
+        self._heap = []
+        self._counter = itertools.count()
+        self._versions = {}   # ID -> aktuelle Version
+        self._live = {}       # ID -> Anzahl gültiger Heap-Einträge
+        self._fired = {}      # ID -> (Deadline, bereits ausgelöste Vorlaufzeiten)
+        self._stale = 0       # Anzahl veralteter Heap-Einträge
+        self.horizon = 0      # Deadlines ab hier sind noch nicht geladen
+        self._job = None
+        self._armed_at = None  # Zeitpunkt, für den der after-Aufruf aktiv ist
+
+    def rebuild(self):
+        """Plant alle Erinnerungen neu ein (z.B. nach dem Laden)"""
+        now = self.clock()
+        self._heap = []
+        self._versions = {}
+        self._live = {}
+        self._stale = 0
+        self.horizon = now
+        self._load_window(now)
+        self._fired = {todo_id: fired for todo_id, fired in self._fired.items()
+                       if todo_id in self._versions}
+        self._arm()
+
+    def _load_window(self, now):
+        """Lädt die Deadlines des nächsten Fensters in den Heap"""
+        start = self.horizon
+        self.horizon = now + self.max_lead + WINDOW_SECONDS
+        for todo in self.todo_manager.get_due_between(start, self.horizon):
+            version = next(self._counter)
+            self._versions[todo.id] = version
+            self._live[todo.id] = self._push(todo, version, now, heap_push=False)
+        heapq.heapify(self._heap)
+
+    def update(self, todo_id):
+        """Plant die Erinnerungen eines Todos nach einer Änderung neu ein
+
+        Für neue, bearbeitete, erledigte und gelöschte Todos aufzurufen.
+        """
+        version = next(self._counter)  # Nie wiederverwendet, auch nach dem Löschen
+        self._versions[todo_id] = version
+        self._stale += self._live.pop(todo_id, 0)
+
+        todo = self.todo_manager.get(todo_id)
+        if (todo is not None and not todo.completed and todo.deadline_ts is not None
+                and todo.deadline_ts < self.horizon):
+            self._live[todo_id] = self._push(todo, version, self.clock())
+        else:
+            self._versions.pop(todo_id, None)
+            self._fired.pop(todo_id, None)
+
+        if self._stale > len(self._heap) // 2 + 64:
+            self._compact()
+        self._arm()
+
+    def snooze(self, todo_id, minutes=DEFAULT_SNOOZE_MINUTES):
+        """Erinnert nach ``minutes`` Minuten erneut an ein Todo"""
+        version = self._versions.get(todo_id)
+        if version is None:
+            return
+        heapq.heappush(self._heap, (self.clock() + minutes * 60, next(self._counter),
+                                    todo_id, version, None))
+        self._live[todo_id] = self._live.get(todo_id, 0) + 1
+        self._arm()
+
+    def stop(self):
+        """Bricht den geplanten after-Aufruf ab"""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+            self._armed_at = None
+
+    def _push(self, todo, version, now, heap_push=True):
+        """Fügt die Erinnerungen eines Todos ein und gibt deren Anzahl zurück
+
+        Bereits ausgelöste Vorlaufzeiten werden nicht wiederholt, solange
+        sich die Deadline nicht ändert. Ist eine Vorlaufzeit schon
+        verstrichen, die Deadline selbst aber noch nicht, wird einmal
+        sofort erinnert.
+        """
+        deadline = todo.deadline_ts
+        if deadline <= now:
+            return 0
+        fired_deadline, fired = self._fired.get(todo.id, (None, ()))
+        if fired_deadline != deadline:
+            fired = ()
+            self._fired.pop(todo.id, None)
+
+        due_times = {}
+        for lead in self.leads:
+            if lead not in fired:
+                due = max(deadline - lead, now)
+                due_times[due] = due_times.get(due, ()) + (lead,)
+
+        add = heapq.heappush if heap_push else (lambda heap, entry: heap.append(entry))
+        for due, leads in due_times.items():
+            add(self._heap, (due, next(self._counter), todo.id, version, leads))
+        return len(due_times)
+
+    def _is_valid(self, entry):
+        return self._versions.get(entry[2]) == entry[3]
+
+    def _compact(self):
+        """Entfernt alle veralteten Einträge aus dem Heap"""
+        self._heap = [entry for entry in self._heap if self._is_valid(entry)]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def _arm(self):
+        """Stellt sicher, dass genau ein after-Aufruf für die nächste Erinnerung aktiv ist"""
+        heap = self._heap
+        while heap and not self._is_valid(heap[0]):
+            heapq.heappop(heap)
+            self._stale -= 1
+
+        # Spätestens aufwachen, bevor Erinnerungen jenseits des Fensters fällig werden
+        due = self.horizon - self.max_lead
+        if heap and heap[0][0] < due:
+            due = heap[0][0]
+        if due == self._armed_at:
+            return  # Bereits für diesen Zeitpunkt geplant
+        self.stop()
+        delay = min(MAX_AFTER_MS, max(0, int((due - self.clock()) * 1000)))
+        self._armed_at = due
+        self._job = self.root.after(delay, self._fire)
+
+    def _fire(self):
+        """Löst alle fälligen Erinnerungen aus und plant die nächste ein"""
+        self._job = None
+        self._armed_at = None
+        now = self.clock()
+        if now >= self.horizon - self.max_lead:
+            self._load_window(now)
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, todo_id, version, leads = heapq.heappop(heap)
+            if self._versions.get(todo_id) != version:
+                self._stale -= 1
+                continue
+            self._live[todo_id] -= 1
+            todo = self.todo_manager.get(todo_id)
+            if todo is None:
+                continue
+            if leads is not None:  # None: Erinnerung nach "Später erinnern"
+                fired_deadline, fired = self._fired.get(todo_id, (None, ()))
+                if fired_deadline != todo.deadline_ts:
+                    fired = ()
+                self._fired[todo_id] = (todo.deadline_ts, fired + leads)
+            if todo not in due:
+                due.append(todo)
+
+        for todo in due:
+            try:
+                self.on_due(todo)
+            except Exception as e:
+                print(f"Fehler bei der Erinnerung: {e}")
+        self._arm()
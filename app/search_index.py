@@ -0,0 +1,110 @@
+import re
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Länge der Zeichenfolgen (N-Gramme), über die die Wörter indiziert werden
+NGRAM = 3
+
+def ngrams(text):
+    """Gibt alle Zeichenfolgen der Länge ``NGRAM`` eines Textes zurück"""
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+class SearchIndex:
+    """Invertierter Index für die Suche in Text und Kategorie der Todos
+
+    Ein Todo passt, wenn die kleingeschriebene Anfrage als Teilstring im
+    Text oder in der Kategorie vorkommt (wie bei der linearen Suche und
+    ``SQLiteTodoManager.search``). Jedes Wort verweist auf die IDs der
+    Todos, in denen es vorkommt, und ist zusätzlich über seine
+    Dreiergruppen auffindbar. Das längste Wortstück der Anfrage muss in
+    einem Wort des Todos enthalten sein; nur die Todos dieser Wörter
+    werden anschließend einzeln geprüft. Verlängert eine Anfrage die
+    vorherige (Tippen im Suchfeld), wird nur deren Ergebnis weiter gefiltert.
+    """
+
+    def __init__(self):
+        self._postings = {}     # Wort -> {ID: None}
+        self._grams = {}        # N-Gramm -> {Wort}
+        self._docs = {}         # ID -> (Text, Kategorie), kleingeschrieben
+        self._last_query = None
+        self._last_result = None
+
+    @staticmethod
+    def _tokens(doc):
+        """Gibt die Wörter aus Text und Kategorie zurück"""
+        return set(TOKEN_RE.findall(doc[0])) | set(TOKEN_RE.findall(doc[1]))
+
+    def add(self, todo):
+        """Nimmt ein Todo in den Index auf"""
+        doc = self._docs[todo.id] = (todo.text.lower(), todo.category.lower())
+        for token in self._tokens(doc):
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = {}
+                for gram in ngrams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            ids[todo.id] = None
+        self._last_query = None
+
+    def remove(self, todo_id):
+        """Entfernt ein Todo aus dem Index"""
+        doc = self._docs.pop(todo_id, None)
+        if doc is not None:
+            for token in self._tokens(doc):
+                ids = self._postings[token]
+                del ids[todo_id]
+                if not ids:
+                    del self._postings[token]
+                    for gram in ngrams(token):
+                        tokens = self._grams[gram]
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._grams[gram]
+        self._last_query = None
+
+    def _words_containing(self, piece):
+        """Gibt alle Wörter des Index zurück, die ``piece`` enthalten"""
+        words = self._postings
+        for gram in ngrams(piece):
+            tokens = self._grams.get(gram)
+            if not tokens:
+                return []
+            if len(tokens) < len(words):
+                words = tokens  # Seltenste Dreiergruppe
+        return [word for word in words if piece in word]
+
+    def _candidates(self, query):
+        """Gibt die IDs der Todos zurück, die die Anfrage enthalten können"""
+        pieces = TOKEN_RE.findall(query)
+        if not pieces:
+            return self._docs  # Nur Satz- bzw. Leerzeichen: alle prüfen
+        words = self._words_containing(max(pieces, key=len))
+        if len(words) == 1:
+            return self._postings[words[0]]
+        ids = set()
+        for word in words:
+            ids.update(self._postings[word])
+        return ids
+
+    def _filter(self, ids, query):
+        """Gibt die IDs zurück, deren Text oder Kategorie die Anfrage enthält"""
+        docs = self._docs
+        return {todo_id for todo_id in ids
+                if query in docs[todo_id][0] or query in docs[todo_id][1]}
+
+    def search(self, query):
+        """Gibt die IDs der passenden Todos zurück (None bei leerer Anfrage)"""
+        query = query.lower()
+        if not query:
+            return None
+
+        last_query, last_result = self._last_query, self._last_result
+        if last_query and last_query in query:
+            # Anfrage wurde nur verlängert: vorheriges Ergebnis eingrenzen
+            candidates = last_result
+        else:
+            candidates = self._candidates(query)
+        result = self._filter(candidates, query)
+
+        self._last_query, self._last_result = query, result
+        return result
@@ -0,0 +1,384 @@
+import os
+import csv
+import sqlite3
+import threading
+import time
+
+from app.deadline import day_range
+from app.search_index import SearchIndex
+from app.todo_item import TodoItem
+from app.todo_manager import TodoManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS todos (
+    id          INTEGER PRIMARY KEY,
+    position    INTEGER NOT NULL,
+    text        TEXT    NOT NULL,
+    category    TEXT    NOT NULL DEFAULT 'Allgemein',
+    priority    TEXT    NOT NULL DEFAULT '►',
+    deadline    TEXT    NOT NULL DEFAULT '',
+    deadline_ts INTEGER,
+    completed   INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_todos_category ON todos (category);
+CREATE INDEX IF NOT EXISTS idx_todos_priority ON todos (priority);
+CREATE INDEX IF NOT EXISTS idx_todos_completed ON todos (completed);
+CREATE INDEX IF NOT EXISTS idx_todos_deadline_ts ON todos (deadline_ts);
+CREATE INDEX IF NOT EXISTS idx_todos_position ON todos (position);
+"""
+
+COLUMNS = 'id, text, category, priority, deadline, completed'
+
+# Wert von PRAGMA user_version, sobald todos.txt übernommen wurde
+MIGRATED_VERSION = 1
+
+class SQLiteTodoManager:
+    """SQLite-basierte Variante des TodoManagers
+
+    Bietet dieselbe Schnittstelle wie ``TodoManager``, schreibt aber jede
+    Änderung als einzelne Transaktion und filtert über Indizes statt die
+    komplette Datei zu parsen. Die Todos werden zusätzlich im Speicher
+    gehalten, damit ``get_all()`` für die Anzeige keine Abfrage benötigt.
+    """
+
+    def __init__(self, storage_path='todos.db'):
+        """Initialisiert den SQLiteTodoManager"""
+        self.todos = []
+        self._by_id = {}
+        self.storage_path = storage_path
+        self._lock = threading.RLock()
+        self._data_version = None  # Ändert sich nur durch fremde Verbindungen
+        self._search_index = None  # Wird bei der ersten Suche aufgebaut
+        self._positions = None     # ID -> Position in self.todos (für Suchergebnisse)
+        self.conn = sqlite3.connect(storage_path, check_same_thread=False)
+        # WAL: Transaktionen blockieren nicht auf einem fsync pro Änderung
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self.load()
+
+    def _row_to_todo(self, row):
+        """Wandelt eine Datenbankzeile in ein Todo um"""
+        return TodoItem(row[1], row[2], row[3], row[4], row[5], row[0])
+
+    def _row_values(self, todo):
+        """Gibt die Spaltenwerte eines Todos zurück"""
+        return (todo.text, todo.category, todo.priority, todo.deadline,
+                todo.deadline_ts, 1 if todo.completed else 0)
+
+    def _lookup(self, sql, params=()):
+        """Führt eine ID-Abfrage aus und gibt die zugehörigen Todos zurück"""
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+            return [self._by_id[row[0]] for row in rows if row[0] in self._by_id]
+
+    def load(self):
+        """Lädt alle Todos aus der Datenbank (nur wenn sie extern geändert wurde)"""
+        try:
+            with self._lock:
+                data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self._data_version:
+                    return
+                self._data_version = data_version
+                rows = self.conn.execute(
+                    f"SELECT {COLUMNS} FROM todos ORDER BY position, id").fetchall()
+                self.todos = [self._row_to_todo(row) for row in rows]
+                self._by_id = {todo.id: todo for todo in self.todos}
+                self._reset_search()
+        except Exception as e:
+            print(f"Fehler beim Laden der Todos: {e}")
+            self.todos = []
+            self._by_id = {}
+            self._data_version = None
+            self._reset_search()
+
+    def save(self):
+        """Speichert Reihenfolge und Inhalt aller Todos in einer Transaktion"""
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM todos")
+                self.todos = [TodoItem.from_dict(todo) for todo in self.todos]
+                for position, todo in enumerate(self.todos):
+                    cursor = self.conn.execute(
+                        "INSERT INTO todos (id, position, text, category, priority, "
+                        "deadline, deadline_ts, completed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (todo.id, position) + self._row_values(todo))
+                    # Neu vergebene IDs übernehmen
+                    todo.id = cursor.lastrowid
+                self._by_id = {todo.id: todo for todo in self.todos}
+                self._reset_search()
+        except Exception as e:
+            print(f"Fehler beim Speichern der Todos: {e}")
+
+    def _reset_search(self):
+        """Verwirft Suchindex und Positionen (nach Neuladen bzw. Neuaufbau)"""
+        self._search_index = None
+        self._positions = None
+
+    def is_migrated(self):
+        """Gibt zurück, ob die Textdatei bereits übernommen wurde"""
+        with self._lock:
+            return self.conn.execute("PRAGMA user_version").fetchone()[0] >= MIGRATED_VERSION
+
+    def mark_migrated(self):
+        """Vermerkt in der Datenbank, dass die Textdatei übernommen wurde"""
+        with self._lock, self.conn:
+            self.conn.execute(f"PRAGMA user_version = {MIGRATED_VERSION}")
+
+    def close(self):
+        """Schließt die Datenbankverbindung"""
+        with self._lock:
+            self.conn.close()
+
+    def add(self, todo):
+        """Fügt ein neues Todo hinzu und gibt dessen ID zurück"""
+        todo = TodoItem.from_dict(todo)
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO todos (position, text, category, priority, deadline, "
+                "deadline_ts, completed) VALUES "
+                "((SELECT COALESCE(MAX(position), -1) + 1 FROM todos), ?, ?, ?, ?, ?, ?)",
+                self._row_values(todo))
+            todo.id = cursor.lastrowid
+            self.todos.append(todo)
+            self._by_id[todo.id] = todo
+            if self._positions is not None:
+                self._positions[todo.id] = len(self.todos) - 1
+            if self._search_index is not None:
+                self._search_index.add(todo)
+            return todo.id
+
+    def get(self, todo_id):
+        """Gibt das Todo mit der angegebenen ID zurück"""
+        return self._by_id.get(todo_id)
+
+    def update_by_id(self, todo_id, todo):
+        """Aktualisiert ein bestehendes Todo anhand seiner ID"""
+        with self._lock:
+            existing = self._by_id.get(todo_id)
+            if existing is None:
+                return
+            # Erst schreiben, dann den Datensatz im Speicher ändern - schlägt
+            # das Schreiben fehl, bleiben Speicher und Datenbank gleich
+            updated = existing.copy()
+            updated.update(todo)
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE todos SET text = ?, category = ?, priority = ?, deadline = ?, "
+                    "deadline_ts = ?, completed = ? WHERE id = ?",
+                    self._row_values(updated) + (todo_id,))
+            existing.update(todo)
+            existing.id = todo_id
+            if self._search_index is not None:
+                self._search_index.remove(todo_id)
+                self._search_index.add(existing)
+
+    def delete_by_id(self, todo_id):
+        """Löscht ein Todo anhand seiner ID"""
+        with self._lock:
+            todo = self._by_id.get(todo_id)
+            if todo is None:
+                return
+            with self.conn:
+                self.conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
+            del self._by_id[todo_id]
+            self.todos.remove(todo)
+            self._positions = None
+            if self._search_index is not None:
+                self._search_index.remove(todo_id)
+
+    def toggle_completed_by_id(self, todo_id):
+        """Schaltet den Status eines Todos anhand seiner ID um"""
+        with self._lock:
+            todo = self._by_id.get(todo_id)
+            if todo is None:
+                return
+            with self.conn:
+                self.conn.execute("UPDATE todos SET completed = ? WHERE id = ?",
+                                  (0 if todo.completed else 1, todo_id))
+            todo.completed = not todo.completed
+
+    def update(self, index, todo):
+        """Aktualisiert ein bestehendes Todo"""
+        if 0 <= index < len(self.todos):
+            self.update_by_id(self.todos[index].id, todo)
+
+    def delete(self, index):
+        """Löscht ein Todo"""
+        if 0 <= index < len(self.todos):
+            self.delete_by_id(self.todos[index].id)
+
+    def toggle_completed(self, index):
+        """Schaltet den Status eines Todos um"""
+        if 0 <= index < len(self.todos):
+            self.toggle_completed_by_id(self.todos[index].id)
+
+    def get_all(self):
+        """Gibt alle Todos zurück"""
+        return self.todos
+
+    def get_by_category(self, category):
+        """Gibt alle Todos einer Kategorie zurück"""
+        return self._lookup(
+            "SELECT id FROM todos WHERE category = ? ORDER BY position", (category,))
+
+    def get_by_priority(self, priority):
+        """Gibt alle Todos einer Priorität zurück"""
+        return self._lookup(
+            "SELECT id FROM todos WHERE priority = ? ORDER BY position", (priority,))
+
+    def get_by_completed(self, completed):
+        """Gibt alle offenen bzw. erledigten Todos zurück"""
+        return self._lookup(
+            "SELECT id FROM todos WHERE completed = ? ORDER BY position",
+            (1 if completed else 0,))
+
+    def count_by_category(self, category):
+        """Gibt die Anzahl der Todos einer Kategorie zurück"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM todos WHERE category = ?", (category,)).fetchone()[0]
+
+    def count_by_completed(self, completed):
+        """Gibt die Anzahl der offenen bzw. erledigten Todos zurück"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM todos WHERE completed = ?",
+                (1 if completed else 0,)).fetchone()[0]
+
+    def get_due_between(self, start, end):
+        """Gibt offene Todos mit Deadline im Bereich [start, end) zurück"""
+        return self._lookup(
+            "SELECT id FROM todos WHERE completed = 0 AND deadline_ts >= ? "
+            "AND deadline_ts < ? ORDER BY deadline_ts, id", (start, end))
+
+    def get_due_before(self, timestamp):
+        """Gibt alle offenen Todos mit Deadline vor dem Zeitpunkt zurück"""
+        return self._lookup(
+            "SELECT id FROM todos WHERE completed = 0 AND deadline_ts IS NOT NULL "
+            "AND deadline_ts < ? ORDER BY deadline_ts, id", (timestamp,))
+
+    def get_overdue(self, now=None):
+        """Gibt alle überfälligen offenen Todos zurück"""
+        return self.get_due_before(time.time() if now is None else now)
+
+    def get_due_today(self, now=None):
+        """Gibt alle offenen Todos zurück, die heute fällig sind"""
+        return self.get_due_between(*day_range(now))
+
+    def get_due_within(self, days, now=None):
+        """Gibt offene Todos zurück, die in den nächsten ``days`` Tagen fällig werden"""
+        now = time.time() if now is None else now
+        return self.get_due_between(now, now + days * 86400)
+
+    def get_next_due(self, after):
+        """Gibt das nächste offene Todo mit Deadline nach ``after`` zurück (oder None)"""
+        todos = self._lookup(
+            "SELECT id FROM todos WHERE completed = 0 AND deadline_ts > ? "
+            "ORDER BY deadline_ts, id LIMIT 1", (after,))
+        return todos[0] if todos else None
+
+    def search(self, query):
+        """Sucht in den Todos (Teilstring in Text oder Kategorie)
+
+        Nutzt wie ``TodoManager`` einen ``SearchIndex`` über die
+        zwischengespeicherten Todos statt einer Abfrage über alle Zeilen.
+        Die Treffer stehen in der Reihenfolge der Liste.
+        """
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SearchIndex()
+                for todo in self.todos:
+                    self._search_index.add(todo)
+            ids = self._search_index.search(query)
+            if ids is None:
+                return list(self.todos)
+            if self._positions is None:
+                self._positions = {todo.id: position for position, todo in enumerate(self.todos)}
+            by_id = self._by_id
+            return [by_id[todo_id] for todo_id in sorted(ids, key=self._positions.__getitem__)]
+
+    def cleanup(self):
+        """Entfernt erledigte Todos"""
+        with self._lock:
+            with self.conn:
+                self.conn.execute("DELETE FROM todos WHERE completed = 1")
+            self.todos = [todo for todo in self.todos if not todo.completed]
+            self._by_id = {todo.id: todo for todo in self.todos}
+            self._reset_search()
+
+    def save_todos(self, todos):
+        """Speichert eine neue Todo-Liste"""
+        with self._lock:
+            self.todos = todos  # Aktualisiere die interne Liste
+            self.save()  # Speichere in die Datenbank
+
+def read_legacy_todos(path):
+    """Liest Todos aus todos.txt (Pipe-Format) oder dem alten CSV-Format
+
+    Das CSV-Format stammt aus dem ``TodoManager`` in ``todo.py``
+    (Kopfzeile ``text,category,priority,deadline,completed``); Dateien
+    ohne erkennbares Format werden wie dort zeilenweise als Text gelesen.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        content = f.read()
+
+    lines = [line for line in content.splitlines() if line.strip()]
+    if not lines:
+        return []
+
+    todos = []
+    if lines[0].startswith('text,'):
+        # Altes CSV-Format aus todo.py
+        for row in csv.DictReader(lines):
+            todos.append(TodoItem(row.get('text') or '',
+                                  row.get('category') or 'Allgemein',
+                                  row.get('priority') or '►',
+                                  row.get('deadline') or '',
+                                  row.get('completed', 'False') == 'True'))
+    elif any('|' in line for line in lines):
+        # Pipe-Format aus app/todo_manager.py (Journal-Kopfzeile ignorieren)
+        for line in lines:
+            if not line.startswith('#seq|'):
+                todo = TodoManager.parse_line(line)
+                if todo:
+                    todos.append(todo)
+    else:
+        # Einfache Textdatei: eine Aufgabe pro Zeile
+        for line in lines:
+            todos.append(TodoItem(line.strip()))
+    return todos
+
+def migrate_to_sqlite(text_path='todos.txt', db_path='todos.db', manager=None):
+    """Überträgt einmalig die Todos aus der Textdatei in die Datenbank
+
+    Gibt die Anzahl der übernommenen Todos zurück. Die Übernahme wird in
+    der Datenbank vermerkt und danach nie wiederholt - auch nicht, wenn
+    später alle Todos gelöscht werden. Ist die Datenbank bereits befüllt
+    oder die Textdatei nicht vorhanden, wird nur der Vermerk gesetzt.
+    Ein übergebener ``manager`` wird benutzt und bleibt geöffnet.
+    """
+    own_manager = manager is None
+    if own_manager:
+        manager = SQLiteTodoManager(db_path)
+    try:
+        if manager.is_migrated():
+            return 0
+
+        todos = []
+        if not manager.get_all() and os.path.exists(text_path):
+            # Offene Journal-Einträge berücksichtigen
+            if os.path.exists(text_path + '.journal'):
+                source = TodoManager(text_path)
+                todos = [todo.copy() for todo in source.get_all()]
+                source.close()
+            else:
+                todos = read_legacy_todos(text_path)
+            manager.save_todos(todos)
+
+        manager.mark_migrated()
+        return len(todos)
+    finally:
+        if own_manager:
+            manager.close()
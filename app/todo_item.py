@@ -0,0 +1,135 @@
+import sys
+
+from app.deadline import parse_deadline, format_badge
+
+# Reihenfolge der Felder (entspricht der Spaltenreihenfolge in todos.txt)
+FIELDS = ('text', 'category', 'priority', 'deadline', 'completed', 'id')
+
+class TodoItem:
+    """Kompakter Datensatz für ein einzelnes Todo
+
+    Ersetzt das frühere Dict mit fünf Schlüsseln: ``__slots__`` spart den
+    Instanz-Dict, Kategorie und Priorität werden internalisiert (es gibt
+    nur wenige verschiedene Werte) und die Deadline wird einmalig beim
+    Setzen geparst. Für bestehenden GUI-Code bleibt der Zugriff wie bei
+    einem Dict möglich (``todo['text']``, ``todo.get('priority', '►')``).
+    """
+
+    __slots__ = ('id', '_text', '_text_key', 'category', 'priority', '_deadline',
+                 'deadline_ts', '_deadline_badge', 'completed')
+
+    def __init__(self, text='', category='Allgemein', priority='►',
+                 deadline='', completed=False, id=None):
+        self.id = id
+        self.text = text
+        self.category = sys.intern(category or 'Allgemein')
+        self.priority = sys.intern(priority or '►')
+        self.deadline = deadline
+        self.completed = bool(completed)
+
+    @classmethod
+    def from_dict(cls, todo):
+        """Erstellt einen Datensatz aus einem Dict (oder gibt ihn unverändert zurück)"""
+        if isinstance(todo, cls):
+            return todo
+        return cls(todo.get('text', ''),
+                   todo.get('category', 'Allgemein'),
+                   todo.get('priority', '►'),
+                   todo.get('deadline', ''),
+                   todo.get('completed', False),
+                   todo.get('id'))
+
+    @property
+    def text(self):
+        """Text des Todos"""
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self._text_key = None  # Sortierschlüssel neu berechnen
+
+    @property
+    def text_key(self):
+        """Sortierschlüssel für den Text (casefold, beim ersten Zugriff berechnet)"""
+        if self._text_key is None:
+            self._text_key = self._text.casefold()
+        return self._text_key
+
+    @property
+    def deadline(self):
+        """Deadline im Originalformat (``%d.%m.%Y`` oder ``%d.%m.%Y %H:%M``)"""
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value):
+        self._deadline = value or ''
+        self.deadline_ts = parse_deadline(self._deadline)
+        self._deadline_badge = None  # Anzeigetext neu formatieren
+
+    @property
+    def deadline_badge(self):
+        """Anzeigetext der Deadline (beim ersten Zugriff formatiert)"""
+        if self._deadline_badge is None:
+            self._deadline_badge = format_badge(self._deadline, self.deadline_ts)
+        return self._deadline_badge
+
+    def to_dict(self):
+        """Gibt das Todo als einfaches Dict zurück (z.B. für JSON)"""
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def copy(self):
+        """Gibt eine Kopie des Datensatzes zurück"""
+        return TodoItem(self._text, self.category, self.priority,
+                        self._deadline, self.completed, self.id)
+
+    def update(self, values=(), **kwargs):
+        """Übernimmt Werte aus einem Dict bzw. Schlüsselwortargumenten"""
+        if hasattr(values, 'keys'):
+            values = [(key, values[key]) for key in values.keys()]
+        for key, value in list(values) + list(kwargs.items()):
+            self[key] = value
+
+    # Dict-kompatibler Zugriff für den bestehenden GUI-Code
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key == 'category':
+            value = sys.intern(value or 'Allgemein')
+        elif key == 'priority':
+            value = sys.intern(value or '►')
+        elif key == 'completed':
+            value = bool(value)
+        elif key not in FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in FIELDS
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def get(self, key, default=None):
+        if key not in FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def keys(self):
+        return FIELDS
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in FIELDS]
+
+    def __repr__(self):
+        return (f"TodoItem(id={self.id!r}, text={self.text!r}, category={self.category!r}, "
+                f"priority={self.priority!r}, deadline={self._deadline!r}, "
+                f"completed={self.completed!r})")
@@ -1,75 +1,467 @@
 import os
-import csv
-from datetime import datetime
+import json
+import time
+import threading
+from bisect import bisect_left, bisect_right, insort
+
+from app.deadline import day_range
+from app.persistence import FileFingerprint, WriteBehindWriter, atomic_write
+from app.todo_item import TodoItem
+from app.search_index import SearchIndex
+
+# Journal wird kompaktiert, sobald es diese Größe (Bytes) überschreitet ...
+JOURNAL_MAX_BYTES = 1024 * 1024
+# ... oder mindestens so viele Einträge hat und dabei den Anteil
+# JOURNAL_MAX_RATIO an der Anzahl der Todos erreicht
+JOURNAL_MIN_RECORDS = 200
+JOURNAL_MAX_RATIO = 0.5
 
 class TodoManager:
-    """Daten-Management-Klasse für Todos"""
-    
-    def __init__(self):
-        """Initialisiert den TodoManager"""
+    """Daten-Management-Klasse für Todos
+
+    Im Journal-Modus (Standard) schreibt jede Änderung nur einen kleinen
+    Eintrag in ``todos.txt.journal``. Beim Laden wird das Journal auf den
+    letzten Snapshot (``todos.txt``) angewendet; ab einer Größen- bzw.
+    Verhältnisschwelle wird es im Hintergrund in einen neuen Snapshot
+    kompaktiert. Alle Schreibvorgänge laufen über einen
+    ``WriteBehindWriter``, die Änderungsmethoden selbst greifen nie auf
+    die Festplatte zu.
+    """
+
+    def __init__(self, storage_path='todos.txt', journaled=True, writer=None,
+                 verify_hash=False):
+        """Initialisiert den TodoManager
+
+        Mit ``verify_hash`` wird zur Änderungserkennung zusätzlich ein
+        Hash über den Dateiinhalt verglichen (langsamer, aber unabhängig
+        von der Genauigkeit der Änderungszeit).
+        """
         self.todos = []
-        self.storage_path = 'todos.txt'
+        self._by_id = {}  # ID -> Todo
+        self._next_id = 1
+        self._reset_indexes()
+        self.storage_path = storage_path
+        self.journaled = journaled
+        self.journal_path = storage_path + '.journal'
+        self._writer = writer if writer is not None else WriteBehindWriter()
+        self.verify_hash = verify_hash
+        self._fingerprints = None  # (Snapshot, Journal) beim letzten Laden/Schreiben
+
+        self._lock = threading.RLock()
+        self._seq = 0  # Sequenznummer der letzten Änderung
+        self._journal_file = None  # Nur vom Schreib-Thread benutzt
+        self._journal_buffer = []  # Noch nicht geschriebene Journal-Zeilen
+        self._journal_records = 0
+        self._journal_bytes = 0
+
         self.load()
 
+    @staticmethod
+    def parse_line(line):
+        """Wandelt eine Zeile aus todos.txt in ein Todo um"""
+        parts = line.strip().split('|')
+        if len(parts) < 5:  # Stelle sicher, dass alle Felder vorhanden sind
+            return None
+        # Ältere Dateien haben noch keine ID - diese wird beim Indizieren vergeben
+        todo_id = int(parts[5]) if len(parts) > 5 and parts[5].isdigit() else None
+        return TodoItem(parts[0], parts[1], parts[2], parts[3], parts[4] == '1', todo_id)
+
+    def _format_line(self, todo):
+        """Wandelt ein Todo in eine Zeile für todos.txt um"""
+        completed = '1' if todo.completed else '0'
+        return (f"{todo.text}|{todo.category}|{todo.priority}|{todo.deadline}|"
+                f"{completed}|{todo.id}\n")
+
     def load(self):
-        """Lädt alle Todos aus der Datei"""
+        """Lädt alle Todos aus der Datei
+
+        Haben sich Snapshot und Journal seit dem letzten Laden bzw.
+        Schreiben nicht geändert, passiert nichts - die Liste im Speicher
+        ist maßgeblich. Wurden nur Zeilen angehängt, wird nur das Ende
+        gelesen.
+        """
         try:
-            self.todos = []
-            try:
-                with open(self.storage_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.strip():  # Ignoriere leere Zeilen
-                            parts = line.strip().split('|')
-                            if len(parts) >= 5:  # Stelle sicher, dass alle Felder vorhanden sind
-                                todo = {
-                                    'text': parts[0],
-                                    'category': parts[1],
-                                    'priority': parts[2],
-                                    'deadline': parts[3],
-                                    'completed': parts[4] == '1'
-                                }
-                                self.todos.append(todo)
-            except FileNotFoundError:
-                # Erstelle eine leere Datei wenn sie nicht existiert
-                open(self.storage_path, 'w', encoding='utf-8').close()
+            # Ausstehende Schreibaufträge abschließen
+            self._writer.flush()
+            with self._lock:
+                snapshot_fp, journal_fp = self._take_fingerprints()
+                if self._fingerprints is not None and self._load_changes(snapshot_fp,
+                                                                         journal_fp):
+                    self._fingerprints = (snapshot_fp, journal_fp)
+                    return
+
+                self._close_journal()
+                self._journal_buffer = []
+                self.todos = []
+                self._by_id = {}
+                self._next_id = 1
+                self._reset_indexes()
+                try:
+                    snapshot_seq = self._read_snapshot()
+                except FileNotFoundError:
+                    # Erstelle eine leere Datei wenn sie nicht existiert
+                    open(self.storage_path, 'w', encoding='utf-8').close()
+                    snapshot_seq = 0
+
+                self._seq = snapshot_seq
+                self._journal_records = 0
+                self._journal_bytes = 0
+                if self.journaled:
+                    self._replay(snapshot_seq)
+                self._fingerprints = self._take_fingerprints()
         except Exception as e:
             print(f"Fehler beim Laden der Todos: {e}")
             self.todos = []  # Fallback zu leerer Liste
+            self._by_id = {}
+            self._reset_indexes()
+            self._fingerprints = None
+
+    def _take_fingerprints(self):
+        """Ermittelt die Fingerabdrücke von Snapshot und Journal"""
+        snapshot_fp = FileFingerprint.of(self.storage_path, self.verify_hash)
+        journal_fp = None
+        if self.journaled:
+            journal_fp = FileFingerprint.of(self.journal_path, self.verify_hash)
+        return snapshot_fp, journal_fp
+
+    def _load_changes(self, snapshot_fp, journal_fp):
+        """Übernimmt angehängte Zeilen; False, wenn komplett neu geladen werden muss"""
+        old_snapshot, old_journal = self._fingerprints
+        snapshot_same = self._same_file(snapshot_fp, old_snapshot)
+        journal_same = self._same_file(journal_fp, old_journal)
+        if snapshot_same and journal_same:
+            return True  # Unverändert
+
+        snapshot_appended = (snapshot_fp is not None and
+                             snapshot_fp.is_append_to(old_snapshot, self.storage_path))
+        journal_appended = (journal_fp is not None and
+                            (old_journal is None or
+                             journal_fp.is_append_to(old_journal, self.journal_path)))
+        if not (snapshot_same or snapshot_appended):
+            return False
+        if not (journal_same or journal_appended):
+            return False
+
+        if snapshot_appended:
+            self._read_snapshot(old_snapshot.size)
+        if journal_appended:
+            self._replay(self._seq, old_journal.size if old_journal else 0)
+        return True
+
+    @staticmethod
+    def _same_file(new, old):
+        """Vergleicht zwei (evtl. fehlende) Fingerabdrücke"""
+        if new is None or old is None:
+            return new is None and old is None
+        return new.same_as(old)
+
+    def _read_lines(self, path, offset):
+        """Liest die Zeilen einer Datei ab der angegebenen Byte-Position"""
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read().decode('utf-8').splitlines(keepends=True)
+
+    def _read_snapshot(self, offset=0):
+        """Liest Todos aus dem Snapshot und gibt dessen Sequenznummer zurück"""
+        snapshot_seq = 0
+        for line in self._read_lines(self.storage_path, offset):
+            if line.startswith('#seq|'):
+                # Kopfzeile: letzte im Snapshot enthaltene Änderung
+                snapshot_seq = int(line.strip().split('|')[1])
+            elif line.strip():  # Ignoriere leere Zeilen
+                todo = self.parse_line(line)
+                if todo:
+                    self._insert(todo)
+        return snapshot_seq
+
+    def _replay(self, applied_seq, offset=0):
+        """Wendet die Einträge des Journals auf die geladenen Todos an"""
+        try:
+            lines = self._read_lines(self.journal_path, offset)
+        except FileNotFoundError:
+            return
+        for line in lines:
+            self._journal_bytes += len(line.encode('utf-8'))
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Abgeschnittener Eintrag (z.B. Absturz beim Schreiben)
+                continue
+            self._journal_records += 1
+            if record['seq'] <= applied_seq:
+                continue  # Bereits im Snapshot bzw. im Speicher enthalten
+            self._apply(record)
+            self._seq = record['seq']
+
+    def _apply(self, record):
+        """Führt einen Journal-Eintrag auf der Todo-Liste aus"""
+        op = record['op']
+        if op == 'add':
+            self._insert(record['todo'])
+        elif op == 'update':
+            self._replace(record['id'], record['todo'])
+        elif op == 'delete':
+            self._remove(record['id'])
+        elif op == 'toggle':
+            self._toggle(record['id'])
+        elif op == 'cleanup':
+            self._cleanup()
+
+    # Sekundärindizes (Dicts dienen als geordnete Mengen von IDs)
+
+    def _reset_indexes(self):
+        """Leert die Sekundärindizes"""
+        self._by_category = {}  # Kategorie -> {ID: None}
+        self._by_priority = {}  # Priorität -> {ID: None}
+        self._by_completed = {False: {}, True: {}}  # Status -> {ID: None}
+        self._by_deadline = []  # Offene Todos mit Deadline: sortierte (Zeitstempel, ID)
+        self._search_index = None  # Wird bei der ersten Suche aufgebaut
+        self._positions = None  # ID -> Position in self.todos (für Suchergebnisse)
+
+    def _index(self, todo):
+        """Nimmt ein Todo in die Sekundärindizes auf"""
+        self._by_category.setdefault(todo.category, {})[todo.id] = None
+        self._by_priority.setdefault(todo.priority, {})[todo.id] = None
+        self._by_completed[todo.completed][todo.id] = None
+        self._index_deadline(todo)
+        if self._search_index is not None:
+            self._search_index.add(todo)
+
+    def _unindex(self, todo):
+        """Entfernt ein Todo aus den Sekundärindizes"""
+        for index, key in ((self._by_category, todo.category),
+                           (self._by_priority, todo.priority)):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(todo.id, None)
+                if not ids:
+                    del index[key]
+        self._by_completed[todo.completed].pop(todo.id, None)
+        self._unindex_deadline(todo)
+        if self._search_index is not None:
+            self._search_index.remove(todo.id)
+
+    def _index_deadline(self, todo):
+        """Nimmt ein offenes Todo mit Deadline in den Deadline-Index auf"""
+        if todo.deadline_ts is not None and not todo.completed:
+            insort(self._by_deadline, (todo.deadline_ts, todo.id))
+
+    def _unindex_deadline(self, todo):
+        """Entfernt ein Todo aus dem Deadline-Index"""
+        if todo.deadline_ts is None or todo.completed:
+            return
+        key = (todo.deadline_ts, todo.id)
+        position = bisect_left(self._by_deadline, key)
+        if position < len(self._by_deadline) and self._by_deadline[position] == key:
+            del self._by_deadline[position]
+
+    # Interne Änderungen - gemeinsam genutzt von der API und dem Journal-Replay
+
+    def _insert(self, todo):
+        """Hängt ein Todo an und vergibt bei Bedarf eine neue ID"""
+        todo = TodoItem.from_dict(todo)
+        todo_id = todo.id
+        if todo_id is None or todo_id in self._by_id:
+            todo_id = self._next_id
+            todo.id = todo_id
+        self._next_id = max(self._next_id, todo_id + 1)
+        self.todos.append(todo)
+        self._by_id[todo_id] = todo
+        if self._positions is not None:
+            self._positions[todo_id] = len(self.todos) - 1
+        self._index(todo)
+        return todo_id
+
+    def _replace(self, todo_id, values):
+        """Übernimmt neue Werte in ein bestehendes Todo (gleiches Objekt)"""
+        todo = self._by_id.get(todo_id)
+        if todo is None:
+            return None
+        self._unindex(todo)
+        todo.update(values)
+        todo.id = todo_id
+        self._index(todo)
+        return todo
+
+    def _remove(self, todo_id):
+        """Entfernt ein Todo aus Liste und Index"""
+        todo = self._by_id.pop(todo_id, None)
+        if todo is not None:
+            self._unindex(todo)
+            self.todos.remove(todo)
+            self._positions = None
+        return todo
+
+    def _toggle(self, todo_id):
+        """Schaltet den Status eines Todos um"""
+        todo = self._by_id.get(todo_id)
+        if todo is not None:
+            self._unindex_deadline(todo)
+            del self._by_completed[todo.completed][todo_id]
+            todo.completed = not todo.completed
+            self._by_completed[todo.completed][todo_id] = None
+            self._index_deadline(todo)
+        return todo
+
+    def _cleanup(self):
+        """Entfernt alle erledigten Todos"""
+        for todo_id in list(self._by_completed[True]):
+            self._unindex(self._by_id.pop(todo_id))
+        self.todos = [todo for todo in self.todos if not todo.completed]
+        self._positions = None
+
+    def _log(self, op, **fields):
+        """Protokolliert eine Änderung im Journal bzw. plant einen Snapshot ein"""
+        if not self.journaled:
+            self._schedule_snapshot()
+            return
+
+        try:
+            self._seq += 1
+            record = dict(fields, seq=self._seq, op=op)
+            line = json.dumps(record, ensure_ascii=False) + '\n'
+            self._journal_buffer.append(line)
+            self._journal_records += 1
+            self._journal_bytes += len(line.encode('utf-8'))
+            self._writer.schedule(self.journal_path, self._flush_journal)
+            self._maybe_compact()
+        except Exception as e:
+            print(f"Fehler beim Schreiben des Journals: {e}")
+            self._schedule_snapshot()  # Fallback: vollständiger Snapshot
+
+    def _maybe_compact(self):
+        """Startet die Kompaktierung, wenn eine Schwelle erreicht ist"""
+        too_big = self._journal_bytes >= JOURNAL_MAX_BYTES
+        too_many = (self._journal_records >= JOURNAL_MIN_RECORDS and
+                    self._journal_records >= len(self.todos) * JOURNAL_MAX_RATIO)
+        if too_big or too_many:
+            self.compact()
+
+    def compact(self):
+        """Kompaktiert das Journal im Hintergrund in einen neuen Snapshot"""
+        self._schedule_snapshot()
+
+    def _schedule_snapshot(self):
+        """Plant das Schreiben eines vollständigen Snapshots ein"""
+        self._writer.schedule(self.storage_path, self._write_snapshot)
+
+    def _flush_journal(self):
+        """Hängt die gepufferten Journal-Zeilen an (läuft im Schreib-Thread)"""
+        with self._lock:
+            lines, self._journal_buffer = self._journal_buffer, []
+        if not lines:
+            return  # Bereits in einem Snapshot enthalten
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, 'a', encoding='utf-8')
+            if not self._ends_with_newline(self.journal_path):
+                # Abgeschnittenen letzten Eintrag abschließen, sonst würde
+                # der nächste Eintrag an ihn angehängt und beim Laden verworfen
+                self._journal_file.write('\n')
+        self._journal_file.writelines(lines)
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+        self._remember_files()
+
+    @staticmethod
+    def _ends_with_newline(path):
+        """Prüft, ob eine Datei leer ist oder mit einem Zeilenumbruch endet"""
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _write_snapshot(self):
+        """Schreibt einen vollständigen Snapshot (läuft im Schreib-Thread)"""
+        with self._lock:
+            # Konsistenter Stand: Todos und zugehörige Sequenznummer. Alle
+            # gepufferten Journal-Zeilen sind darin bereits enthalten.
+            seq = self._seq
+            lines = [self._format_line(todo) for todo in self.todos]
+            self._journal_buffer = []
+            self._journal_records = 0
+            self._journal_bytes = 0
+
+        header = f"#seq|{seq}\n" if self.journaled else ''
+        atomic_write(self.storage_path, header + ''.join(lines))
+        if self.journaled:
+            # Ein Absturz vor dem Löschen schadet nicht: ältere Einträge
+            # werden beim Laden anhand der Sequenznummer übersprungen
+            self._close_journal()
+            try:
+                os.remove(self.journal_path)
+            except FileNotFoundError:
+                pass
+        self._remember_files()
+
+    def _remember_files(self):
+        """Merkt sich den Stand der selbst geschriebenen Dateien"""
+        fingerprints = self._take_fingerprints()
+        with self._lock:
+            self._fingerprints = fingerprints
+
+    def _close_journal(self):
+        """Schließt die geöffnete Journal-Datei"""
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
 
     def save(self):
-        """Speichert alle Todos in die Datei"""
+        """Speichert alle Todos in die Datei (im Hintergrund)"""
         try:
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                for todo in self.todos:
-                    # Stelle sicher, dass alle erforderlichen Felder existieren
-                    text = todo.get('text', '')
-                    category = todo.get('category', 'Allgemein')
-                    priority = todo.get('priority', '►')
-                    deadline = todo.get('deadline', '')
-                    completed = '1' if todo.get('completed', False) else '0'
-                    
-                    # Schreibe eine Zeile pro Todo
-                    line = f"{text}|{category}|{priority}|{deadline}|{completed}\n"
-                    f.write(line)
+            self._schedule_snapshot()
         except Exception as e:
             print(f"Fehler beim Speichern der Todos: {e}")
 
+    def flush(self):
+        """Wartet, bis alle Änderungen auf der Festplatte sind"""
+        self._writer.flush()
+
+    def close(self):
+        """Schreibt alle ausstehenden Änderungen und schließt das Journal"""
+        self._writer.flush()
+        with self._lock:
+            self._close_journal()
+
     def add(self, todo):
-        """Fügt ein neues Todo hinzu"""
-        self.todos.append(todo)
-        self.save()
+        """Fügt ein neues Todo hinzu und gibt dessen ID zurück"""
+        with self._lock:
+            todo_id = self._insert(todo)
+            self._log('add', todo=self._by_id[todo_id].to_dict())
+            return todo_id
+
+    def get(self, todo_id):
+        """Gibt das Todo mit der angegebenen ID zurück"""
+        return self._by_id.get(todo_id)
+
+    def update_by_id(self, todo_id, todo):
+        """Aktualisiert ein bestehendes Todo anhand seiner ID"""
+        with self._lock:
+            if self._replace(todo_id, todo) is not None:
+                self._log('update', id=todo_id, todo=self._by_id[todo_id].to_dict())
+
+    def delete_by_id(self, todo_id):
+        """Löscht ein Todo anhand seiner ID"""
+        with self._lock:
+            if self._remove(todo_id) is not None:
+                self._log('delete', id=todo_id)
+
+    def toggle_completed_by_id(self, todo_id):
+        """Schaltet den Status eines Todos anhand seiner ID um"""
+        with self._lock:
+            if self._toggle(todo_id) is not None:
+                self._log('toggle', id=todo_id)
 
     def update(self, index, todo):
         """Aktualisiert ein bestehendes Todo"""
         if 0 <= index < len(self.todos):
-            self.todos[index] = todo
-            self.save()
+            self.update_by_id(self.todos[index].id, todo)
 
     def delete(self, index):
         """Löscht ein Todo"""
         if 0 <= index < len(self.todos):
-            del self.todos[index]
-            self.save()
+            self.delete_by_id(self.todos[index].id)
 
     def get_all(self):
         """Gibt alle Todos zurück"""
@@ -77,34 +469,108 @@ class TodoManager:
 
     def get_by_category(self, category):
         """Gibt alle Todos einer Kategorie zurück"""
-        return [todo for todo in self.todos 
-                if todo.get('category', 'Allgemein') == category]
+        by_id = self._by_id
+        return [by_id[todo_id] for todo_id in self._by_category.get(category, ())]
 
     def get_by_priority(self, priority):
         """Gibt alle Todos einer Priorität zurück"""
-        return [todo for todo in self.todos 
-                if todo.get('priority', '►') == priority]
+        by_id = self._by_id
+        return [by_id[todo_id] for todo_id in self._by_priority.get(priority, ())]
+
+    def get_by_completed(self, completed):
+        """Gibt alle offenen bzw. erledigten Todos zurück"""
+        by_id = self._by_id
+        return [by_id[todo_id] for todo_id in self._by_completed[bool(completed)]]
+
+    def count_by_category(self, category):
+        """Gibt die Anzahl der Todos einer Kategorie zurück"""
+        return len(self._by_category.get(category, ()))
+
+    def count_by_completed(self, completed):
+        """Gibt die Anzahl der offenen bzw. erledigten Todos zurück"""
+        return len(self._by_completed[bool(completed)])
+
+    def get_due_between(self, start, end):
+        """Gibt offene Todos mit Deadline im Bereich [start, end) zurück
+
+        Sortiert nach Deadline; dank des sortierten Deadline-Index in
+        O(log n + k) statt über alle Todos.
+        """
+        with self._lock:
+            entries = self._by_deadline
+            first = bisect_left(entries, (start,))
+            last = bisect_left(entries, (end,), first)
+            by_id = self._by_id
+            return [by_id[todo_id] for _, todo_id in entries[first:last]]
+
+    def get_due_before(self, timestamp):
+        """Gibt alle offenen Todos mit Deadline vor dem Zeitpunkt zurück"""
+        with self._lock:
+            entries = self._by_deadline
+            last = bisect_left(entries, (timestamp,))
+            by_id = self._by_id
+            return [by_id[todo_id] for _, todo_id in entries[:last]]
+
+    def get_overdue(self, now=None):
+        """Gibt alle überfälligen offenen Todos zurück"""
+        return self.get_due_before(time.time() if now is None else now)
+
+    def get_due_today(self, now=None):
+        """Gibt alle offenen Todos zurück, die heute fällig sind"""
+        return self.get_due_between(*day_range(now))
+
+    def get_due_within(self, days, now=None):
+        """Gibt offene Todos zurück, die in den nächsten ``days`` Tagen fällig werden"""
+        now = time.time() if now is None else now
+        return self.get_due_between(now, now + days * 86400)
+
+    def get_next_due(self, after):
+        """Gibt das nächste offene Todo mit Deadline nach ``after`` zurück (oder None)"""
+        with self._lock:
+            entries = self._by_deadline
+            position = bisect_right(entries, (after, float('inf')))
+            if position < len(entries):
+                return self._by_id[entries[position][1]]
+            return None
 
     def search(self, query):
-        """Sucht in den Todos"""
-        query = query.lower()
-        return [todo for todo in self.todos 
-                if query in todo.get('text', '').lower() or 
-                   query in todo.get('category', '').lower()]
+        """Sucht in den Todos (Teilstring in Text oder Kategorie)
+
+        Die Treffer stehen in der Reihenfolge der Liste, damit die
+        gefilterte Anzeige bei gleichen Sortierschlüsseln genauso
+        angeordnet ist wie die ungefilterte.
+        """
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SearchIndex()
+                for todo in self.todos:
+                    self._search_index.add(todo)
+            ids = self._search_index.search(query)
+            if ids is None:
+                return list(self.todos)
+            if self._positions is None:
+                self._positions = {todo.id: position for position, todo in enumerate(self.todos)}
+            by_id = self._by_id
+            return [by_id[todo_id] for todo_id in sorted(ids, key=self._positions.__getitem__)]
 
     def toggle_completed(self, index):
         """Schaltet den Status eines Todos um"""
         if 0 <= index < len(self.todos):
-            self.todos[index]['completed'] = not self.todos[index].get('completed', False)
-            self.save()
+            self.toggle_completed_by_id(self.todos[index].id)
 
     def cleanup(self):
         """Entfernt erledigte Todos"""
-        self.todos = [todo for todo in self.todos 
-                     if not todo.get('completed', False)]
-        self.save()
+        with self._lock:
+            self._cleanup()
+            self._log('cleanup')
 
     def save_todos(self, todos):
         """Speichert eine neue Todo-Liste"""
-        self.todos = todos  # Aktualisiere die interne Liste
-        self.save()  # Speichere in die Datei 
\ No newline at end of file
+        with self._lock:
+            # Interne Liste und ID-Index neu aufbauen
+            self.todos = []
+            self._by_id = {}
+            self._reset_indexes()
+            for todo in todos:
+                self._insert(todo)
+            self.save()  # Speichere in die Datei
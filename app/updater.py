@@ -1,56 +1,416 @@
+import urllib.error
 import urllib.request
+import http.client
+import hashlib
 import json
 import os
 import sys
+import time
+import queue
+import tempfile
+import threading
 import subprocess
-from tkinter import messagebox
+
+from app.delta import DeltaError, apply_patch
+from app.persistence import atomic_write
+
+# Zeitlimit für Verbindungsaufbau und jeden Lesevorgang (Sekunden)
+CHECK_TIMEOUT = 5
+
+# Mindestabstand zwischen zwei Anfragen an GitHub (Sekunden)
+MIN_CHECK_INTERVAL = 6 * 60 * 60
+
+# Name des Installers unter den Assets eines Releases
+INSTALLER_NAME = 'mytodo-setup.exe'
+
+# Name der Programmdatei, die ein Delta-Patch erzeugt
+EXECUTABLE_NAME = 'mytodo.exe'
+
+# Blockgröße beim Herunterladen (Bytes)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Anzahl der Fortsetzungsversuche nach einem Verbindungsabbruch
+DOWNLOAD_RETRIES = 5
 
 class Updater:
-    def __init__(self):
+    def __init__(self, timeout=CHECK_TIMEOUT, cache_path=None,
+                 min_interval=MIN_CHECK_INTERVAL):
         self.current_version = "1.0.0"
         self.github_api = "https://api.github.com/repos/Mytools1988/MY_TODO/releases/latest"
         self.update_url = None
+        self.update_version = None
+        self.update_sha256 = None
+        self.update_sha256_url = None
+        self.update_delta_url = None
+        self.update_exe_sha256 = None
+        self.update_exe_sha256_url = None
+        self.timeout = timeout
+        
+        # Letzte Antwort mit ETag/Last-Modified (z.B. update_cache.json)
+        self.cache_path = cache_path
+        self.min_interval = min_interval
+        self._cache = None
+        
+        # Ergebnisse der Hintergrund-Prüfung: (has_update, version)
+        self.results = queue.Queue()
+        self._checking = False
+        self._lock = threading.Lock()
+        
+        # Fortschritt und Ergebnis des Update-Downloads
+        self.download_events = queue.Queue()
+        self._downloading = False
+
+    def start_check(self):
+        """Startet die Update-Prüfung in einem Hintergrund-Thread
+        
+        Das Ergebnis landet in ``results`` und wird vom Tk-Thread per
+        ``after`` abgeholt. Läuft bereits eine Prüfung, wird keine zweite
+        gestartet.
+        """
+        with self._lock:
+            if self._checking:
+                return False
+            self._checking = True
+        
+        # Ergebnisse früherer (abgebrochener) Prüfungen verwerfen
+        while True:
+            try:
+                self.results.get_nowait()
+            except queue.Empty:
+                break
+        
+        threading.Thread(target=self._check_worker, name='UpdateCheck',
+                         daemon=True).start()
+        return True
 
-    def check_for_updates(self):
-        """Prüft auf neue Versionen"""
+    def _check_worker(self):
+        """Hintergrund-Thread: führt die Prüfung aus und meldet das Ergebnis"""
         try:
-            with urllib.request.urlopen(self.github_api) as response:
-                data = json.loads(response.read().decode())
-                latest_version = data['tag_name'].replace('v', '')
-                
-                if self._compare_versions(latest_version, self.current_version) > 0:
-                    self.update_url = data['assets'][0]['browser_download_url']
-                    return True, latest_version
-            
-            return False, self.current_version
+            result = self.check_for_updates()
+        finally:
+            with self._lock:
+                self._checking = False
+        self.results.put(result)
+
+    def check_for_updates(self, force=False):
+        """Prüft auf neue Versionen (blockiert höchstens etwa ``timeout`` Sekunden)
+        
+        Innerhalb von ``min_interval`` nach der letzten Prüfung wird die
+        gespeicherte Antwort verwendet, ohne GitHub zu fragen. Sonst wird
+        mit ``If-None-Match``/``If-Modified-Since`` angefragt; bei
+        ``304 Not Modified`` bleibt die gespeicherte Antwort gültig.
+        """
+        try:
+            cache = self._load_cache()
+            fresh = time.time() - cache.get('checked_at', 0) < self.min_interval
+            if force or not fresh or 'body' not in cache:
+                cache = self._fetch_release(cache)
+            return self._evaluate_release(json.loads(cache['body']))
             
         except Exception as e:
             print(f"Fehler beim Update-Check: {e}")
             return False, self.current_version
 
-    def download_and_install_update(self):
-        """Lädt das Update herunter und installiert es"""
+    def _fetch_release(self, cache):
+        """Fragt die neueste Version bedingt ab und aktualisiert den Cache"""
+        request = urllib.request.Request(self.github_api)
+        if 'body' in cache:
+            if cache.get('etag'):
+                request.add_header('If-None-Match', cache['etag'])
+            if cache.get('last_modified'):
+                request.add_header('If-Modified-Since', cache['last_modified'])
+        
         try:
-            if not self.update_url:
-                return False
-                
-            # Download
-            installer_path = os.path.join(os.getenv('TEMP'), 'mytodo-setup.exe')
-            urllib.request.urlretrieve(self.update_url, installer_path)
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                cache = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'body': response.read().decode(),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or 'body' not in cache:
+                raise
+            # Nicht geändert: gespeicherte Antwort weiterverwenden
+        
+        cache['checked_at'] = time.time()
+        self._save_cache(cache)
+        return cache
+
+    def _evaluate_release(self, data):
+        """Vergleicht die neueste Version mit der installierten"""
+        latest_version = data['tag_name'].replace('v', '')
+        
+        # Installer wird über seinen Namen gefunden (das Release enthält
+        # auch die Programmdatei mytodo.exe, Prüfsummen und Patches)
+        asset = next((a for a in data.get('assets', [])
+                      if a.get('name') == INSTALLER_NAME), None)
+        if asset is None:
+            print(f"Release {latest_version} enthält keinen Installer ({INSTALLER_NAME})")
+            return False, self.current_version
+        
+        if self._compare_versions(latest_version, self.current_version) > 0:
+            self.update_url = asset['browser_download_url']
+            self.update_version = latest_version
             
-            # Starte Installer
-            if messagebox.askyesno(
-                "Update bereit",
-                "Das Update wurde heruntergeladen. Jetzt installieren?"
-            ):
-                subprocess.Popen([installer_path])
-                sys.exit()
-                
-            return True
+            # Patch von der installierten Version, falls veröffentlicht
+            delta_name = f'mytodo-{self.current_version}.delta'
+            self.update_delta_url = next((a['browser_download_url'] for a in data['assets']
+                                          if a.get('name') == delta_name), None)
+            self.update_sha256, self.update_sha256_url = self._published_sha256(data, asset)
             
+            # Prüfsumme der neuen Programmdatei für das Ergebnis des Patches
+            executable = next((a for a in data['assets'] if a.get('name') == EXECUTABLE_NAME),
+                              {'name': EXECUTABLE_NAME})
+            self.update_exe_sha256, self.update_exe_sha256_url = \
+                self._published_sha256(data, executable)
+            return True, latest_version
+        
+        return False, self.current_version
+
+    def _load_cache(self):
+        """Lädt die gespeicherte Antwort der letzten Prüfung"""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path:
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        self._cache = json.load(f)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"Fehler beim Laden des Update-Caches: {e}")
+        return self._cache
+
+    def _save_cache(self, cache):
+        """Speichert die Antwort der letzten Prüfung"""
+        self._cache = cache
+        if self.cache_path:
+            try:
+                atomic_write(self.cache_path, json.dumps(cache))
+            except Exception as e:
+                print(f"Fehler beim Speichern des Update-Caches: {e}")
+
+    def start_download(self):
+        """Startet den Download des Updates in einem Hintergrund-Thread
+        
+        Fortschritt und Ergebnis landen in ``download_events``:
+        ``('progress', Bytes, Gesamtgröße oder None)``, ``('done', Pfad)``
+        bzw. ``('error', Meldung)``.
+        """
+        with self._lock:
+            if self._downloading or not self.update_url:
+                return False
+            self._downloading = True
+        threading.Thread(target=self._download_worker, name='UpdateDownload',
+                         daemon=True).start()
+        return True
+
+    def _download_worker(self):
+        """Hintergrund-Thread: lädt das Update und meldet das Ergebnis"""
+        progress = lambda done, total: self.download_events.put(('progress', done, total))
+        try:
+            path = None
+            if self.update_delta_url and getattr(sys, 'frozen', False):
+                try:
+                    path = self.download_delta(progress)
+                except Exception as e:
+                    # Fallback: vollständiger Download des Installers
+                    print(f"Delta-Update nicht möglich ({e}), lade vollständiges Update")
+            if path is None:
+                path = self.download_update(progress)
+            self.download_events.put(('done', path))
         except Exception as e:
             print(f"Fehler beim Update-Download: {e}")
-            return False
+            self.download_events.put(('error', str(e)))
+        finally:
+            with self._lock:
+                self._downloading = False
+
+    def download_update(self, progress=None):
+        """Lädt das Update herunter, prüft es und gibt den Dateipfad zurück
+        
+        Geschrieben wird blockweise in eine ``.part``-Datei im temporären
+        Verzeichnis des Systems. Bricht die Verbindung ab, wird per
+        HTTP-``Range`` ab der bereits geschriebenen Größe fortgesetzt - auch
+        bei einem späteren Aufruf. Der Name der ``.part``-Datei enthält
+        Version und erwartete Prüfsumme, damit nie ein Rest eines anderen
+        Releases fortgesetzt wird; solche Reste werden gelöscht. Ist zum
+        Release eine SHA-256-Prüfsumme veröffentlicht, muss sie übereinstimmen.
+        """
+        expected = self.update_sha256 or self._fetch_sha256(self.update_sha256_url)
+        version = self.update_version or 'unbekannt'
+        release = f'{version}-{expected[:16]}' if expected else version
+        directory = tempfile.gettempdir()
+        installer_path = os.path.join(directory, f'mytodo-setup-{version}.exe')
+        part_path = os.path.join(directory, f'mytodo-setup-{release}.exe.part')
+        self._remove_stale_parts('mytodo-setup-', part_path)
+        
+        self._download_resumable(self.update_url, part_path, progress)
+        
+        digest = self._file_sha256(part_path)
+        if expected and digest != expected:
+            os.remove(part_path)  # Beim nächsten Versuch von vorn beginnen
+            raise ValueError("Prüfsumme des Updates stimmt nicht überein")
+        if not expected:
+            print("Warnung: Zum Release ist keine SHA-256-Prüfsumme veröffentlicht")
+        
+        os.replace(part_path, installer_path)
+        return installer_path
+
+    def download_delta(self, progress=None):
+        """Lädt einen Delta-Patch und baut daraus die neue Programmdatei
+        
+        Der Patch (siehe ``app.delta``) wird auf eine Kopie der laufenden
+        Programmdatei angewendet; das Ergebnis wird anhand der Prüfsumme
+        im Patch geprüft und neben der Programmdatei als ``.new`` abgelegt.
+        Die abgelegte Datei muss außerdem mit der zum Release
+        veröffentlichten Prüfsumme von ``mytodo.exe`` übereinstimmen. Passt
+        der Patch nicht oder fehlt diese Prüfsumme, wird ``DeltaError``
+        ausgelöst.
+        """
+        expected = self.update_exe_sha256 or self._fetch_sha256(self.update_exe_sha256_url)
+        if not expected:
+            raise DeltaError(f"Zum Release ist keine Prüfsumme für {EXECUTABLE_NAME} veröffentlicht")
+        
+        prefix = f'mytodo-{self.current_version}-'
+        part_path = os.path.join(tempfile.gettempdir(),
+                                 f'{prefix}{self.update_version}.delta.part')
+        self._remove_stale_parts(prefix, part_path)
+        self._download_resumable(self.update_delta_url, part_path, progress)
+        try:
+            with open(part_path, 'rb') as f:
+                patch = f.read()
+            with open(sys.executable, 'rb') as f:
+                current = f.read()
+            new = apply_patch(current, patch)
+        finally:
+            os.remove(part_path)
+        
+        staged_path = sys.executable + '.new'
+        with open(staged_path, 'wb') as f:
+            f.write(new)
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file_sha256(staged_path) != expected:
+            os.remove(staged_path)
+            raise DeltaError("Prüfsumme der neuen Programmdatei stimmt nicht überein")
+        print(f"Delta-Update: {len(patch)} statt {len(new)} Bytes geladen")
+        return staged_path
+
+    @staticmethod
+    def _remove_stale_parts(prefix, part_path):
+        """Löscht angefangene Downloads anderer Releases mit diesem Präfix"""
+        directory = os.path.dirname(part_path)
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.startswith(prefix) and name.endswith('.part') and path != part_path:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"Fehler beim Löschen von {name}: {e}")
+
+    def _download_resumable(self, url, part_path, progress):
+        """Lädt eine Datei und setzt nach Verbindungsabbrüchen fort"""
+        attempts = 0
+        while True:
+            try:
+                self._download_to(url, part_path, progress)
+                return
+            except (OSError, http.client.HTTPException) as e:
+                attempts += 1
+                if attempts > DOWNLOAD_RETRIES:
+                    raise
+                print(f"Download unterbrochen ({e}), setze fort...")
+                time.sleep(min(attempts, 5))
+
+    def _download_to(self, url, part_path, progress):
+        """Lädt die (restliche) Datei und hängt sie an die ``.part``-Datei an"""
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header('Range', f'bytes={offset}-')
+        
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                return  # Bereits vollständig - die Prüfsumme entscheidet
+            raise
+        
+        with response:
+            if offset and response.status != 206:
+                offset = 0  # Server ignoriert Range: von vorn beginnen
+            total = self._content_total(response, offset)
+            
+            done = offset
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                while True:
+                    chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    if progress:
+                        progress(done, total)
+            
+            if total is not None and done < total:
+                raise ConnectionError(f"Verbindung nach {done} von {total} Bytes beendet")
+
+    @staticmethod
+    def _content_total(response, offset):
+        """Ermittelt die Gesamtgröße der Datei (oder None)"""
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+            return int(content_range.rsplit('/', 1)[1])
+        length = response.headers.get('Content-Length')
+        return offset + int(length) if length and length.isdigit() else None
+
+    @staticmethod
+    def _file_sha256(path):
+        """Berechnet die SHA-256-Prüfsumme einer Datei"""
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE * 16), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def _published_sha256(data, asset):
+        """Gibt (Prüfsumme, URL einer .sha256-Datei) zum Download zurück"""
+        digest = asset.get('digest') or ''
+        if digest.startswith('sha256:'):
+            return digest[len('sha256:'):].lower(), None
+        checksum_name = asset.get('name', '') + '.sha256'
+        for other in data.get('assets', []):
+            if other.get('name') == checksum_name:
+                return None, other.get('browser_download_url')
+        return None, None
+
+    def _fetch_sha256(self, url):
+        """Lädt eine veröffentlichte ``.sha256``-Datei (falls vorhanden)"""
+        if not url:
+            return None
+        with urllib.request.urlopen(url, timeout=self.timeout) as response:
+            # Format von sha256sum bzw. Get-FileHash: Prüfsumme zuerst
+            return response.read().decode().split()[0].lower()
+
+    def install_update(self, path):
+        """Installiert das Update und beendet die App
+        
+        Eine per Delta erzeugte Programmdatei (``.new``) ersetzt die
+        laufende - unter Windows lässt sich diese zwar nicht überschreiben,
+        aber umbenennen. Sonst wird der heruntergeladene Installer gestartet.
+        """
+        if path == sys.executable + '.new':
+            old_path = sys.executable + '.old'
+            if os.path.exists(old_path):
+                os.remove(old_path)
+            os.replace(sys.executable, old_path)
+            os.replace(path, sys.executable)
+            subprocess.Popen([sys.executable])
+        else:
+            subprocess.Popen([path])
+        sys.exit()
 
     def _compare_versions(self, v1, v2):
         """Vergleicht zwei Versionsnummern"""
@@ -0,0 +1,36 @@
+# Benannte Sortierungen für die Anzeige. Die Daten in todos.txt bleiben
+# dabei in ihrer Reihenfolge; gespeichert wird nur die gewählte Sortierung
+# (Einstellung 'sort_order').
+
+# Prioritätsreihenfolge: ▲ (hoch), ► (mittel), ▼ (niedrig)
+PRIORITY_RANK = {'▲': 1, '►': 2, '▼': 3}
+
+DEFAULT_SORT_ORDER = 'priority'
+
+def priority_key(todo):
+    """Nicht erledigte zuerst, dann nach Priorität"""
+    return (todo.completed, PRIORITY_RANK.get(todo.priority, 2))
+
+def deadline_key(todo):
+    """Nicht erledigte zuerst, dann nach Deadline (ohne Deadline ans Ende)"""
+    deadline_ts = todo.deadline_ts
+    return (todo.completed, deadline_ts is None, deadline_ts or 0,
+            PRIORITY_RANK.get(todo.priority, 2))
+
+def text_key(todo):
+    """Nicht erledigte zuerst, dann alphabetisch nach Text"""
+    return (todo.completed, todo.text_key)
+
+# Die Schlüssel greifen nur auf vorberechnete Felder zu: deadline_ts wird
+# beim Setzen der Deadline geparst, text_key beim ersten Sortieren nach
+# einer Textänderung gebildet.
+SORT_ORDERS = {
+    'priority': priority_key,
+    'deadline': deadline_key,
+    'text': text_key,
+}
+
+def sort_todos(todos, order=None):
+    """Gibt die Todos in der gewünschten Anzeigereihenfolge zurück"""
+    key = SORT_ORDERS.get(order) or SORT_ORDERS[DEFAULT_SORT_ORDER]
+    return sorted(todos, key=key)
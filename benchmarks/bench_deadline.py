@@ -0,0 +1,61 @@
+"""Deadlines auf dem Anzeigepfad: strptime gegen vorab geparste Zeitstempel
+
+Misst das Parsen einzelner Deadlines und die Arbeit, die beim Zeichnen
+einer Liste je Zeile für die Deadline anfällt (Anzeigetext und Prüfung
+auf Überfälligkeit).
+
+Aufruf::
+
+    python -m benchmarks.bench_deadline [ANZAHL]
+"""
+import sys
+import time
+import timeit
+from datetime import datetime
+
+from app.deadline import is_overdue, parse_deadline
+from app.todo_item import TodoItem
+
+def strptime_deadline(deadline):
+    """Bisherige Umwandlung über datetime.strptime"""
+    try:
+        return datetime.strptime(deadline, "%d.%m.%Y %H:%M")
+    except ValueError:
+        return datetime.strptime(deadline, "%d.%m.%Y").replace(hour=23, minute=59)
+
+def render_row_strptime(todo):
+    """Bisheriger Anzeigepfad: jede Zeile parst die Deadline neu"""
+    if not todo.deadline:
+        return None, False
+    try:
+        parsed = strptime_deadline(todo.deadline)
+    except ValueError:
+        return todo.deadline, False
+    return parsed.strftime('%d.%m.%Y'), parsed < datetime.now()
+
+def render_row_cached(todo):
+    """Aktueller Anzeigepfad: Anzeigetext und Zeitstempel liegen am Todo"""
+    return todo.deadline_badge, is_overdue(todo.deadline_ts)
+
+def main(argv):
+    count = int(argv[0]) if argv else 10000
+    repeats = 100000
+    for deadline in ('15.06.2025', '15.06.2025 12:30'):
+        old = timeit.timeit(lambda: strptime_deadline(deadline), number=repeats) / repeats * 1e6
+        new = timeit.timeit(lambda: parse_deadline(deadline), number=repeats) / repeats * 1e6
+        print(f"Parsen {deadline!r:>20}: strptime {old:6.2f} µs, eigener Parser {new:5.2f} µs")
+
+    todos = [TodoItem(f"Todo {i}", deadline=f"{i % 28 + 1:02d}.{i % 12 + 1:02d}.2026")
+             for i in range(count)]
+    for name, render in (('strptime', render_row_strptime), ('Zeitstempel', render_row_cached)):
+        # Zweiter Durchgang: erneutes Zeichnen, der Anzeigetext ist dann bereits formatiert
+        for attempt in ('erste', 'erneute'):
+            started = time.perf_counter()
+            for todo in todos:
+                render(todo)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{attempt:>7} Anzeige von {count} Zeilen ({name}): {elapsed:.1f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
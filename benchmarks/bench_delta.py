@@ -0,0 +1,50 @@
+"""Größe und Dauer von Delta-Patches für synthetische Programmdateien
+
+Erzeugt eine zufällige Programmdatei und eine neue Version mit
+eingefügtem, geändertem, entferntem und angehängtem Inhalt und misst
+Patch-Größe, Ersparnis gegenüber dem vollständigen Download sowie die
+Zeit für Erzeugen und Anwenden.
+
+Aufruf::
+
+    python -m benchmarks.bench_delta [MiB ...]
+"""
+import sys
+import time
+import random
+
+from app.delta import DeltaError, apply_patch, make_patch
+
+def make_versions(size, seed=1):
+    rng = random.Random(seed)
+    old = rng.randbytes(size)
+    new = bytearray(old)
+    new[size // 2:size // 2] = rng.randbytes(10000)
+    for _ in range(20):
+        position = rng.randrange(len(new) - 16)
+        new[position:position + 16] = rng.randbytes(16)
+    del new[size * 3 // 4:size * 3 // 4 + 5000]
+    new += rng.randbytes(50000)
+    return old, bytes(new)
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or [1, 8]
+    for mib in sizes:
+        old, new = make_versions(mib * 1024 * 1024)
+        started = time.perf_counter()
+        patch = make_patch(old, new)
+        made = time.perf_counter() - started
+        started = time.perf_counter()
+        assert apply_patch(old, patch) == new
+        applied = time.perf_counter() - started
+        print(f"{mib} MiB: Patch {len(patch)} Bytes ({len(patch) / len(new) * 100:.2f} % der "
+              f"neuen Datei, {len(new) - len(patch)} Bytes gespart), erzeugt in {made:.2f} s, "
+              f"angewendet in {applied * 1000:.0f} ms")
+        try:
+            apply_patch(old[1:] + old[:1], patch)
+        except DeltaError as e:
+            print(f"  Falsche Ausgangsdatei abgelehnt: {e}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
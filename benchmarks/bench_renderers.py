@@ -0,0 +1,37 @@
+"""Widget-, virtuelle und gezeichnete Liste im Vergleich
+
+Misst für jede Darstellung (Einstellung ``list_mode``) die Zeit bis zur
+ersten Anzeige und für eine vollständige Aktualisierung. Der schrittweise
+Aufbau der Widget-Liste wird jeweils bis zum Ende abgewartet.
+
+Aufruf::
+
+    python -m benchmarks.bench_renderers [ANZAHL ...]
+
+Benötigt eine Anzeige oder ein installiertes ``Xvfb``, sonst wird nichts
+gemessen.
+Die Widget-Liste mit 50000 Todos braucht mehrere Minuten.
+"""
+import sys
+
+from benchmarks.gui import display, measure, unavailable
+
+MODES = ('widgets', 'virtual', 'canvas')
+
+def main(argv):
+    reason = unavailable()
+    if reason:
+        print(f"Übersprungen: {reason}")
+        return 0
+    counts = [int(arg) for arg in argv] or [1000, 10000, 50000]
+    print(f"{'Todos':>7} {'Darstellung':>11} {'Erste Anzeige':>14} {'Aktualisierung':>15}")
+    with display():
+        for count in counts:
+            for mode in MODES:
+                run = measure(count, {'list_mode': mode})
+                print(f"{count:>7} {mode:>11} {run['first_paint_ms']:>11.0f} ms "
+                      f"{run['refresh_ms']:>12.0f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
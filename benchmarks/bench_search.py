@@ -0,0 +1,76 @@
+"""Suche beim Tippen: Index gegen lineare Suche und SQLite
+
+Tippt eine Anfrage mit 10 Zeichen Buchstabe für Buchstabe in eine Liste
+mit vielen Todos und misst die Zeit pro Tastendruck.
+
+Aufruf::
+
+    python -m benchmarks.bench_search [ANZAHL]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+from app.sqlite_manager import SQLiteTodoManager
+from app.todo_manager import TodoManager
+
+SYLLABLES = ('ein', 'kauf', 'be', 'richt', 'ar', 'beit', 'milch', 'brot', 'ter',
+             'min', 'zahn', 'arzt', 'rech', 'nung', 'steu', 'er', 'ur', 'laub',
+             'pro', 'jekt', 'gar', 'ten', 'au', 'to', 'rei', 'fen', 'la', 'den')
+CATEGORIES = ('Allgemein', 'Arbeit', 'Privat', 'Einkauf')
+QUERY = 'rechnung s'
+
+def make_todos(count, seed=1):
+    """Erzeugt Todos aus vier zufälligen Wörtern eines Wortschatzes von 2000 Wörtern"""
+    rng = random.Random(seed)
+    words = [''.join(rng.sample(SYLLABLES, rng.randint(2, 4))) for _ in range(2000)]
+    words[0] = 'rechnung'
+    words[1] = 'steuer'
+    return [{'text': ' '.join(rng.sample(words, 4)) + f" {i}",
+             'category': rng.choice(CATEGORIES)} for i in range(count)]
+
+def linear_search(todos, query):
+    query = query.lower()
+    return [todo for todo in todos
+            if query in todo.text.lower() or query in todo.category.lower()]
+
+def type_query(search):
+    """Gibt (Millisekunden pro Tastendruck, langsamster Tastendruck) zurück"""
+    times = []
+    for end in range(1, len(QUERY) + 1):
+        start = time.perf_counter()
+        search(QUERY[:end])
+        times.append((time.perf_counter() - start) * 1000)
+    return sum(times) / len(times), max(times)
+
+def main(argv):
+    count = int(argv[0]) if argv else 50000
+    todos = make_todos(count)
+    directory = tempfile.mkdtemp()
+    text = TodoManager(os.path.join(directory, 'todos.txt'), journaled=False)
+    text.save_todos(todos)
+    sqlite = SQLiteTodoManager(os.path.join(directory, 'todos.db'))
+    sqlite.save_todos(make_todos(count))
+
+    for name, manager in (('TodoManager', text), ('SQLiteTodoManager', sqlite)):
+        start = time.perf_counter()
+        manager.search('x')  # Baut den Index auf
+        print(f"Index ({name}) für {count} Todos aufgebaut in "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+    results = {
+        'linear': type_query(lambda query: linear_search(text.get_all(), query)),
+        'index': type_query(text.search),
+        'sqlite': type_query(sqlite.search),
+    }
+    for name, (mean, worst) in results.items():
+        print(f"{name:>7}: {mean:7.2f} ms pro Tastendruck (max. {worst:.2f} ms)")
+    assert len(text.search(QUERY)) == len(sqlite.search(QUERY)) == len(linear_search(text.get_all(), QUERY))
+    text.close()
+    sqlite.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,38 @@
+"""Zeit bis zur ersten Anzeige mit vielen Todos
+
+Aufruf::
+
+    python -m benchmarks.bench_startup [ANZAHL] [STAND ...]
+
+Ohne ``STAND`` wird der aktuelle Stand gemessen. Für einen Vorher/Nachher-
+Vergleich z.B.::
+
+    git worktree add /tmp/vorher <commit>
+    python -m benchmarks.bench_startup 5000 /tmp/vorher .
+
+Benötigt eine Anzeige oder ein installiertes ``Xvfb``, sonst wird nichts
+gemessen.
+"""
+import sys
+
+from benchmarks.gui import ROOT, display, measure, unavailable
+
+REPEATS = 3
+
+def main(argv):
+    reason = unavailable()
+    if reason:
+        print(f"Übersprungen: {reason}")
+        return 0
+    count = int(argv[0]) if argv else 5000
+    with display():
+        for tree in argv[1:] or [ROOT]:
+            runs = [measure(count, tree=tree) for _ in range(REPEATS)]
+            first_paint = min(run['first_paint_ms'] for run in runs)
+            refresh = min(run['refresh_ms'] for run in runs)
+            print(f"{tree}: {count} Todos, erste Anzeige {first_paint:.0f} ms, "
+                  f"Aktualisierung {refresh:.0f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Speicherbedarf der Todos: Dict (alt) gegen TodoItem
+
+Aufruf::
+
+    python -m benchmarks.bench_todo_item [ANZAHL]
+"""
+import sys
+import time
+import tracemalloc
+
+from app.todo_item import TodoItem
+
+CATEGORIES = ('Allgemein', 'Arbeit', 'Privat', 'Einkauf')
+PRIORITIES = ('►', '▲', '▼')
+
+def make_dict(i):
+    return {'text': f"Todo Nummer {i}", 'category': CATEGORIES[i % 4],
+            'priority': PRIORITIES[i % 3],
+            'deadline': f"{i % 28 + 1:02d}.{i % 12 + 1:02d}.2025" if i % 3 else '',
+            'completed': i % 5 == 0}
+
+def make_item(i):
+    return TodoItem.from_dict(make_dict(i))
+
+def measure(factory, count):
+    """Gibt (Bytes pro Todo, Sekunden) für ``count`` Todos zurück"""
+    source = [str(i) for i in range(count)]  # Nicht mitgemessen
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = [factory(i) for i in range(len(source))]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / count, elapsed
+
+def main(argv):
+    count = int(argv[0]) if argv else 100000
+    for name, factory in (('dict', make_dict), ('TodoItem', make_item)):
+        per_item, elapsed = measure(factory, count)
+        print(f"{name:>8}: {per_item:7.1f} Bytes/Todo, {count} Todos in {elapsed * 1000:.0f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
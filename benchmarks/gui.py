@@ -0,0 +1,108 @@
+"""Hilfsfunktionen für Messungen an der laufenden Oberfläche
+
+Jede Messung startet die App in einem eigenen Prozess in einem leeren
+Verzeichnis mit vorbereiteter ``todos.txt`` und ``settings.txt``. Über
+``tree`` lässt sich ein anderer Stand des Projekts messen (z.B. ein
+``git worktree`` eines älteren Commits), solange er ``app.main.TodoApp``
+enthält.
+
+Außerhalb von Windows wird ``winreg`` im Messprozess durch einen Ersatz
+ohne Autostart-Eintrag ersetzt. Ohne Anzeige wird - falls installiert -
+ein virtueller X-Server (``Xvfb``) gestartet.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import contextlib
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CATEGORIES = ('Allgemein', 'Arbeit', 'Privat', 'Einkauf')
+
+# Läuft im Messprozess: Zeit bis zur vollständig aufgebauten Liste nach dem
+# Start und für eine vollständige Aktualisierung (Millisekunden)
+CHILD = """
+import sys, time, json, types
+try:
+    import winreg
+except ImportError:
+    # Ersatz außerhalb von Windows: es gibt keinen Autostart-Eintrag
+    winreg = sys.modules['winreg'] = types.ModuleType('winreg')
+    winreg.HKEY_CURRENT_USER = winreg.KEY_READ = winreg.KEY_SET_VALUE = winreg.REG_SZ = 0
+    def _missing(*args):
+        raise FileNotFoundError("Kein Registrierungseintrag")
+    winreg.OpenKey = winreg.QueryValueEx = winreg.SetValueEx = winreg.DeleteValue = _missing
+    winreg.CloseKey = lambda key: None
+    import builtins
+    builtins.WindowsError = OSError
+from app.main import TodoApp
+def finish():
+    # Schrittweisen Aufbau der Widget-Liste zu Ende laufen lassen
+    app.root.update()
+    scheduler = getattr(app, 'render_scheduler', None)
+    while scheduler is not None and scheduler.busy:
+        app.root.update()
+started = time.perf_counter()
+app = TodoApp()
+finish()
+first_paint = (time.perf_counter() - started) * 1000
+started = time.perf_counter()
+app.show_all_todos()
+finish()
+refresh = (time.perf_counter() - started) * 1000
+app.root.destroy()
+print(json.dumps({'first_paint_ms': first_paint, 'refresh_ms': refresh}))
+"""
+
+def unavailable():
+    """Gibt den Grund zurück, warum die Oberfläche nicht messbar ist (oder None)"""
+    if sys.platform == 'win32' or os.environ.get('DISPLAY') or shutil.which('Xvfb'):
+        return None
+    return "keine Anzeige (DISPLAY) und kein Xvfb installiert"
+
+@contextlib.contextmanager
+def display():
+    """Stellt eine Anzeige bereit - bei Bedarf über einen virtuellen X-Server"""
+    if sys.platform == 'win32' or os.environ.get('DISPLAY'):
+        yield
+        return
+    number = next(n for n in range(99, 200) if not os.path.exists(f'/tmp/.X11-unix/X{n}'))
+    server = subprocess.Popen(['Xvfb', f':{number}', '-screen', '0', '1280x1024x24',
+                               '-nolisten', 'tcp'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(100):
+            if os.path.exists(f'/tmp/.X11-unix/X{number}'):
+                break
+            time.sleep(0.05)
+        os.environ['DISPLAY'] = f':{number}'
+        yield
+    finally:
+        os.environ.pop('DISPLAY', None)
+        server.terminate()
+        server.wait()
+
+def write_todos(directory, count):
+    """Schreibt ``count`` Todos im Pipe-Format, das alle Stände lesen können"""
+    with open(os.path.join(directory, 'todos.txt'), 'w', encoding='utf-8') as f:
+        for i in range(count):
+            deadline = f"{i % 28 + 1:02d}.{i % 12 + 1:02d}.2026" if i % 3 else ''
+            f.write(f"Todo Nummer {i}|{CATEGORIES[i % 4]}|►|{deadline}|{1 if i % 5 == 0 else 0}\n")
+    with open(os.path.join(directory, 'categories.txt'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(CATEGORIES))
+
+def measure(count, settings=None, tree=ROOT):
+    """Startet die App mit ``count`` Todos und gibt die gemessenen Zeiten zurück"""
+    directory = tempfile.mkdtemp()
+    write_todos(directory, count)
+    with open(os.path.join(directory, 'settings.txt'), 'w', encoding='utf-8') as f:
+        for key, value in (settings or {}).items():
+            f.write(f"{key}={value}\n")
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(tree))
+    result = subprocess.run([sys.executable, '-c', CHILD], cwd=directory, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="mytodo",
     version="1.0.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*", "benchmarks", "benchmarks.*"]),
     install_requires=[
         'requests>=2.31.0',  # Spezifische Version für requests
         'pyinstaller>=6.12.0'  # Für das Erstellen der exe
@@ -0,0 +1,35 @@
+"""Lokaler HTTP-Server für Tests des Updaters"""
+import threading
+import contextlib
+import http.server
+
+@contextlib.contextmanager
+def serve(handle):
+    """Startet einen Server, der jede GET-Anfrage an ``handle(handler)`` übergibt
+
+    Gibt die Basis-URL zurück (``http://127.0.0.1:PORT``).
+    """
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            handle(self)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def send(handler, body, status=200, headers=()):
+    """Sendet eine vollständige Antwort"""
+    handler.send_response(status)
+    handler.send_header('Content-Length', str(len(body)))
+    for name, value in headers:
+        handler.send_header(name, value)
+    handler.end_headers()
+    handler.wfile.write(body)
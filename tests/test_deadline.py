@@ -0,0 +1,54 @@
+import random
+import time
+from datetime import datetime
+
+import pytest
+
+from app.deadline import day_range, format_badge, is_overdue, parse_deadline
+
+def strptime_deadline(deadline):
+    """Bisherige Umwandlung über datetime.strptime (Referenz)"""
+    if not deadline:
+        return None
+    try:
+        try:
+            parsed = datetime.strptime(deadline, "%d.%m.%Y %H:%M")
+        except ValueError:
+            parsed = datetime.strptime(deadline, "%d.%m.%Y").replace(hour=23, minute=59)
+        return int(parsed.timestamp())
+    except (ValueError, OverflowError, OSError):
+        return None
+
+@pytest.mark.parametrize('deadline', [
+    '01.02.2024', '29.02.2024', '29.02.2023', '29.02.2000', '29.02.1900', '31.04.2024',
+    '1.2.2024', '12.12.2024 08:05', '12.12.2024 8:5', '12.12.2024 24:00', '12.12.2024 23:60',
+    'abc', '', '12.12.24', '00.01.2024', '15.06.2025 23:59', '15.06.2025 12', '15.06.2025 :30',
+    '٣.01.2024', '15.13.2025', '15.06.02025', '15..2025',
+])
+def test_parse_matches_strptime(deadline):
+    assert parse_deadline(deadline) == strptime_deadline(deadline)
+
+def test_parse_matches_strptime_random():
+    rng = random.Random(17)
+    for _ in range(5000):
+        deadline = f"{rng.randint(0, 32)}.{rng.randint(0, 13)}.{rng.randint(1990, 2040)}"
+        if rng.random() < 0.5:
+            deadline += f" {rng.randint(0, 25):02d}:{rng.randint(0, 61):02d}"
+        assert parse_deadline(deadline) == strptime_deadline(deadline), deadline
+
+def test_date_only_means_end_of_day():
+    assert time.localtime(parse_deadline('15.06.2025'))[:5] == (2025, 6, 15, 23, 59)
+
+def test_format_badge():
+    assert format_badge('1.2.2024', parse_deadline('1.2.2024')) == '01.02.2024'
+    assert format_badge('1.2.2024 8:05', parse_deadline('1.2.2024 8:05')) == '01.02.2024 08:05'
+    assert format_badge('kaputt', None) == 'kaputt'
+
+def test_is_overdue_and_day_range():
+    deadline_ts = parse_deadline('15.06.2025 12:00')
+    start, end = day_range(deadline_ts)
+    assert start <= deadline_ts < end
+    assert time.localtime(start)[:6] == (2025, 6, 15, 0, 0, 0)
+    assert is_overdue(deadline_ts, now=deadline_ts + 1)
+    assert not is_overdue(deadline_ts, now=deadline_ts)
+    assert not is_overdue(None)
@@ -0,0 +1,131 @@
+import contextlib
+import hashlib
+import random
+import sys
+import tempfile
+
+import pytest
+
+import app.updater
+from app.delta import BLOCK_SIZE, DeltaError, apply_patch, make_patch, patch_info, main
+from app.updater import Updater
+from tests.stub_server import send, serve
+
+def _binaries(size, seed=24):
+    """Erzeugt eine zufällige "Programmdatei" und eine leicht geänderte neue Version"""
+    rng = random.Random(seed)
+    old = rng.randbytes(size)
+    new = bytearray(old)
+    new[size // 2:size // 2] = rng.randbytes(3000)      # Eingefügter Code
+    for _ in range(10):                                  # Kleine Änderungen
+        position = rng.randrange(len(new) - 16)
+        new[position:position + 16] = rng.randbytes(16)
+    del new[size * 3 // 4:size * 3 // 4 + 2000]         # Entfernter Bereich
+    new += rng.randbytes(5000)                           # Angehängte Daten
+    return old, bytes(new)
+
+def test_round_trip_saves_bytes():
+    old, new = _binaries(1024 * 1024)
+    patch = make_patch(old, new)
+    assert apply_patch(old, patch) == new
+    # Geändert wurden ~10 KiB plus je ein Block um jede kleine Änderung
+    assert len(patch) < 20 * BLOCK_SIZE + 10000
+    assert len(patch) < len(new) * 0.1
+
+def test_patch_info():
+    old, new = _binaries(64 * 1024)
+    old_sha256, new_sha256, length = patch_info(make_patch(old, new))
+    assert length == len(new)
+    assert len(old_sha256) == len(new_sha256) == 32
+
+def test_wrong_base_is_rejected():
+    old, new = _binaries(256 * 1024)
+    patch = make_patch(old, new)
+    with pytest.raises(DeltaError):
+        apply_patch(old[:-1] + bytes([old[-1] ^ 1]), patch)
+    with pytest.raises(DeltaError):
+        apply_patch(new, patch)
+
+def test_damaged_patch_is_rejected():
+    old, new = _binaries(256 * 1024)
+    patch = make_patch(old, new)
+    with pytest.raises(DeltaError):
+        apply_patch(old, patch[:len(patch) // 2])
+    with pytest.raises(DeltaError):
+        apply_patch(old, b'kein patch')
+
+@pytest.mark.parametrize('size', [0, 1, BLOCK_SIZE - 1, BLOCK_SIZE, 5000])
+def test_edge_sizes(size):
+    rng = random.Random(size)
+    a = rng.randbytes(size)
+    b = rng.randbytes(size // 2) + a
+    assert apply_patch(a, make_patch(a, b)) == b
+    assert apply_patch(b, make_patch(b, a)) == a
+
+def test_command_line(tmp_path):
+    old, new = _binaries(64 * 1024)
+    (tmp_path / 'alt').write_bytes(old)
+    (tmp_path / 'neu').write_bytes(new)
+    assert main(['diff', str(tmp_path / 'alt'), str(tmp_path / 'neu'), str(tmp_path / 'patch')]) == 0
+    assert main(['apply', str(tmp_path / 'alt'), str(tmp_path / 'patch'), str(tmp_path / 'ergebnis')]) == 0
+    assert (tmp_path / 'ergebnis').read_bytes() == new
+    assert main([]) == 2
+
+@contextlib.contextmanager
+def _delta_update(tmp_path, monkeypatch, installed, patch, installer, published):
+    """Updater mit Server für Patch und Installer; ``installed`` ist die laufende Programmdatei
+
+    ``published`` ist die zum Release veröffentlichte Prüfsumme von
+    mytodo.exe (None: keine veröffentlicht).
+    """
+    executable = tmp_path / 'mytodo.exe'
+    executable.write_bytes(installed)
+    downloads = tmp_path / 'downloads'
+    downloads.mkdir()
+    monkeypatch.setattr(sys, 'executable', str(executable))
+    monkeypatch.setattr(sys, 'frozen', True, raising=False)
+    monkeypatch.setattr(tempfile, 'tempdir', str(downloads))
+    monkeypatch.setattr(app.updater.time, 'sleep', lambda seconds: None)
+
+    files = {'/mytodo-1.0.0.delta': patch, '/setup.exe': installer,
+             '/mytodo.exe.sha256': f"{published}  mytodo.exe\n".encode()}
+    with serve(lambda handler: send(handler, files[handler.path])) as url:
+        assets = [
+            {'name': 'mytodo-setup.exe', 'browser_download_url': url + '/setup.exe'},
+            {'name': 'mytodo-1.0.0.delta', 'browser_download_url': url + '/mytodo-1.0.0.delta'},
+        ]
+        if published:
+            assets.append({'name': 'mytodo.exe.sha256',
+                           'browser_download_url': url + '/mytodo.exe.sha256'})
+        updater = Updater(timeout=2)
+        updater._evaluate_release({'tag_name': 'v2.0.0', 'assets': assets})
+        updater._download_worker()
+        yield list(updater.download_events.queue)[-1]
+
+def test_updater_applies_delta(tmp_path, monkeypatch):
+    old, new = _binaries(256 * 1024)
+    with _delta_update(tmp_path, monkeypatch, old, make_patch(old, new), b'installer',
+                       hashlib.sha256(new).hexdigest()) as event:
+        assert event == ('done', str(tmp_path / 'mytodo.exe.new'))
+    assert (tmp_path / 'mytodo.exe.new').read_bytes() == new
+
+def test_updater_falls_back_to_installer_for_wrong_base(tmp_path, monkeypatch):
+    old, new = _binaries(256 * 1024)
+    other, _ = _binaries(256 * 1024, seed=99)
+    with _delta_update(tmp_path, monkeypatch, other, make_patch(old, new), b'installer',
+                       hashlib.sha256(new).hexdigest()) as event:
+        kind, path = event
+    assert kind == 'done' and path.endswith('mytodo-setup-2.0.0.exe')
+    with open(path, 'rb') as f:
+        assert f.read() == b'installer'
+    assert not (tmp_path / 'mytodo.exe.new').exists()
+
+@pytest.mark.parametrize('published', ['0' * 64, None])
+def test_updater_falls_back_to_installer_without_matching_checksum(tmp_path, monkeypatch, published):
+    # Patch passt, aber das Ergebnis ist nicht die veröffentlichte mytodo.exe
+    old, new = _binaries(256 * 1024)
+    with _delta_update(tmp_path, monkeypatch, old, make_patch(old, new), b'installer',
+                       published) as event:
+        kind, path = event
+    assert kind == 'done' and path.endswith('mytodo-setup-2.0.0.exe')
+    assert not (tmp_path / 'mytodo.exe.new').exists()
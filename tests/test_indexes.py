@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from app.sqlite_manager import SQLiteTodoManager
+from app.todo_manager import TodoManager
+
+CATEGORIES = ('Allgemein', 'Arbeit', 'Privat', 'Einkauf')
+PRIORITIES = ('►', '▲', '▼')
+
+def _random_todo(rng):
+    deadline = ''
+    if rng.random() < 0.6:
+        deadline = f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.2026"
+    return {'text': f"Todo {rng.randint(0, 999)}", 'category': rng.choice(CATEGORIES),
+            'priority': rng.choice(PRIORITIES), 'deadline': deadline,
+            'completed': rng.random() < 0.2}
+
+def _assert_consistent(manager):
+    """Vergleicht alle Indexabfragen mit einem Durchlauf über alle Todos"""
+    todos = manager.get_all()
+    ids = lambda items: sorted(todo.id for todo in items)
+    for category in CATEGORIES:
+        expected = [t for t in todos if t.category == category]
+        assert ids(manager.get_by_category(category)) == ids(expected)
+        assert manager.count_by_category(category) == len(expected)
+    for priority in PRIORITIES:
+        assert ids(manager.get_by_priority(priority)) == ids(t for t in todos if t.priority == priority)
+    for completed in (False, True):
+        expected = [t for t in todos if t.completed == completed]
+        assert ids(manager.get_by_completed(completed)) == ids(expected)
+        assert manager.count_by_completed(completed) == len(expected)
+    open_with_deadline = sorted((t for t in todos if not t.completed and t.deadline_ts is not None),
+                                key=lambda t: (t.deadline_ts, t.id))
+    middle = 1782900000  # Mitte 2026
+    assert ([t.id for t in manager.get_due_before(middle)] ==
+            [t.id for t in open_with_deadline if t.deadline_ts < middle])
+
+@pytest.fixture(params=['text', 'sqlite'])
+def manager(request, tmp_path):
+    if request.param == 'text':
+        manager = TodoManager(str(tmp_path / 'todos.txt'))
+    else:
+        manager = SQLiteTodoManager(str(tmp_path / 'todos.db'))
+    yield manager
+    manager.close()
+
+def test_indexes_follow_all_mutations(manager):
+    rng = random.Random(5)
+    for step in range(1500):
+        ids = [todo.id for todo in manager.get_all()]
+        action = rng.random()
+        if action < 0.35 or not ids:
+            manager.add(_random_todo(rng))
+        elif action < 0.55:
+            manager.update_by_id(rng.choice(ids), _random_todo(rng))
+        elif action < 0.7:
+            # Wie drop_todo: nur die Kategorie ändern
+            manager.update_by_id(rng.choice(ids), {'category': rng.choice(CATEGORIES)})
+        elif action < 0.82:
+            manager.toggle_completed_by_id(rng.choice(ids))
+        elif action < 0.97:
+            manager.delete_by_id(rng.choice(ids))
+        else:
+            manager.cleanup()
+        if step % 50 == 0:
+            _assert_consistent(manager)
+    _assert_consistent(manager)
+
+def test_indexes_after_journal_replay(tmp_path):
+    path = str(tmp_path / 'todos.txt')
+    rng = random.Random(7)
+    manager = TodoManager(path)
+    for _ in range(300):
+        manager.add(_random_todo(rng))
+    for todo in list(manager.get_all())[::3]:
+        manager.update_by_id(todo.id, {'category': 'Privat'})
+    for todo in list(manager.get_all())[::5]:
+        manager.delete_by_id(todo.id)
+    manager.cleanup()
+    manager.close()
+
+    reloaded = TodoManager(path)
+    _assert_consistent(reloaded)
+    assert [t.to_dict() for t in reloaded.get_all()] == [t.to_dict() for t in manager.get_all()]
+    reloaded.close()
@@ -0,0 +1,130 @@
+import heapq
+import random
+import time
+
+from app.reminders import ReminderScheduler
+from app.todo_manager import TodoManager
+
+START = time.mktime((2026, 1, 1, 8, 0, 0, 0, 0, -1))
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+class FakeRoot:
+    """Ersatz für Tk: führt after-Aufrufe erst bei ``run_until`` aus"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.jobs = {}
+        self.after_calls = 0
+        self._next = 0
+
+    def after(self, ms, callback):
+        self.after_calls += 1
+        self._next += 1
+        self.jobs[self._next] = (self.clock.now + ms / 1000, callback)
+        return self._next
+
+    def after_cancel(self, job):
+        self.jobs.pop(job)
+
+    def run_until(self, end):
+        while self.jobs:
+            job, (due, callback) = min(self.jobs.items(), key=lambda item: item[1][0])
+            if due > end:
+                break
+            del self.jobs[job]
+            self.clock.now = max(self.clock.now, due)
+            callback()
+        self.clock.now = end
+
+def _deadline(timestamp):
+    return time.strftime('%d.%m.%Y %H:%M', time.localtime(timestamp))
+
+def _scheduler(tmp_path, count, seed=19):
+    rng = random.Random(seed)
+    manager = TodoManager(str(tmp_path / f'todos{count}.txt'), journaled=False)
+    manager.save_todos([{'text': f"Todo {i}",
+                         'deadline': _deadline(START + rng.randint(60, 30 * 86400))}
+                        for i in range(count)])
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    fired = []
+    scheduler = ReminderScheduler(root, manager, fired.append, lead_minutes=(15, 0),
+                                  clock=clock)
+    scheduler.rebuild()
+    return manager, scheduler, root, clock, fired
+
+def _update_seconds(manager, scheduler, clock, rng, count):
+    """Ändert ``count`` zufällige Todos und gibt die Zeit für update() zurück"""
+    ids = [todo.id for todo in manager.get_all()]
+    elapsed = 0
+    for _ in range(count):
+        todo_id = rng.choice(ids)
+        manager.update_by_id(todo_id, {'deadline': _deadline(clock.now + rng.randint(60, 30 * 86400))})
+        started = time.perf_counter()
+        scheduler.update(todo_id)
+        elapsed += time.perf_counter() - started
+    return elapsed
+
+def test_only_one_pending_after_with_100k_reminders(tmp_path):
+    manager, scheduler, root, clock, fired = _scheduler(tmp_path, 100000)
+    assert len(root.jobs) == 1
+    rng = random.Random(1)
+    ids = [todo.id for todo in manager.get_all()]
+    for _ in range(2000):
+        todo_id = rng.choice(ids)
+        action = rng.random()
+        if action < 0.6:
+            manager.update_by_id(todo_id, {'deadline': _deadline(clock.now + rng.randint(60, 30 * 86400))})
+        elif action < 0.9:
+            manager.toggle_completed_by_id(todo_id)
+        else:
+            manager.delete_by_id(todo_id)
+            ids.remove(todo_id)
+        scheduler.update(todo_id)
+        assert len(root.jobs) == 1
+    # Veraltete Einträge werden regelmäßig entfernt
+    assert scheduler._stale <= len(scheduler._heap) // 2 + 64
+
+    # Zwei Tage laufen lassen: genau die fälligen Todos werden erinnert
+    end = clock.now + 2 * 86400
+    # 15 Minuten Vorlauf: Deadlines bis einschließlich end + 15 Minuten
+    expected = {todo.id for todo in manager.get_due_between(clock.now, end + 15 * 60 + 1)}
+    root.run_until(end)
+    assert {todo.id for todo in fired} == expected
+    assert len(root.jobs) == 1
+
+def test_update_cost_grows_logarithmically(tmp_path):
+    timings = {}
+    for count in (1000, 100000):
+        manager, scheduler, root, clock, _ = _scheduler(tmp_path, count)
+        rng = random.Random(2)
+        # Bestes von mehreren Durchgängen gegen Schwankungen der Messung
+        timings[count] = min(_update_seconds(manager, scheduler, clock, rng, 2000)
+                             for _ in range(3))
+        assert len(root.jobs) == 1
+    # Linear wäre Faktor 100; O(log n) bleibt weit darunter
+    assert timings[100000] < timings[1000] * 10
+
+def test_snooze_and_no_repeat_after_edit(tmp_path):
+    manager, scheduler, root, clock, fired = _scheduler(tmp_path, 10)
+    todo = manager.get_all()[0]
+    manager.update_by_id(todo.id, {'deadline': _deadline(clock.now + 600)})
+    scheduler.update(todo.id)
+    reminders = lambda: [item for item in fired if item.id == todo.id]
+
+    root.run_until(clock.now + 1)
+    assert len(reminders()) == 1  # Vorlauf von 15 Minuten schon verstrichen
+    scheduler.update(todo.id)
+    root.run_until(clock.now + 1)
+    assert len(reminders()) == 1  # Unveränderte Deadline: keine Wiederholung
+    scheduler.snooze(todo.id, 5)
+    root.run_until(clock.now + 301)
+    assert len(reminders()) == 2
+    root.run_until(clock.now + 300)
+    assert len(reminders()) == 3  # Deadline selbst
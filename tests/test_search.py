@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from app.sqlite_manager import SQLiteTodoManager
+from app.todo_item import TodoItem
+from app.todo_manager import TodoManager
+from app.view import sort_todos
+
+TODOS = [
+    {'text': 'Einkauf erledigen', 'category': 'Privat'},
+    {'text': 'Kaufvertrag prüfen', 'category': 'Arbeit'},
+    {'text': 'Milch kaufen', 'category': 'Einkauf'},
+    {'text': 'Bericht schreiben', 'category': 'Arbeit'},
+    {'text': 'ÄRZTE anrufen', 'category': 'Allgemein'},
+]
+
+QUERIES = ['kauf', 'KAUF', 'k', 'ka', 'einkauf erl', 'ch ka', 'arb', 'ärzte',
+           'bericht schreiben', 'xyz', 'f e', ' ', 'n']
+
+@pytest.fixture
+def managers(tmp_path):
+    text = TodoManager(str(tmp_path / 'todos.txt'))
+    sqlite = SQLiteTodoManager(str(tmp_path / 'todos.db'))
+    for todo in TODOS:
+        text.add(dict(todo))
+        sqlite.add(dict(todo))
+    yield text, sqlite
+    text.close()
+    sqlite.close()
+
+def _texts(todos):
+    return sorted(todo.text for todo in todos)
+
+def _linear(todos, query):
+    query = query.lower()
+    return _texts(t for t in todos if query in t.text.lower() or query in t.category.lower())
+
+def test_search_finds_substrings(managers):
+    text, _ = managers
+    assert _texts(text.search('kauf')) == ['Einkauf erledigen', 'Kaufvertrag prüfen',
+                                           'Milch kaufen']
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_backends_agree(managers, query):
+    text, sqlite = managers
+    expected = _linear(text.get_all(), query)
+    assert _texts(text.search(query)) == expected
+    assert _texts(sqlite.search(query)) == expected
+
+def test_typing_and_mutations_keep_index_exact(tmp_path):
+    rng = random.Random(6)
+    words = ['einkauf', 'kauf', 'bericht', 'arbeit', 'milch', 'brot', 'termin', 'zahnarzt']
+    manager = TodoManager(str(tmp_path / 'todos.txt'))
+    for _ in range(200):
+        manager.add({'text': ' '.join(rng.sample(words, 3)), 'category': rng.choice(words)})
+    for _ in range(30):
+        query = ' '.join(rng.sample(words, 2))[rng.randint(0, 3):]
+        # Buchstabe für Buchstabe tippen (verengt das vorherige Ergebnis)
+        for end in range(1, len(query) + 1):
+            assert _texts(manager.search(query[:end])) == _linear(manager.get_all(), query[:end])
+        todo = rng.choice(manager.get_all())
+        manager.update_by_id(todo.id, {'text': ' '.join(rng.sample(words, 2))})
+        manager.delete_by_id(rng.choice(manager.get_all()).id)
+    manager.close()
+
+@pytest.mark.parametrize('backend', ['text', 'sqlite'])
+@pytest.mark.parametrize('order', ['priority', 'deadline', 'text'])
+def test_results_keep_list_order(tmp_path, backend, order):
+    """Gefilterte und ungefilterte Anzeige ordnen gleiche Schlüssel gleich an"""
+    if backend == 'text':
+        manager = TodoManager(str(tmp_path / 'todos.txt'))
+    else:
+        manager = SQLiteTodoManager(str(tmp_path / 'todos.db'))
+    rng = random.Random(order)
+    # Listenreihenfolge weicht von der ID-Reihenfolge ab
+    todos = [TodoItem(f"Einkauf {rng.choice('abc')}", priority=rng.choice('►▲'),
+                      deadline=rng.choice(['', '01.02.2026']), id=100 - i)
+             for i in range(60)]
+    manager.save_todos(todos)
+    manager.add({'text': 'Einkauf a'})
+    manager.delete_by_id(manager.get_all()[5].id)
+
+    expected = [todo for todo in sort_todos(manager.get_all(), order) if 'kauf' in todo.text.lower()]
+    assert sort_todos(manager.search('kauf'), order) == expected
+    manager.close()
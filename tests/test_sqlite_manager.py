@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from app.sqlite_manager import SQLiteTodoManager, migrate_to_sqlite
+from app.todo_manager import TodoManager
+
+def _write_text_todos(path, texts):
+    manager = TodoManager(path, journaled=False)
+    manager.save_todos([{'text': text} for text in texts])
+    manager.close()
+
+def test_migration_runs_only_once(tmp_path):
+    text_path = str(tmp_path / 'todos.txt')
+    db_path = str(tmp_path / 'todos.db')
+    _write_text_todos(text_path, ['a', 'b'])
+
+    manager = SQLiteTodoManager(db_path)
+    assert migrate_to_sqlite(text_path, manager=manager) == 2
+    assert [t.text for t in manager.get_all()] == ['a', 'b']
+    for todo in list(manager.get_all()):
+        manager.delete_by_id(todo.id)
+    manager.close()
+
+    # Neustart: gelöschte Todos dürfen nicht aus todos.txt zurückkommen
+    manager = SQLiteTodoManager(db_path)
+    assert migrate_to_sqlite(text_path, manager=manager) == 0
+    assert manager.get_all() == []
+    manager.close()
+
+def test_migration_marks_filled_database(tmp_path):
+    text_path = str(tmp_path / 'todos.txt')
+    db_path = str(tmp_path / 'todos.db')
+    manager = SQLiteTodoManager(db_path)
+    manager.add({'text': 'vorhanden'})
+    _write_text_todos(text_path, ['a'])
+    assert migrate_to_sqlite(text_path, manager=manager) == 0
+    assert manager.is_migrated()
+    manager.close()
+
+def test_migration_without_manager_closes_its_own(tmp_path):
+    text_path = str(tmp_path / 'todos.txt')
+    db_path = str(tmp_path / 'todos.db')
+    _write_text_todos(text_path, ['a'])
+    assert migrate_to_sqlite(text_path, db_path) == 1
+    assert migrate_to_sqlite(text_path, db_path) == 0
+
+def test_failed_write_leaves_cached_todo_unchanged(tmp_path):
+    manager = SQLiteTodoManager(str(tmp_path / 'todos.db'))
+    todo_id = manager.add({'text': 'alt', 'category': 'Arbeit'})
+    manager.search('alt')  # Suchindex aufbauen
+    with manager.conn:
+        for action in ('UPDATE', 'DELETE'):
+            manager.conn.execute(f"CREATE TRIGGER fail_{action} BEFORE {action} ON todos "
+                                 "BEGIN SELECT RAISE(ABORT, 'Datenträger voll'); END")
+
+    with pytest.raises(sqlite3.DatabaseError):
+        manager.update_by_id(todo_id, {'text': 'neu'})
+    with pytest.raises(sqlite3.DatabaseError):
+        manager.toggle_completed_by_id(todo_id)
+    with pytest.raises(sqlite3.DatabaseError):
+        manager.delete_by_id(todo_id)
+
+    todo = manager.get(todo_id)
+    assert (todo.text, todo.completed) == ('alt', False)
+    assert manager.get_all() == [todo]
+    assert manager.search('alt') == [todo] and manager.search('neu') == []
+    manager.close()
@@ -0,0 +1,31 @@
+import tracemalloc
+
+from app.todo_item import TodoItem
+
+def _allocated(factory, count):
+    """Gibt den Speicherbedarf von ``count`` erzeugten Objekten in Bytes zurück"""
+    tracemalloc.start()
+    try:
+        items = [factory(i) for i in range(count)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(items) == count
+    return size
+
+def _as_dict(i):
+    return {'text': f"Todo {i}", 'category': 'Arbeit', 'priority': '►',
+            'deadline': '15.06.2025', 'completed': False}
+
+def _as_item(i):
+    return TodoItem(f"Todo {i}", 'Arbeit', '►', '15.06.2025', False)
+
+def test_todo_item_needs_less_memory_than_dict():
+    assert _allocated(_as_item, 10000) < _allocated(_as_dict, 10000)
+
+def test_todo_item_behaves_like_dict():
+    todo = TodoItem.from_dict(_as_dict(1))
+    assert todo['text'] == 'Todo 1'
+    assert todo.get('priority', '!') == '►'
+    assert todo.to_dict() == dict(_as_dict(1), id=None)
+    assert todo.deadline_ts is not None
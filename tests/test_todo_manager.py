@@ -0,0 +1,19 @@
+from app.todo_manager import TodoManager
+
+def test_journal_survives_torn_last_line(tmp_path):
+    """Nach einem Absturz mitten im Schreiben geht der nächste Eintrag nicht verloren"""
+    path = str(tmp_path / 'todos.txt')
+    manager = TodoManager(path)
+    manager.add({'text': 'a'})
+    manager.close()
+    with open(path + '.journal', 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "op": "add", "todo": {"te')  # Abgeschnittener Eintrag
+
+    manager = TodoManager(path)
+    assert [t.text for t in manager.get_all()] == ['a']
+    manager.add({'text': 'after crash'})
+    manager.close()
+
+    manager = TodoManager(path)
+    assert [t.text for t in manager.get_all()] == ['a', 'after crash']
+    manager.close()
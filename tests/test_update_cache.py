@@ -0,0 +1,74 @@
+import json
+import time
+
+from app.updater import Updater
+from tests.stub_server import send, serve
+from tests.test_update_check import RELEASE, _wait_for_result
+
+LAST_MODIFIED = 'Thu, 01 Oct 2026 10:00:00 GMT'
+
+def _write_cache(path, checked_at):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'etag': '"v2"', 'last_modified': LAST_MODIFIED,
+                   'body': RELEASE.decode(), 'checked_at': checked_at}, f)
+
+def _counting_server(requests):
+    """Merkt sich die Kopfzeilen jeder Anfrage und antwortet wie GitHub"""
+    def release(handler):
+        requests.append({'If-None-Match': handler.headers.get('If-None-Match'),
+                         'If-Modified-Since': handler.headers.get('If-Modified-Since')})
+        if handler.headers.get('If-None-Match') == '"v2"':
+            handler.send_response(304)
+            handler.end_headers()
+            return
+        send(handler, RELEASE, headers=[('ETag', '"v2"'), ('Last-Modified', LAST_MODIFIED)])
+    return serve(release)
+
+def _updater(url, cache_path):
+    updater = Updater(timeout=2, cache_path=cache_path, min_interval=3600)
+    updater.github_api = url + '/releases/latest'
+    return updater
+
+def test_fresh_cache_sends_no_request(tmp_path):
+    cache_path = str(tmp_path / 'update_cache.json')
+    _write_cache(cache_path, time.time() - 60)
+    requests = []
+
+    with _counting_server(requests) as url:
+        updater = _updater(url, cache_path)
+        # Prüfung nach dem Start und danach über das Menü
+        for _ in range(2):
+            assert updater.start_check()
+            assert _wait_for_result(updater)[0] == (True, '2.0.0')
+    assert requests == []
+
+def test_expired_interval_sends_one_conditional_request(tmp_path):
+    cache_path = str(tmp_path / 'update_cache.json')
+    _write_cache(cache_path, time.time() - 2 * 3600)
+    requests = []
+
+    with _counting_server(requests) as url:
+        updater = _updater(url, cache_path)
+        assert updater.start_check()
+        # 304: Ergebnis kommt aus dem gespeicherten Release
+        assert _wait_for_result(updater)[0] == (True, '2.0.0')
+        assert requests == [{'If-None-Match': '"v2"', 'If-Modified-Since': LAST_MODIFIED}]
+
+        # Zeitpunkt der Prüfung wurde gespeichert: Menü fragt nicht erneut
+        with open(cache_path, encoding='utf-8') as f:
+            assert time.time() - json.load(f)['checked_at'] < 60
+        assert updater.start_check()
+        assert _wait_for_result(updater)[0] == (True, '2.0.0')
+    assert len(requests) == 1
+
+def test_missing_cache_sends_unconditional_request(tmp_path):
+    cache_path = str(tmp_path / 'update_cache.json')
+    requests = []
+
+    with _counting_server(requests) as url:
+        updater = _updater(url, cache_path)
+        assert updater.start_check()
+        assert _wait_for_result(updater)[0] == (True, '2.0.0')
+    assert requests == [{'If-None-Match': None, 'If-Modified-Since': None}]
+    with open(cache_path, encoding='utf-8') as f:
+        assert json.load(f)['last_modified'] == LAST_MODIFIED
@@ -0,0 +1,77 @@
+import json
+import queue
+import time
+
+from app.updater import Updater
+from tests.stub_server import send, serve
+
+RELEASE = json.dumps({
+    'tag_name': 'v2.0.0',
+    'assets': [{'name': 'mytodo-setup.exe',
+                'browser_download_url': 'http://127.0.0.1/mytodo-setup.exe'}],
+}).encode()
+
+def _wait_for_result(updater, timeout=10, tick=0.01):
+    """Simuliert die Tk-Schleife: fragt alle ``tick`` Sekunden nach dem Ergebnis
+
+    Gibt (Ergebnis, längster Schleifendurchlauf in Sekunden) zurück.
+    """
+    deadline = time.perf_counter() + timeout
+    longest = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            result = updater.results.get_nowait()
+        except queue.Empty:
+            result = None
+        time.sleep(tick)
+        longest = max(longest, time.perf_counter() - started)
+        if result is not None:
+            return result, longest
+    raise AssertionError("Kein Ergebnis der Update-Prüfung")
+
+def test_slow_server_does_not_block_ui():
+    def sleepy(handler):
+        time.sleep(3)
+        send(handler, RELEASE)
+
+    with serve(sleepy) as url:
+        updater = Updater(timeout=0.5)
+        updater.github_api = url + '/releases/latest'
+
+        started = time.perf_counter()
+        assert updater.start_check()
+        assert time.perf_counter() - started < 0.1
+        assert not updater.start_check()  # Läuft bereits
+
+        started = time.perf_counter()
+        result, longest = _wait_for_result(updater)
+        # Zeitüberschreitung wird als "kein Update" gemeldet, nach etwa timeout
+        assert result == (False, '1.0.0')
+        assert time.perf_counter() - started < 2.5
+        assert longest < 0.1
+
+def test_background_check_reports_new_version(tmp_path):
+    requests = []
+
+    def release(handler):
+        requests.append(handler.headers.get('If-None-Match'))
+        if handler.headers.get('If-None-Match') == '"v2"':
+            handler.send_response(304)
+            handler.end_headers()
+            return
+        send(handler, RELEASE, headers=[('ETag', '"v2"')])
+
+    with serve(release) as url:
+        cache_path = str(tmp_path / 'update_cache.json')
+        updater = Updater(timeout=2, cache_path=cache_path, min_interval=0)
+        updater.github_api = url + '/releases/latest'
+        updater.start_check()
+        assert _wait_for_result(updater)[0] == (True, '2.0.0')
+
+        # Zweite Prüfung fragt bedingt an und erhält 304
+        updater = Updater(timeout=2, cache_path=cache_path, min_interval=0)
+        updater.github_api = url + '/releases/latest'
+        updater.start_check()
+        assert _wait_for_result(updater)[0] == (True, '2.0.0')
+    assert requests == [None, '"v2"']
@@ -0,0 +1,106 @@
+import hashlib
+import os
+import random
+import tempfile
+
+import pytest
+
+import app.updater
+from app.updater import Updater
+from tests.stub_server import send, serve
+
+PAYLOAD = random.Random(23).randbytes(3 * 1024 * 1024 + 123)
+DROP_AFTER = 1024 * 1024
+
+@pytest.fixture
+def temp_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    monkeypatch.setattr(app.updater.time, 'sleep', lambda seconds: None)
+    return tmp_path
+
+@pytest.fixture
+def server():
+    """Liefert PAYLOAD mit Range-Unterstützung; die ersten Antworten brechen ab"""
+    state = {'drops': 2, 'ranges': []}
+
+    def handle(handler):
+        if handler.path == '/setup.exe.sha256':
+            send(handler, f"{hashlib.sha256(PAYLOAD).hexdigest()}  mytodo-setup.exe\n".encode())
+            return
+        start = 0
+        range_header = handler.headers.get('Range')
+        if range_header:
+            start = int(range_header.split('=')[1].split('-')[0])
+            state['ranges'].append(start)
+        body = PAYLOAD[start:]
+        handler.send_response(206 if range_header else 200)
+        if range_header:
+            handler.send_header('Content-Range', f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        if state['drops']:
+            # Verbindung mitten in der Übertragung trennen
+            state['drops'] -= 1
+            handler.wfile.write(body[:DROP_AFTER])
+            handler.wfile.flush()
+            handler.close_connection = True
+            return
+        handler.wfile.write(body)
+
+    with serve(handle) as url:
+        state['url'] = url
+        yield state
+
+def _updater(url, version='2.0.0'):
+    updater = Updater(timeout=2)
+    has_update, latest = updater._evaluate_release({
+        'tag_name': f'v{version}',
+        'assets': [{'name': 'mytodo-setup.exe.sha256', 'browser_download_url': url + '/setup.exe.sha256'},
+                   {'name': 'mytodo-setup.exe', 'browser_download_url': url + '/setup.exe'}],
+    })
+    assert (has_update, latest) == (True, version)
+    return updater
+
+def test_download_resumes_after_dropped_connections(temp_dir, server):
+    events = []
+    path = _updater(server['url']).download_update(lambda done, total: events.append((done, total)))
+    with open(path, 'rb') as f:
+        assert f.read() == PAYLOAD
+    assert server['ranges'] == [DROP_AFTER, 2 * DROP_AFTER]
+    assert events[-1] == (len(PAYLOAD), len(PAYLOAD))
+    assert not [name for name in os.listdir(temp_dir) if name.endswith('.part')]
+
+def test_checksum_mismatch_discards_download(temp_dir, server):
+    updater = _updater(server['url'])
+    updater.update_sha256 = '0' * 64
+    with pytest.raises(ValueError):
+        updater.download_update()
+    assert not [name for name in os.listdir(temp_dir) if name.endswith('.part')]
+
+def test_partial_download_of_other_release_is_not_resumed(temp_dir, server):
+    server['drops'] = 0
+    stale = temp_dir / 'mytodo-setup-1.5.0-0123456789abcdef.exe.part'
+    stale.write_bytes(b'x' * DROP_AFTER)
+
+    path = _updater(server['url']).download_update()
+    with open(path, 'rb') as f:
+        assert f.read() == PAYLOAD
+    assert server['ranges'] == []  # Von vorn begonnen statt fortgesetzt
+    assert not stale.exists()
+
+def test_installer_is_selected_by_name():
+    updater = Updater(timeout=2)
+    assert updater._evaluate_release({'tag_name': 'v2.0.0', 'assets': [
+        {'name': 'mytodo.exe', 'browser_download_url': 'http://127.0.0.1/mytodo.exe'},
+        {'name': 'mytodo-setup.exe', 'browser_download_url': 'http://127.0.0.1/mytodo-setup.exe'},
+        {'name': 'mytodo-setup.exe.sha256', 'browser_download_url': 'http://127.0.0.1/mytodo-setup.exe.sha256'},
+    ]}) == (True, '2.0.0')
+    assert updater.update_url == 'http://127.0.0.1/mytodo-setup.exe'
+    assert updater.update_sha256_url == 'http://127.0.0.1/mytodo-setup.exe.sha256'
+
+def test_release_without_installer_is_no_update():
+    updater = Updater(timeout=2)
+    assert updater._evaluate_release({'tag_name': 'v2.0.0', 'assets': [
+        {'name': 'mytodo.exe', 'browser_download_url': 'http://127.0.0.1/mytodo.exe'},
+    ]}) == (False, '1.0.0')
+    assert updater.update_url is None